@@ -0,0 +1,104 @@
+import math
+import statistics
+import time
+
+import numpy as np
+
+import analytics
+
+SIZES = (10000, 1000000)
+INITIAL_BALANCE = 10000.0
+RISK = 2
+
+
+def build_trades(size):
+    generator = np.random.default_rng(42)
+    profit = np.round(generator.normal(1.0, 20.0, size), 2)
+
+    return analytics.Trades(
+        profit=profit,
+        value=np.round(generator.uniform(50.0, 300.0, size), 2),
+        result=np.sign(profit).astype(np.int8),
+        created_at=(np.arange(size) * 60).astype("datetime64[s]"),
+        result_balance=np.full(size, np.nan),
+    )
+
+
+def python_metrics(profits, values, results, created_at, initial_balance, risk):
+    balance = peak = initial_balance
+    peak_at = created_at[0] if created_at else 0
+    max_drawdown = max_drawdown_percent = max_duration = 0.0
+    streak = longest_win = longest_loss = 0
+    previous = None
+    returns = []
+    exceeded = 0
+
+    for profit, value, result, moment in zip(profits, values, results, created_at):
+        returns.append(profit / balance)
+        exceeded += value > balance * risk / 100
+        balance += profit
+
+        if balance >= peak:
+            peak, peak_at = balance, moment
+        else:
+            max_drawdown = max(max_drawdown, peak - balance)
+            max_drawdown_percent = max(max_drawdown_percent, (peak - balance) / peak)
+            max_duration = max(max_duration, moment - peak_at)
+
+        streak = streak + 1 if result == previous else 1
+        previous = result
+
+        if result == 1:
+            longest_win = max(longest_win, streak)
+        elif result == -1:
+            longest_loss = max(longest_loss, streak)
+
+    mean = statistics.mean(returns)
+    downside = math.sqrt(sum(min(value, 0.0) ** 2 for value in returns) / len(returns))
+
+    return {
+        "max_drawdown": max_drawdown,
+        "max_drawdown_percent": max_drawdown_percent,
+        "max_drawdown_duration": max_duration,
+        "longest_win_streak": longest_win,
+        "longest_loss_streak": longest_loss,
+        "sharpe_ratio": mean / statistics.stdev(returns),
+        "sortino_ratio": mean / downside,
+        "risk_exceeded": exceeded / len(profits),
+    }
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+
+    return time.perf_counter() - start, result
+
+
+def main():
+    print(f"{'trades':>8} {'numpy':>10} {'python':>10} {'speedup':>8}")
+
+    for size in SIZES:
+        trades = build_trades(size)
+        numpy_time, vectorized = measure(analytics.metrics, trades, INITIAL_BALANCE, RISK)
+        python_time, expected = measure(
+            python_metrics,
+            trades.profit.tolist(),
+            trades.value.tolist(),
+            trades.result.tolist(),
+            trades.created_at.astype(np.int64).tolist(),
+            INITIAL_BALANCE,
+            RISK,
+        )
+
+        for name, value in expected.items():
+            assert math.isclose(vectorized[name], value, rel_tol=1e-6), name
+
+        print(
+            f"{size:>8} {numpy_time * 1000:>8.1f}ms {python_time * 1000:>8.1f}ms "
+            f"{python_time / numpy_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import time
+from uuid import uuid4
+
+import rsa
+from jose import jwk, jwt
+
+import cache
+import jwks
+import settings
+from handlers import authorize
+
+REQUESTS = 2000
+KID = "benchmark-key"
+
+
+def build_token_and_jwks():
+    public_key, private_key = rsa.newkeys(2048)
+    private_pem = private_key.save_pkcs1().decode()
+    public_jwk = jwk.construct(public_key.save_pkcs1().decode(), "RS256").to_dict()
+    public_jwk.update({"kid": KID, "use": "sig"})
+
+    claims = {
+        "iss": f"https://{settings.JWKS_DOMAIN}/",
+        "aud": settings.API_AUDIENCE,
+        "sub": f"auth0|{uuid4()}",
+        "exp": int(time.time()) + 3600,
+    }
+    token = jwt.encode(claims, private_pem, algorithm="RS256", headers={"kid": KID})
+
+    return token, {"keys": [public_jwk]}
+
+
+def run(event, cache_size):
+    authorize.decisions = cache.LRUCache(maxsize=cache_size)
+    authorize.handle(event, {})
+
+    start = time.perf_counter()
+
+    for _ in range(REQUESTS):
+        authorize.handle(event, {})
+
+    return REQUESTS / (time.perf_counter() - start)
+
+
+def main():
+    token, document = build_token_and_jwks()
+    authorize.key_store = jwks.KeyStore(lambda: document)
+    event = {
+        "headers": {"Authorization": f"Bearer {token}"},
+        "methodArn": "arn:aws:execute-api:us-east-1:123456789012:abcdef1234/v1/GET/brokers",
+    }
+
+    without_cache = run(event, 0)
+    with_cache = run(event, settings.AUTH_DECISION_CACHE_SIZE)
+
+    print(f"decision cache off: {without_cache:>12.0f} decisions/sec")
+    print(f"decision cache on:  {with_cache:>12.0f} decisions/sec")
+    print(f"speedup:            {with_cache / without_cache:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import json
+import time
+from uuid import uuid4
+
+from pony.orm import db_session
+from serpens import testgres
+
+import bulk
+from entities import db, User, Broker, Account, Strategy, Trade
+from schemas import TradeSchema
+
+SIZES = (1000, 10000, 100000)
+ORM_MAX_SIZE = 10000
+
+testgres.setup(db)
+
+
+@db_session
+def create_fixtures():
+    user = User(uid=str(uuid4()), encrypted_password="benchmark")
+    broker = Broker(name="Benchmark", user=user)
+    account = Account(
+        type_account="R", currency="USD", initial_balance=0.0, broker=broker, user=user
+    )
+    strategy = Strategy(name="Benchmark", user=user)
+    db.flush()
+
+    return user.id, account.id, strategy.id, str(strategy.uid)
+
+
+def build_body(size, strategy_uid):
+    return "\n".join(
+        json.dumps(
+            {
+                "strategy_uid": strategy_uid,
+                "value": 10.0,
+                "profit": 8.7 if number % 2 else -10.0,
+                "result": bool(number % 2),
+            }
+        )
+        for number in range(size)
+    )
+
+
+@db_session
+def insert_with_copy(body, account_id, user_id):
+    batch = bulk.parse_trades(bulk.read_rows(body, "application/x-ndjson"))
+    return len(bulk.copy_trades(batch, account_id, user_id))
+
+
+@db_session
+def insert_with_orm(body, account_id, user_id, strategy_id):
+    for line, row in bulk.read_rows(body, "application/x-ndjson"):
+        data = TradeSchema.load(bulk.normalize_row(row))
+        Trade(
+            value=data.value,
+            profit=data.profit,
+            result=data.result,
+            type_trade=data.type_trade,
+            account=account_id,
+            user=user_id,
+            strategy=strategy_id,
+        )
+
+
+@db_session
+def delete_trades():
+    Trade.select().delete(bulk=True)
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    delete_trades()
+
+    return elapsed
+
+
+def main():
+    user_id, account_id, strategy_id, strategy_uid = create_fixtures()
+
+    print(f"{'trades':>8} {'copy rows/sec':>15} {'orm rows/sec':>15}")
+
+    for size in SIZES:
+        body = build_body(size, strategy_uid)
+        copy_rate = size / measure(insert_with_copy, body, account_id, user_id)
+
+        if size <= ORM_MAX_SIZE:
+            orm_rate = size / measure(insert_with_orm, body, account_id, user_id, strategy_id)
+            orm_column = f"{orm_rate:>15.0f}"
+        else:
+            orm_column = f"{'-':>15}"
+
+        print(f"{size:>8} {copy_rate:>15.0f} {orm_column}")
+
+
+if __name__ == "__main__":
+    main()
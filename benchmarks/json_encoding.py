@@ -0,0 +1,79 @@
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import encoding
+import pagination
+import reads
+
+SIZE = 5000
+CALLS = 20
+
+
+def build_payload(size):
+    # The body list_accounts returns for a page: reads rows already carry uids as text
+    created_at = datetime(2024, 1, 1)
+    accounts = [
+        reads.AccountRow(
+            index,
+            created_at + timedelta(minutes=index),
+            str(uuid4()),
+            "R" if index % 2 else "D",
+            "BRL",
+            10000.0,
+            10000.0 + index * 1.37,
+            index % 10,
+            str(uuid4()),
+            f"Broker {index % 10}",
+        )
+        for index in range(1, size + 2)
+    ]
+    accounts, next_cursor = pagination.trim(accounts, pagination.Page(size))
+
+    return {
+        "accounts": [
+            {**account.to_dict(), "broker": {"name": account.broker_name}} for account in accounts
+        ],
+        "next": next_cursor,
+    }
+
+
+def baseline(body):
+    # What serpens did with handler bodies before the encoder
+    return json.dumps(body, default=str)
+
+
+def measure(function, payload):
+    start = time.process_time()
+
+    for _ in range(CALLS):
+        size = len(function(payload).encode())
+
+    cpu_time = (time.process_time() - start) / CALLS * 1000
+
+    tracemalloc.start()
+    function(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return cpu_time, peak / 1024 / 1024, size / 1024
+
+
+def main():
+    payload = build_payload(SIZE)
+    backends = [("serpens", baseline), ("stdlib", encoding.dumps_stdlib)]
+
+    if encoding.orjson:
+        backends.append(("orjson", encoding.dumps_orjson))
+
+    print(f"{'rows':>6} {'encoder':>8} {'cpu':>12} {'peak memory':>12} {'size':>10}")
+
+    for name, function in backends:
+        cpu_time, peak, size = measure(function, payload)
+        print(f"{SIZE:>6} {name:>8} {cpu_time:>9.1f} ms {peak:>9.1f} MB {size:>7.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import time
+from uuid import uuid4
+
+from pony.orm import db_session, select
+from serpens import testgres
+
+import portfolio
+from entities import db, User, Broker, Account, Strategy, Trade
+
+SIZES = (5, 50, 500)
+BROKERS = 5
+TRADES_PER_ACCOUNT = 100
+CALLS = 20
+
+testgres.setup(db)
+
+
+@db_session
+def create_fixtures(accounts):
+    user = User(uid=str(uuid4()), encrypted_password="benchmark")
+    strategy = Strategy(name="Benchmark", user=user)
+    brokers = [Broker(name=f"Broker {number}", user=user) for number in range(BROKERS)]
+    db.flush()
+
+    for number in range(accounts):
+        Account(
+            type_account="RD"[number % 2],
+            currency=("USD", "BRL", "EUR")[number % 3],
+            initial_balance=1000.0,
+            broker=brokers[number % BROKERS],
+            user=user,
+        )
+
+    db.flush()
+    insert_trades(user.id, strategy.id)
+
+    return user.id
+
+
+def insert_trades(user_id, strategy_id):
+    db.execute(
+        """
+        INSERT INTO trades (
+            uid, value, profit, result, type_trade,
+            account_id, user_id, strategy_id, created_at, updated_at
+        )
+        SELECT
+            md5(accounts.id || '-' || number)::uuid, 10.0, 1.0, true, 'T',
+            accounts.id, $user_id, $strategy_id, now(), now()
+        FROM accounts, generate_series(1, $TRADES_PER_ACCOUNT) number
+        WHERE accounts.user_id = $user_id
+        """
+    )
+    db.execute("ANALYZE trades")
+
+
+@db_session
+def grouped_summary(user_id):
+    return portfolio.summary(user_id)
+
+
+@db_session
+def per_account_summary(user_id):
+    # What a client assembling the dashboard account by account costs the database
+    summary = []
+
+    for broker in Broker.select(user=user_id):
+        for account in Account.select(broker=broker):
+            profits = select(trade.profit for trade in Trade if trade.account == account)
+            summary.append((account.current_balance, profits.count(), profits.sum()))
+
+    return summary
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+
+    for _ in range(CALLS):
+        function(*args)
+
+    return (time.perf_counter() - start) / CALLS * 1000
+
+
+@db_session
+def delete_fixtures():
+    Trade.select().delete(bulk=True)
+    Strategy.select().delete()
+    Account.select().delete()
+    Broker.select().delete()
+    User.select().delete()
+
+
+def main():
+    print(f"{'accounts':>8} {'grouped':>12} {'per account':>12}")
+
+    try:
+        for size in SIZES:
+            user_id = create_fixtures(size)
+            grouped_time = measure(grouped_summary, user_id)
+            per_account_time = measure(per_account_summary, user_id)
+
+            print(f"{size:>8} {grouped_time:>9.1f} ms {per_account_time:>9.1f} ms")
+    finally:
+        delete_fixtures()
+
+
+if __name__ == "__main__":
+    main()
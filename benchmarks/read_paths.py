@@ -0,0 +1,111 @@
+import time
+import tracemalloc
+from uuid import uuid4
+
+from pony.orm import db_session
+from serpens import testgres
+
+import reads
+from entities import db, User, Broker, Account
+
+SIZES = (1000, 10000)
+BROKERS = 10
+CALLS = 5
+
+testgres.setup(db)
+
+
+@db_session
+def create_fixtures(accounts):
+    user = User(uid=str(uuid4()), encrypted_password="benchmark")
+    db.flush()
+    db.execute(
+        """
+        INSERT INTO brokers (uid, name, user_id, created_at, updated_at)
+        SELECT md5('broker-' || number)::uuid, 'Broker ' || number, $(user.id), now(), now()
+        FROM generate_series(1, $BROKERS) number
+        """
+    )
+    db.execute(
+        """
+        INSERT INTO accounts (
+            uid, type_account, currency, initial_balance, broker_id, user_id,
+            created_at, updated_at
+        )
+        SELECT
+            md5(brokers.id || '-' || number)::uuid, 'R', 'USD', 1000.0, brokers.id,
+            brokers.user_id, now(), now()
+        FROM brokers, generate_series(1, $accounts / $BROKERS) number
+        WHERE brokers.user_id = $(user.id)
+        """
+    )
+    db.execute("ANALYZE accounts")
+
+    return user.id
+
+
+@db_session
+def entity_path(user_id):
+    # What list_accounts did before the read layer: one entity and broker lookup per account
+    return [
+        {
+            "uid": account.uid,
+            "type_account": account.type_account,
+            "currency": account.currency,
+            "initial_balance": account.initial_balance,
+            "current_balance": account.current_balance,
+            "broker": {"name": account.broker.name},
+        }
+        for account in Account.select(user=user_id)[:]
+    ]
+
+
+@db_session(strict=True)
+def fast_path(user_id):
+    return [
+        {**account.to_dict(), "broker": {"name": account.broker_name}}
+        for account in reads.list_accounts(user_id)
+    ]
+
+
+def measure(function, *args):
+    start = time.process_time()
+
+    for _ in range(CALLS):
+        function(*args)
+
+    cpu_time = (time.process_time() - start) / CALLS * 1000
+
+    tracemalloc.start()
+    function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return cpu_time, peak / 1024 / 1024
+
+
+@db_session
+def delete_fixtures():
+    Account.select().delete(bulk=True)
+    Broker.select().delete(bulk=True)
+    User.select().delete()
+
+
+def main():
+    print(f"{'rows':>6} {'path':>7} {'cpu':>12} {'peak memory':>12}")
+
+    try:
+        for size in SIZES:
+            user_id = create_fixtures(size)
+
+            for name, function in (("entity", entity_path), ("fast", fast_path)):
+                cpu_time, peak = measure(function, user_id)
+                print(f"{size:>6} {name:>7} {cpu_time:>9.1f} ms {peak:>9.1f} MB")
+
+            delete_fixtures()
+    finally:
+        delete_fixtures()
+
+
+if __name__ == "__main__":
+    main()
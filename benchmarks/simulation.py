@@ -0,0 +1,39 @@
+import os
+import time
+
+import numpy as np
+
+import simulation
+
+PATHS = 50000
+TRADES = 500
+BALANCE = 10000.0
+RISK = 2
+SEED = 42
+
+
+def main():
+    outcomes = np.random.default_rng(SEED).normal(0.05, 1.0, 1000)
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    baseline = expected = None
+
+    print(f"{PATHS} paths x {TRADES} trades")
+    print(f"{'processes':>10} {'time':>10} {'speedup':>8}")
+
+    for processes in counts:
+        start = time.perf_counter()
+        result = simulation.simulate(
+            outcomes, BALANCE, RISK, PATHS, TRADES, SEED, processes=processes
+        )
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        expected = expected or result
+
+        assert result == expected, "results must not depend on the number of processes"
+
+        print(f"{processes:>10} {elapsed * 1000:>8.1f}ms {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from pony.orm import db_session
+from serpens import testgres
+
+import stats
+from entities import db, User, Broker, Account, Strategy, Trade
+
+TRADES = 1000000
+CALLS = 20
+
+testgres.setup(db)
+
+
+@db_session
+def create_fixtures():
+    user = User(uid=str(uuid4()), encrypted_password="benchmark")
+    broker = Broker(name="Benchmark", user=user)
+    account = Account(
+        type_account="R", currency="USD", initial_balance=0.0, broker=broker, user=user
+    )
+    strategy = Strategy(name="Benchmark", user=user)
+    db.flush()
+    insert_trades(account.id, user.id, strategy.id)
+
+    return account.id, strategy.id
+
+
+def insert_trades(account_id, user_id, strategy_id):
+    db.execute(
+        """
+        INSERT INTO trades (
+            uid, value, profit, result, type_trade,
+            account_id, user_id, strategy_id, created_at, updated_at
+        )
+        SELECT
+            md5(number::text)::uuid, 10.0, profit, profit > 0, 'T',
+            $account_id, $user_id, $strategy_id,
+            timestamp '2020-01-01' + number * interval '1 minute', now()
+        -- Referencing number makes the lateral subquery draw a new profit for every row
+        FROM generate_series(1, $TRADES) number,
+            LATERAL (SELECT round((random() * 20 - 9)::numeric, 2) + number * 0) draw (profit)
+        """
+    )
+    db.execute("ANALYZE trades")
+
+
+@db_session
+def orm_stats(strategy_id):
+    profits = [
+        trade.profit for trade in Trade.select(lambda trade: trade.strategy.id == strategy_id)
+    ]
+    return len(profits), sum(profits)
+
+
+@db_session
+def sql_stats(strategy_id, **filters):
+    return stats.strategy_stats(strategy_id, **filters)
+
+
+def measure(function, *args, calls=CALLS, **kwargs):
+    start = time.perf_counter()
+
+    for _ in range(calls):
+        function(*args, **kwargs)
+
+    return (time.perf_counter() - start) / calls * 1000
+
+
+@db_session
+def delete_fixtures():
+    Trade.select().delete(bulk=True)
+
+
+def main():
+    account_id, strategy_id = create_fixtures()
+    month = {"start": datetime(2020, 3, 1), "end": datetime(2020, 4, 1)}
+
+    try:
+        all_time = measure(sql_stats, strategy_id)
+        month_time = measure(sql_stats, strategy_id, account_id=account_id, **month)
+        orm_time = measure(orm_stats, strategy_id, calls=1)
+
+        print(f"strategy stats over {TRADES} trades")
+        print(f"single aggregate:            {all_time:>10.1f} ms/call")
+        print(f"single aggregate, one month: {month_time:>10.1f} ms/call")
+        print(f"orm entities:                {orm_time:>10.1f} ms/call")
+    finally:
+        delete_fixtures()
+
+
+if __name__ == "__main__":
+    main()
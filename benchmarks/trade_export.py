@@ -0,0 +1,107 @@
+import resource
+import tempfile
+import time
+import tracemalloc
+from uuid import uuid4
+
+from pony.orm import db_session
+from serpens import testgres
+
+import exports
+import settings
+from entities import db, User, Broker, Account, Strategy, Trade
+
+# Sizes run smallest first, max RSS only grows if a larger export needs more memory
+SIZES = (10000, 100000, 1000000)
+
+testgres.setup(db)
+
+
+@db_session
+def create_fixtures(size):
+    user = User(uid=str(uuid4()), encrypted_password="benchmark")
+    broker = Broker(name="Benchmark", user=user)
+    account = Account(
+        type_account="R", currency="USD", initial_balance=0.0, broker=broker, user=user
+    )
+    strategy = Strategy(name="Benchmark", user=user)
+    db.flush()
+
+    user_id, account_id, strategy_id = user.id, account.id, strategy.id
+    db.execute(
+        """
+        INSERT INTO trades (
+            uid, value, profit, result, type_trade, account_id, user_id, strategy_id,
+            created_at, updated_at
+        )
+        SELECT
+            md5(number::text)::uuid, 10, CASE WHEN number % 2 = 0 THEN 8.7 ELSE -10 END,
+            number % 2 = 0, 'T', $account_id, $user_id, $strategy_id,
+            timestamp '2022-01-01' + number * interval '1 minute', now()
+        FROM generate_series(1, $size) AS number
+        """,
+        globals={},
+        locals=locals(),
+    )
+
+    return user_id
+
+
+@db_session(strict=True)
+def export(user_id, export_format, max_bytes=None):
+    with tempfile.SpooledTemporaryFile(max_size=settings.EXPORT_MAX_INLINE_BYTES) as file:
+        rows = exports.write(user_id, export_format, file, max_bytes)
+        return rows, file.tell()
+
+
+def measure(user_id, export_format):
+    # The API request only reads up to the inline limit before scheduling the full export
+    start = time.perf_counter()
+    export(user_id, export_format, settings.EXPORT_MAX_INLINE_BYTES)
+    request = (time.perf_counter() - start) * 1000
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows, size = export(user_id, export_format)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    return request, rows / elapsed, size / 1024 / 1024, peak / 1024 / 1024, max_rss
+
+
+@db_session
+def delete_fixtures():
+    Trade.select().delete(bulk=True)
+    Strategy.select().delete(bulk=True)
+    Account.select().delete(bulk=True)
+    Broker.select().delete(bulk=True)
+    User.select().delete()
+
+
+def main():
+    print(
+        f"{'rows':>8} {'format':>7} {'request':>10} {'rows/s':>10} {'file':>10} "
+        f"{'peak heap':>10} {'max rss':>10}"
+    )
+
+    try:
+        for size in SIZES:
+            user_id = create_fixtures(size)
+
+            for export_format in exports.FORMATS:
+                request, rate, file_size, peak, max_rss = measure(user_id, export_format)
+                print(
+                    f"{size:>8} {export_format:>7} {request:>7.0f} ms {rate:>10.0f} "
+                    f"{file_size:>7.1f} MB {peak:>7.1f} MB {max_rss:>7.1f} MB"
+                )
+
+            delete_fixtures()
+    finally:
+        delete_fixtures()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+-- transactional: false
+
+DROP INDEX CONCURRENTLY IF EXISTS index_trades_on_user_id_and_uid;
+
+DROP INDEX CONCURRENTLY IF EXISTS index_strategies_on_user_id_and_uid;
+
+DROP INDEX CONCURRENTLY IF EXISTS index_accounts_on_user_id_and_uid;
+
+DROP INDEX CONCURRENTLY IF EXISTS index_brokers_on_user_id_and_uid;
+
+DROP INDEX CONCURRENTLY IF EXISTS index_trades_on_uid;
+
+DROP INDEX CONCURRENTLY IF EXISTS index_strategies_on_uid;
+
+DROP INDEX CONCURRENTLY IF EXISTS index_accounts_on_uid;
+
+DROP INDEX CONCURRENTLY IF EXISTS index_brokers_on_uid;
+
+DROP INDEX CONCURRENTLY IF EXISTS index_users_on_uid;
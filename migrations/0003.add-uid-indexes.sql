@@ -0,0 +1,19 @@
+-- transactional: false
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS index_users_on_uid ON users USING btree (uid);
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS index_brokers_on_uid ON brokers USING btree (uid);
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS index_accounts_on_uid ON accounts USING btree (uid);
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS index_strategies_on_uid ON strategies USING btree (uid);
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS index_trades_on_uid ON trades USING btree (uid);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_brokers_on_user_id_and_uid ON brokers USING btree (user_id, uid);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_accounts_on_user_id_and_uid ON accounts USING btree (user_id, uid);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_strategies_on_user_id_and_uid ON strategies USING btree (user_id, uid);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_trades_on_user_id_and_uid ON trades USING btree (user_id, uid);
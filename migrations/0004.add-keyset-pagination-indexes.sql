@@ -0,0 +1,7 @@
+-- transactional: false
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_brokers_on_user_id_and_created_at_and_id ON brokers USING btree (user_id, created_at, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_accounts_on_user_id_and_created_at_and_id ON accounts USING btree (user_id, created_at, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_strategies_on_user_id_and_created_at_and_id ON strategies USING btree (user_id, created_at, id);
@@ -0,0 +1,3 @@
+-- transactional: false
+
+DROP INDEX CONCURRENTLY IF EXISTS index_trades_on_account_id_and_created_at_and_id;
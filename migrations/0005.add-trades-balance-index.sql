@@ -0,0 +1,3 @@
+-- transactional: false
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_trades_on_account_id_and_created_at_and_id ON trades USING btree (account_id, created_at, id);
@@ -0,0 +1,3 @@
+-- transactional: false
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_trades_on_strategy_id_and_created_at ON trades USING btree (strategy_id, created_at) INCLUDE (account_id, profit, result);
@@ -0,0 +1 @@
+DROP TABLE IF EXISTS daily_trade_stats;
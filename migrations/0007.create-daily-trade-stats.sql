@@ -0,0 +1,34 @@
+CREATE TABLE IF NOT EXISTS daily_trade_stats (
+                                          user_id integer NOT NULL,
+                                          account_id integer NOT NULL,
+                                          strategy_id bigint NOT NULL,
+                                          day date NOT NULL,
+                                          trades integer NOT NULL DEFAULT 0,
+                                          wins integer NOT NULL DEFAULT 0,
+                                          losses integer NOT NULL DEFAULT 0,
+                                          profit numeric(14,2) NOT NULL DEFAULT 0.0,
+                                          gross_profit numeric(14,2) NOT NULL DEFAULT 0.0,
+                                          gross_loss numeric(14,2) NOT NULL DEFAULT 0.0,
+                                          PRIMARY KEY (user_id, account_id, strategy_id, day)
+);
+
+CREATE INDEX IF NOT EXISTS index_daily_trade_stats_on_user_id_and_day ON daily_trade_stats USING btree (user_id, day);
+
+INSERT INTO daily_trade_stats (
+    user_id, account_id, strategy_id, day, trades, wins, losses, profit, gross_profit, gross_loss
+)
+SELECT
+    user_id,
+    account_id,
+    strategy_id,
+    created_at::date,
+    count(*),
+    count(*) FILTER (WHERE result),
+    count(*) FILTER (WHERE NOT result),
+    coalesce(sum(profit), 0),
+    coalesce(sum(profit) FILTER (WHERE profit > 0), 0),
+    coalesce(-sum(profit) FILTER (WHERE profit < 0), 0)
+FROM trades
+WHERE user_id IS NOT NULL AND account_id IS NOT NULL AND strategy_id IS NOT NULL
+GROUP BY user_id, account_id, strategy_id, created_at::date
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,17 @@
+CREATE TABLE IF NOT EXISTS fx_rates (
+                                 currency character varying(3) PRIMARY KEY,
+                                 rate numeric(18,8) NOT NULL,
+                                 updated_at timestamp without time zone NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
+);
+
+-- Value of one unit of each currency in USD, replaced by the rates feed once it runs
+INSERT INTO fx_rates (currency, rate) VALUES
+    ('USD', 1.0),
+    ('EUR', 1.08),
+    ('GBP', 1.27),
+    ('BRL', 0.20),
+    ('JPY', 0.0067),
+    ('CHF', 1.11),
+    ('CAD', 0.73),
+    ('AUD', 0.66)
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,7 @@
+-- transactional: false
+
+DROP INDEX CONCURRENTLY IF EXISTS index_strategies_on_user_id_and_updated_at;
+
+DROP INDEX CONCURRENTLY IF EXISTS index_accounts_on_user_id_and_updated_at;
+
+DROP INDEX CONCURRENTLY IF EXISTS index_brokers_on_user_id_and_updated_at;
@@ -0,0 +1,7 @@
+-- transactional: false
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_brokers_on_user_id_and_updated_at ON brokers USING btree (user_id, updated_at);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_accounts_on_user_id_and_updated_at ON accounts USING btree (user_id, updated_at) INCLUDE (uid);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS index_strategies_on_user_id_and_updated_at ON strategies USING btree (user_id, updated_at);
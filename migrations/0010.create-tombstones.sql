@@ -0,0 +1,9 @@
+CREATE TABLE IF NOT EXISTS tombstones (
+                                 id bigserial PRIMARY KEY,
+                                 user_id integer NOT NULL,
+                                 entity character varying(16) NOT NULL,
+                                 uid uuid NOT NULL,
+                                 deleted_at timestamp without time zone NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
+);
+
+CREATE INDEX IF NOT EXISTS index_tombstones_on_user_id_and_deleted_at ON tombstones USING btree (user_id, deleted_at);
@@ -0,0 +1,62 @@
+import socketserver
+import threading
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            line = self.rfile.readline()
+
+            if not line:
+                return
+
+            arguments = []
+
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                arguments.append(self.rfile.read(length + 2)[:-2])
+
+            self.wfile.write(self.server.run(arguments[0].upper().decode(), *arguments[1:]))
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeRedisHandler)
+        self.data = {}
+        self.commands = []
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.server_address[1]}"
+
+    def run(self, command, *arguments):
+        self.commands.append((command, *arguments))
+
+        if command == "GET":
+            value = self.data.get(arguments[0])
+            return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+
+        if command == "SET":
+            if b"NX" in arguments[2:] and arguments[0] in self.data:
+                return b"$-1\r\n"
+
+            self.data[arguments[0]] = arguments[1]
+            return b"+OK\r\n"
+
+        if command == "INCR":
+            value = int(self.data.get(arguments[0], 0)) + 1
+            self.data[arguments[0]] = str(value).encode()
+            return b":%d\r\n" % value
+
+        return b"-ERR unknown command\r\n"
+
+
+def start_fake_redis(test_case) -> FakeRedisServer:
+    server = FakeRedisServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    test_case.addCleanup(server.server_close)
+    test_case.addCleanup(server.shutdown)
+
+    return server
@@ -0,0 +1,91 @@
+import os
+import re
+
+from pony.orm import db_session
+
+from entities import db, user_ids, User
+
+MIGRATIONS_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "migrations")
+
+
+class QueryCounter:
+    def __init__(self, database=db):
+        self.database = database
+        self.stats = {}
+
+    def __enter__(self):
+        self.database.merge_local_stats()
+        return self
+
+    def __exit__(self, *args):
+        self.stats = {
+            sql: stat.db_count
+            for sql, stat in self.database.local_stats.items()
+            if sql is not None and stat.db_count
+        }
+
+    @property
+    def total(self) -> int:
+        return sum(self.stats.values())
+
+    def selects(self, table: str) -> int:
+        pattern = re.compile(rf'^\s*SELECT\b.*\bFROM\s+"?{table}"?(\s|$)', re.I | re.S)
+        return sum(count for sql, count in self.stats.items() if pattern.search(sql))
+
+
+def count_queries(database=db) -> QueryCounter:
+    return QueryCounter(database)
+
+
+def assert_single_user_lookup(test_case, handler, event):
+    user_ids.clear()
+
+    with count_queries() as counter:
+        response = handler(event, {})
+
+    test_case.assertEqual(counter.selects("users"), 1, counter.stats)
+
+    return response
+
+
+def assert_no_user_load(test_case, handler, event):
+    # With the uuid cached, handlers must not go back to users for anything else
+    User.get_id_by_uid(event["requestContext"]["authorizer"]["user_uuid"])
+
+    with count_queries() as counter:
+        response = handler(event, {})
+
+    test_case.assertEqual(counter.selects("users"), 0, counter.stats)
+
+    return response
+
+
+def assert_single_statement(test_case, handler, event):
+    # Resolves the user up front so only the handler's own statements are counted
+    User.get_id_by_uid(event["requestContext"]["authorizer"]["user_uuid"])
+
+    with count_queries() as counter:
+        response = handler(event, {})
+
+    test_case.assertEqual(counter.total, 1, counter.stats)
+
+    return response
+
+
+@db_session
+def run_migration(filename: str, database=db):
+    with open(os.path.join(MIGRATIONS_PATH, filename)) as migration:
+        # Tests run inside a transaction, where CONCURRENTLY is not allowed
+        sql = migration.read().replace(" CONCURRENTLY", "")
+
+    database.execute(sql)
+
+
+@db_session
+def explain(sql: str, database=db, **params) -> str:
+    database.execute("SET enable_seqscan = off")
+
+    try:
+        return "\n".join(database.select(f"EXPLAIN {sql}", globals={}, locals=params))
+    finally:
+        database.execute("RESET enable_seqscan")
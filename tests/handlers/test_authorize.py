@@ -1,3 +1,4 @@
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -57,6 +58,10 @@ class TestAuthorize(unittest.TestCase):
             "xni3pWLljp95rSnz5MuFSToLhvJffq3-Kp22b66ty2mGrSXQ-hP20Bjrw5nhZe6fQ0zJzg"
         )
 
+    def setUp(self):
+        authorize.key_store.clear()
+        authorize.decisions.clear()
+
     def test_get_oauth_token_none(self):
         authorization_token = None
 
@@ -202,3 +207,93 @@ class TestAuthorize(unittest.TestCase):
         response = authorize.handle(event, {})
 
         self.assertDictEqual(response, expected)
+
+    @patch("handlers.authorize.jwt.decode")
+    @patch("handlers.authorize.urlopen")
+    def test_authorized_jwks_fetched_once(self, m_urlopen, m_jwt):
+        m_urlopen.return_value = MagicMock()
+        m_urlopen.return_value.read.return_value = RESPONSE_DATA
+        m_jwt.return_value = {"sub": "auth0|7cc7359a-e585-4c3b-b567-67f32be06514"}
+
+        event = {
+            "headers": {"Authorization": f"Bearer {self.token}"},
+            "methodArn": "arn:aws:execute-api:us-east-1:4343248168333:siu8zlsx0h/v1/GET/",
+        }
+
+        authorize.handle(event, {})
+        authorize.handle(event, {})
+
+        self.assertEqual(m_urlopen.call_count, 1)
+        self.assertEqual(authorize.key_store.hits, 1)
+        self.assertEqual(authorize.key_store.misses, 1)
+
+    @patch("handlers.authorize.jwt.decode")
+    @patch("handlers.authorize.urlopen")
+    def test_authorized_decision_cached_until_expiry(self, m_urlopen, m_jwt):
+        m_urlopen.return_value = MagicMock()
+        m_urlopen.return_value.read.return_value = RESPONSE_DATA
+        m_jwt.return_value = {
+            "sub": "auth0|7cc7359a-e585-4c3b-b567-67f32be06514",
+            "exp": time.time() + 3600,
+        }
+
+        event = {
+            "headers": {"Authorization": f"Bearer {self.token}"},
+            "methodArn": "arn:aws:execute-api:us-east-1:4343248168333:siu8zlsx0h/v1/GET/",
+        }
+        other_method_event = {
+            "headers": {"Authorization": f"Bearer {self.token}"},
+            "methodArn": "arn:aws:execute-api:us-east-1:4343248168333:siu8zlsx0h/v1/POST/brokers",
+        }
+
+        first = authorize.handle(event, {})
+        second = authorize.handle(other_method_event, {})
+
+        self.assertIs(first, second)
+        self.assertEqual(m_jwt.call_count, 1)
+        self.assertEqual(authorize.decisions.hits, 1)
+
+    @patch("handlers.authorize.jwt.decode")
+    @patch("handlers.authorize.urlopen")
+    def test_authorized_decision_not_shared_between_stages(self, m_urlopen, m_jwt):
+        m_urlopen.return_value = MagicMock()
+        m_urlopen.return_value.read.return_value = RESPONSE_DATA
+        m_jwt.return_value = {
+            "sub": "auth0|7cc7359a-e585-4c3b-b567-67f32be06514",
+            "exp": time.time() + 3600,
+        }
+
+        v1_event = {
+            "headers": {"Authorization": f"Bearer {self.token}"},
+            "methodArn": "arn:aws:execute-api:us-east-1:4343248168333:siu8zlsx0h/v1/GET/",
+        }
+        v2_event = {
+            "headers": {"Authorization": f"Bearer {self.token}"},
+            "methodArn": "arn:aws:execute-api:us-east-1:4343248168333:siu8zlsx0h/v2/GET/",
+        }
+
+        v1_policy = authorize.handle(v1_event, {})
+        v2_policy = authorize.handle(v2_event, {})
+
+        self.assertNotEqual(v1_policy, v2_policy)
+        self.assertEqual(m_jwt.call_count, 2)
+
+    @patch("handlers.authorize.jwt.decode")
+    @patch("handlers.authorize.urlopen")
+    def test_authorized_expired_decision_is_not_reused(self, m_urlopen, m_jwt):
+        m_urlopen.return_value = MagicMock()
+        m_urlopen.return_value.read.return_value = RESPONSE_DATA
+        m_jwt.return_value = {
+            "sub": "auth0|7cc7359a-e585-4c3b-b567-67f32be06514",
+            "exp": time.time() - 1,
+        }
+
+        event = {
+            "headers": {"Authorization": f"Bearer {self.token}"},
+            "methodArn": "arn:aws:execute-api:us-east-1:4343248168333:siu8zlsx0h/v1/GET/",
+        }
+
+        authorize.handle(event, {})
+        authorize.handle(event, {})
+
+        self.assertEqual(m_jwt.call_count, 2)
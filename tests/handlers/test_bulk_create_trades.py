@@ -0,0 +1,158 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from pony.orm import db_session
+
+from entities import User, Broker, Account, Strategy, Trade, DailyTradeStats
+from handlers import bulk_create_trades
+
+USER_UUID = "5a3b1f9e-7d0c-4c8e-9b6a-1f2e3d4c5b6a"
+ACCOUNT_UUID = "b8f1e0a2-3c4d-4e5f-8a9b-0c1d2e3f4a5b"
+STRATEGY_UUID = "c7d8e9f0-1a2b-4c3d-9e4f-5a6b7c8d9e0f"
+FOREIGN_STRATEGY_UUID = "d1e2f3a4-b5c6-4d7e-8f90-a1b2c3d4e5f6"
+
+
+class TestBulkCreateTrades(unittest.TestCase):
+    @classmethod
+    @db_session
+    def setUpClass(cls):
+        user = User(uid=USER_UUID, encrypted_password="123456")
+        other_user = User(uid="e2f3a4b5-c6d7-4e8f-9a0b-c1d2e3f4a5b6", encrypted_password="123456")
+        broker = Broker(uid="f3a4b5c6-d7e8-4f9a-8b1c-d2e3f4a5b6c7", name="Broker", user=user)
+
+        Account(
+            uid=ACCOUNT_UUID,
+            type_account="R",
+            currency="USD",
+            initial_balance=100.0,
+            broker=broker,
+            user=user,
+        )
+        Strategy(uid=STRATEGY_UUID, name="Strategy", user=user)
+        Strategy(uid=FOREIGN_STRATEGY_UUID, name="Foreign strategy", user=other_user)
+
+    @classmethod
+    @db_session
+    def tearDownClass(cls):
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    @db_session
+    def tearDown(self):
+        DailyTradeStats.select().delete(bulk=True)
+        Trade.select().delete()
+
+    def build_event(self, body, content_type="application/x-ndjson", account_uuid=ACCOUNT_UUID):
+        return {
+            "headers": {"Authorization": "Bearer foobar", "Content-Type": content_type},
+            "requestContext": {"authorizer": {"sub": "auth0", "user_uuid": USER_UUID}},
+            "pathParameters": {"uuid": account_uuid},
+            "body": body,
+        }
+
+    def test_handle_ndjson(self):
+        body = "\n".join(
+            json.dumps(row)
+            for row in (
+                {"strategy_uid": STRATEGY_UUID, "value": 10, "profit": 8.7, "result": True},
+                {"strategy_uid": STRATEGY_UUID, "value": 10, "profit": -10, "result": False},
+            )
+        )
+
+        response = bulk_create_trades.handle(self.build_event(body), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 201)
+        self.assertEqual(body, {"inserted": 2, "rejected": 0, "errors": []})
+
+        with db_session:
+            trades = Trade.select().order_by(Trade.id)[:]
+
+            self.assertEqual([trade.profit for trade in trades], [8.7, -10.0])
+            self.assertEqual([trade.result_balance for trade in trades], [108.7, 98.7])
+            self.assertEqual(Account.get(uid=ACCOUNT_UUID).current_balance, 98.7)
+
+            rollup = DailyTradeStats.select().first()
+
+            self.assertEqual((rollup.trades, rollup.wins, rollup.losses), (2, 1, 1))
+            self.assertAlmostEqual(rollup.profit, -1.3)
+            self.assertEqual({trade.account.uid for trade in trades}, {ACCOUNT_UUID})
+            self.assertEqual({trade.strategy.uid for trade in trades}, {STRATEGY_UUID})
+            self.assertEqual({trade.user.uid for trade in trades}, {USER_UUID})
+
+    def test_handle_csv(self):
+        body = (
+            "strategy_uid,value,profit,result,created_at\n"
+            f"{STRATEGY_UUID},10.0,8.7,true,2022-03-01T12:00:00\n"
+            f"{STRATEGY_UUID},10.0,-10.0,false,2022-03-01T12:05:00\n"
+        )
+
+        response = bulk_create_trades.handle(self.build_event(body, "text/csv"), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 201)
+        self.assertEqual(body["inserted"], 2)
+
+        with db_session:
+            self.assertEqual(Trade.select(lambda trade: trade.result).count(), 1)
+
+    def test_handle_reports_row_errors(self):
+        body = (
+            f'{{"strategy_uid": "{STRATEGY_UUID}", "value": 10}}\n'
+            "not json\n"
+            f'{{"strategy_uid": "{FOREIGN_STRATEGY_UUID}", "value": 10}}\n'
+            '{"value": 10}\n'
+        )
+
+        response = bulk_create_trades.handle(self.build_event(body), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 201)
+        self.assertEqual(body["inserted"], 1)
+        self.assertEqual(body["rejected"], 3)
+        self.assertEqual(
+            body["errors"],
+            [
+                {"line": 2, "message": "Invalid JSON"},
+                {"line": 3, "message": "Invalid strategy"},
+                {"line": 4, "message": "'strategy_uid' is a required field"},
+            ],
+        )
+
+        with db_session:
+            self.assertEqual(Trade.select().count(), 1)
+
+    def test_handle_no_valid_trades(self):
+        body = "strategy_uid,value\nfoo,10\n"
+
+        response = bulk_create_trades.handle(self.build_event(body, "text/csv"), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 400)
+        self.assertEqual(body["message"], "No valid trades")
+        self.assertEqual(
+            body["errors"], [{"line": 2, "message": "'strategy_uid' must be a valid UUID"}]
+        )
+
+    @patch("settings.BULK_MAX_ROWS", 1)
+    def test_handle_too_many_trades(self):
+        body = f"strategy_uid\n{STRATEGY_UUID}\n{STRATEGY_UUID}\n"
+
+        response = bulk_create_trades.handle(self.build_event(body, "text/csv"), {})
+
+        self.assertEqual(response["statusCode"], 413)
+
+        with db_session:
+            self.assertEqual(Trade.select().count(), 0)
+
+    def test_handle_account_not_found(self):
+        event = self.build_event("", account_uuid="0a1b2c3d-4e5f-4a6b-8c7d-9e0f1a2b3c4d")
+
+        response = bulk_create_trades.handle(event, {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 404)
+        self.assertEqual(body, {"message": "Account not found"})
@@ -1,9 +1,11 @@
 import json
 import unittest
+from unittest.mock import patch
 
 from pony.orm import db_session
 
-from entities import User, Broker, Account
+import rollups
+from entities import db, User, Broker, Account, Strategy, Trade, DailyTradeStats
 from handlers import delete_account
 
 
@@ -13,7 +15,7 @@ class TestDeleteAccount(unittest.TestCase):
         user = User(uid="e78ed068-f364-477d-bb98-8a981355c0a9", encrypted_password="1233455")
         broker = Broker(uid="94a4756d-eb7b-44cb-8558-857bb9aa1e9c", name="Test Broker", user=user)
 
-        Account(
+        account = Account(
             uid="f280b3c0-fabf-4f01-b194-7846cb6c9a26",
             type_account="D",
             currency="USD",
@@ -21,9 +23,19 @@ class TestDeleteAccount(unittest.TestCase):
             broker=broker,
             user=user,
         )
+        strategy = Strategy(name="Strategy", user=user)
+        trades = [
+            Trade(value=10.0, profit=profit, account=account, user=user, strategy=strategy)
+            for profit in (5.0, -2.0)
+        ]
+        db.flush()
+        rollups.apply_trades([trade.id for trade in trades])
 
     @db_session
     def tearDown(self):
+        DailyTradeStats.select().delete(bulk=True)
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
         Account.select().delete()
         Broker.select().delete()
         User.select().delete()
@@ -46,6 +58,29 @@ class TestDeleteAccount(unittest.TestCase):
             account = Account.get(uid="f280b3c0-fabf-4f01-b194-7846cb6c9a26")
 
             self.assertIsNone(account)
+            self.assertEqual(Trade.select().count(), 0)
+            self.assertEqual(DailyTradeStats.select().count(), 0)
+
+    @patch("purge.schedule")
+    def test_handle_async(self, schedule):
+        event = {
+            "requestContext": {
+                "authorizer": {"sub": "auth0", "user_uuid": "e78ed068-f364-477d-bb98-8a981355c0a9"}
+            },
+            "pathParameters": {"uuid": "f280b3c0-fabf-4f01-b194-7846cb6c9a26"},
+            "queryStringParameters": {"async": "true"},
+            "headers": {"Authorization": "Bearer foo-bar"},
+        }
+
+        response = delete_account.handle(event, {})
+
+        self.assertEqual(response["statusCode"], 202)
+
+        with db_session:
+            account = Account.get(uid="f280b3c0-fabf-4f01-b194-7846cb6c9a26")
+
+            self.assertIsNotNone(account)
+            schedule.assert_called_once_with({"account_ids": [account.id]})
 
     def test_handle_account_does_not_exist(self):
         event = {
@@ -1,12 +1,17 @@
 import json
+import tracemalloc
 import unittest
 from datetime import datetime
+from unittest.mock import patch
 
 from pony.orm import db_session
 
-from entities import User, Broker, Account
+from entities import db, User, Broker, Account, Strategy, Trade
 from handlers import delete_broker
 
+TRADES = 100000
+MEMORY_BUDGET = 10 * 1024 * 1024
+
 
 class TestDeleteBroker(unittest.TestCase):
     @db_session
@@ -135,3 +140,82 @@ class TestDeleteBroker(unittest.TestCase):
         self.assertEqual(response["statusCode"], 204)
         self.assertIsNone(response["body"])
         self.assertIsNone(broker)
+
+    @patch("purge.boto3")
+    @db_session
+    def test_handle_async(self, boto3):
+        event = {
+            "headers": {"Authorization": "Bearer xpto"},
+            "pathParameters": {"uuid": "85808508-2259-4704-a9d5-619533ad518a"},
+            "queryStringParameters": {"async": "true"},
+            "requestContext": {"authorizer": {"sub": "auth0", "user_uuid": self.broker.user.uid}},
+        }
+
+        response = delete_broker.handle(event, {})
+        broker = Broker.get_by_uid("85808508-2259-4704-a9d5-619533ad518a")
+        invoke = boto3.client.return_value.invoke
+
+        self.assertEqual(response["statusCode"], 202)
+        self.assertIsNotNone(broker)
+        self.assertEqual(invoke.call_args.kwargs["InvocationType"], "Event")
+        self.assertEqual(json.loads(invoke.call_args.kwargs["Payload"]), {"broker_id": broker.id})
+
+
+class TestDeleteBrokerWithTrades(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(uid="1d2e3f4a-5b6c-4d7e-8f9a-0b1c2d3e4f5a", encrypted_password="123456")
+        broker = Broker(uid="2e3f4a5b-6c7d-4e8f-9a0b-1c2d3e4f5a6b", name="Broker", user=user)
+        account = Account(
+            type_account="R", currency="USD", initial_balance=100.0, broker=broker, user=user
+        )
+        strategy = Strategy(name="Strategy", user=user)
+        db.flush()
+        insert_trades(account.id, user.id, strategy.id)
+
+    @db_session
+    def tearDown(self):
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    def test_handle_deletes_trades_under_memory_budget(self):
+        event = {
+            "headers": {"Authorization": "Bearer xpto"},
+            "pathParameters": {"uuid": "2e3f4a5b-6c7d-4e8f-9a0b-1c2d3e4f5a6b"},
+            "requestContext": {
+                "authorizer": {"sub": "auth0", "user_uuid": "1d2e3f4a-5b6c-4d7e-8f9a-0b1c2d3e4f5a"}
+            },
+        }
+
+        tracemalloc.start()
+
+        try:
+            response = delete_broker.handle(event, {})
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(response["statusCode"], 204)
+        self.assertLess(peak, MEMORY_BUDGET)
+
+        with db_session:
+            self.assertEqual(Trade.select().count(), 0)
+            self.assertEqual(Account.select().count(), 0)
+
+
+def insert_trades(account_id, user_id, strategy_id, trades=TRADES):
+    db.execute(
+        """
+        INSERT INTO trades (
+            uid, value, profit, result, type_trade,
+            account_id, user_id, strategy_id, created_at, updated_at
+        )
+        SELECT
+            md5($account_id || '-' || number)::uuid, 10.0, 1.0, true, 'T',
+            $account_id, $user_id, $strategy_id, now(), now()
+        FROM generate_series(1, $trades) number
+        """
+    )
@@ -0,0 +1,111 @@
+import csv
+import io
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+from pony.orm import db_session
+
+import exports
+from entities import User, Broker, Account, Strategy, Trade
+from handlers import export_trades
+
+USER_UUID = "5c6d7e8f-9a0b-4c1d-8e2f-3a4b5c6d7e8f"
+OTHER_USER_UUID = "6d7e8f9a-0b1c-4d2e-9f3a-4b5c6d7e8f9a"
+
+
+class TestExportTrades(unittest.TestCase):
+    @classmethod
+    @db_session
+    def setUpClass(cls):
+        for user_uuid, size in ((USER_UUID, 12), (OTHER_USER_UUID, 3)):
+            user = User(uid=user_uuid, encrypted_password="123456")
+            broker = Broker(name="Broker", user=user)
+            account = Account(
+                type_account="R",
+                currency="USD",
+                initial_balance=100.0,
+                broker=broker,
+                user=user,
+            )
+            strategy = Strategy(name="Strategy", user=user)
+
+            for hour in range(size):
+                Trade(
+                    value=10.0,
+                    profit=10.0 if hour % 2 else -5.0,
+                    result=bool(hour % 2),
+                    account=account,
+                    user=user,
+                    strategy=strategy,
+                    created_at=datetime(2022, 3, 1) + timedelta(hours=hour),
+                )
+
+    @classmethod
+    @db_session
+    def tearDownClass(cls):
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    def build_event(self, query=None):
+        return {
+            "headers": {"Authorization": "Bearer foobar"},
+            "requestContext": {"authorizer": {"sub": "auth0", "user_uuid": USER_UUID}},
+            "queryStringParameters": query,
+        }
+
+    @patch("settings.EXPORT_BATCH_SIZE", 5)
+    def test_handle_ndjson(self):
+        response = export_trades.handle(self.build_event(), {})
+        trades = [json.loads(line) for line in response["body"].splitlines()]
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(response["headers"]["Content-Type"], "application/x-ndjson")
+        self.assertEqual(len(trades), 12)
+        self.assertEqual(trades[0]["created_at"], "2022-03-01T00:00:00")
+        self.assertEqual(trades[0]["profit"], -5.0)
+        self.assertEqual(trades[1]["result"], True)
+
+    def test_handle_csv(self):
+        response = export_trades.handle(self.build_event({"format": "csv"}), {})
+        trades = list(csv.DictReader(io.StringIO(response["body"])))
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(response["headers"]["Content-Type"], "text/csv")
+        self.assertEqual(len(trades), 12)
+        self.assertEqual(trades[-1]["created_at"], "2022-03-01T11:00:00")
+
+    @patch("settings.EXPORT_MAX_INLINE_BYTES", 1024)
+    @patch("settings.EXPORT_BATCH_SIZE", 2)
+    @patch("exports.schedule")
+    def test_handle_large_export_is_scheduled(self, schedule):
+        with tempfile.TemporaryDirectory() as directory:
+            with patch("exports.store", exports.LocalStore(directory)):
+                response = export_trades.handle(self.build_event(), {})
+
+            body = json.loads(response["body"])
+            path = Path(urlparse(body["location"]).path)
+
+            self.assertFalse(path.exists())
+
+        self.assertEqual(response["statusCode"], 202)
+        self.assertEqual(body["format"], "ndjson")
+
+        (payload,), _ = schedule.call_args
+        self.assertEqual(payload["format"], "ndjson")
+        self.assertRegex(payload["key"], rf"^exports/{USER_UUID}/[0-9a-f-]+\.ndjson$")
+        self.assertTrue(str(path).endswith(payload["key"]))
+
+    def test_handle_invalid_format(self):
+        response = export_trades.handle(self.build_event({"format": "xml"}), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 400)
+        self.assertEqual(body["message"], "'format' must be one of ndjson, csv")
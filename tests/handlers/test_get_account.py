@@ -78,3 +78,19 @@ class TestGetAccount(unittest.TestCase):
         self.assertEqual(result["statusCode"], 404)
         self.assertIsInstance(body, dict)
         self.assertEqual(body, expected)
+
+    @db_session
+    def test_get_account_not_modified(self):
+        etag = get_account.handle(self.event, {})["headers"]["ETag"]
+        self.event["headers"]["If-None-Match"] = etag
+
+        result = get_account.handle(self.event, {})
+
+        self.assertEqual(result["statusCode"], 304)
+        self.assertEqual(result["headers"]["ETag"], etag)
+
+        self.event["pathParameters"] = {"uuid": "17f95d8b-a039-47e5-9478-e4dceb78010f"}
+        result = get_account.handle(self.event, {})
+
+        self.assertEqual(result["statusCode"], 404)
+        self.assertNotIn("ETag", result["headers"])
@@ -0,0 +1,96 @@
+import json
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from pony.orm import db_session
+
+from entities import User, Broker, Account, Strategy, Trade
+from handlers import get_account_equity
+
+USER_UUID = "1a2b3c4d-5e6f-4a7b-8c9d-0e1f2a3b4c5d"
+ACCOUNT_UUID = "2b3c4d5e-6f7a-4b8c-9d0e-1f2a3b4c5d6e"
+
+
+class TestGetAccountEquity(unittest.TestCase):
+    @classmethod
+    @db_session
+    def setUpClass(cls):
+        user = User(uid=USER_UUID, encrypted_password="123456")
+        broker = Broker(name="Broker", user=user)
+        account = Account(
+            uid=ACCOUNT_UUID,
+            type_account="R",
+            currency="USD",
+            initial_balance=100.0,
+            broker=broker,
+            user=user,
+        )
+        strategy = Strategy(name="Strategy", user=user)
+
+        for hour in range(20):
+            Trade(
+                value=10.0,
+                profit=10.0 if hour % 2 else -5.0,
+                account=account,
+                user=user,
+                strategy=strategy,
+                created_at=datetime(2022, 3, 1) + timedelta(hours=hour),
+            )
+
+    @classmethod
+    @db_session
+    def tearDownClass(cls):
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    def build_event(self, account_uuid=ACCOUNT_UUID, query=None):
+        return {
+            "headers": {"Authorization": "Bearer foobar"},
+            "requestContext": {"authorizer": {"sub": "auth0", "user_uuid": USER_UUID}},
+            "pathParameters": {"uuid": account_uuid},
+            "queryStringParameters": query,
+        }
+
+    def test_handle_all_points(self):
+        response = get_account_equity.handle(self.build_event(), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(body["initial_balance"], 100.0)
+        self.assertEqual(body["total"], 20)
+        self.assertEqual(len(body["points"]), 20)
+        self.assertEqual(body["points"][0], {"created_at": "2022-03-01T00:00:00", "balance": 95.0})
+        self.assertEqual(body["points"][-1]["balance"], 150.0)
+
+    @patch("settings.EQUITY_CURSOR_ITERSIZE", 3)
+    def test_handle_downsampled(self):
+        response = get_account_equity.handle(self.build_event(query={"points": "5"}), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(body["total"], 20)
+        self.assertEqual(len(body["points"]), 5)
+        self.assertEqual(
+            body["points"][-1], {"created_at": "2022-03-01T19:00:00", "balance": 150.0}
+        )
+
+    def test_handle_invalid_points(self):
+        for points in ("foo", "2", "100000"):
+            with self.subTest(points=points):
+                event = self.build_event(query={"points": points})
+                response = get_account_equity.handle(event, {})
+
+                self.assertEqual(response["statusCode"], 400)
+
+    def test_handle_account_not_found(self):
+        event = self.build_event("3c4d5e6f-7a8b-4c9d-8e1f-2a3b4c5d6e7f")
+
+        response = get_account_equity.handle(event, {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 404)
+        self.assertEqual(body, {"message": "Account not found"})
@@ -0,0 +1,98 @@
+import json
+import unittest
+from datetime import datetime
+
+from pony.orm import db_session
+
+from entities import User, Broker, Account, Strategy, Trade
+from handlers import get_account_stats
+
+USER_UUID = "5e6f7a8b-9c0d-4e1f-8a2b-3c4d5e6f7a8b"
+ACCOUNT_UUID = "6f7a8b9c-0d1e-4f2a-9b3c-4d5e6f7a8b9c"
+
+
+class TestGetAccountStats(unittest.TestCase):
+    @classmethod
+    @db_session
+    def setUpClass(cls):
+        user = User(uid=USER_UUID, encrypted_password="123456", risk=10)
+        broker = Broker(name="Broker", user=user)
+        account = Account(
+            uid=ACCOUNT_UUID,
+            type_account="R",
+            currency="USD",
+            initial_balance=100.0,
+            broker=broker,
+            user=user,
+        )
+        strategy = Strategy(name="Strategy", user=user)
+
+        for profit, value, day in (
+            (10.0, 5.0, 1),
+            (-5.0, 5.0, 2),
+            (-10.0, 20.0, 3),
+            (20.0, 5.0, 4),
+        ):
+            Trade(
+                value=value,
+                profit=profit,
+                result=profit > 0,
+                account=account,
+                user=user,
+                strategy=strategy,
+                created_at=datetime(2022, 3, day),
+            )
+
+    @classmethod
+    @db_session
+    def tearDownClass(cls):
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    def build_event(self, account_uuid=ACCOUNT_UUID, query=None):
+        return {
+            "headers": {"Authorization": "Bearer foobar"},
+            "requestContext": {"authorizer": {"sub": "auth0", "user_uuid": USER_UUID}},
+            "pathParameters": {"uuid": account_uuid},
+            "queryStringParameters": query,
+        }
+
+    def test_handle_succeed(self):
+        response = get_account_stats.handle(self.build_event(), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(body["trades"], 4)
+        self.assertEqual(body["max_drawdown"], 15.0)
+        self.assertEqual(body["max_drawdown_trades"], 2)
+        self.assertEqual(body["max_drawdown_duration"], 2 * 24 * 3600)
+        self.assertEqual(body["longest_win_streak"], 1)
+        self.assertEqual(body["longest_loss_streak"], 2)
+        self.assertEqual(body["risk_exceeded"], 0.25)
+        self.assertIsNotNone(body["sharpe_ratio"])
+
+    def test_handle_date_range(self):
+        query = {"from": "2022-03-03"}
+
+        response = get_account_stats.handle(self.build_event(query=query), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(body["trades"], 2)
+        self.assertEqual(body["max_drawdown"], 10.0)
+        self.assertEqual(body["max_drawdown_percent"], 10.0 / 105.0)
+
+    def test_handle_invalid_date_range(self):
+        response = get_account_stats.handle(self.build_event(query={"to": "tomorrow"}), {})
+
+        self.assertEqual(response["statusCode"], 400)
+
+    def test_handle_account_not_found(self):
+        response = get_account_stats.handle(
+            self.build_event("7a8b9c0d-1e2f-4a3b-8c4d-5e6f7a8b9c0d"), {}
+        )
+
+        self.assertEqual(response["statusCode"], 404)
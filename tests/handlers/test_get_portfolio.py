@@ -0,0 +1,79 @@
+import json
+import unittest
+
+from pony.orm import db_session
+
+import fx
+from entities import User, Broker, Account, FxRate
+from handlers import get_portfolio
+
+USER_UUID = "8f9a0b1c-2d3e-4f4a-8b5c-6d7e8f9a0b1d"
+
+
+class TestGetPortfolio(unittest.TestCase):
+    @classmethod
+    @db_session
+    def setUpClass(cls):
+        user = User(uid=USER_UUID, encrypted_password="123456")
+        broker = Broker(name="Broker", user=user)
+        Account(
+            type_account="R",
+            currency="USD",
+            initial_balance=100.0,
+            current_balance=120.0,
+            broker=broker,
+            user=user,
+        )
+        fx.store_rates({"USD": 1.0, "EUR": 1.25})
+
+    @classmethod
+    @db_session
+    def tearDownClass(cls):
+        FxRate.select().delete(bulk=True)
+        fx.rates_cache.clear()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    def build_event(self, user_uuid=USER_UUID, query=None):
+        return {
+            "headers": {"Authorization": "Bearer foobar"},
+            "requestContext": {"authorizer": {"sub": "auth0", "user_uuid": user_uuid}},
+            "queryStringParameters": query,
+        }
+
+    def test_handle_succeed(self):
+        response = get_portfolio.handle(self.build_event(), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(body["currencies"][0]["current_balance"], 120.0)
+        self.assertEqual(body["account_types"], {"R": 1})
+        self.assertEqual(body["brokers"][0]["name"], "Broker")
+        self.assertEqual(len(body["accounts"]), 1)
+
+    def test_handle_base_currency(self):
+        response = get_portfolio.handle(self.build_event(query={"base": "eur"}), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(body["base"], "EUR")
+        self.assertEqual(body["total"]["current_balance"], 96.0)
+
+    def test_handle_invalid_base_currency(self):
+        for base, message in (
+            ("euro", "'base' must be a 3-letter currency code"),
+            ("XYZ", "Missing FX rate for XYZ"),
+        ):
+            with self.subTest(base=base):
+                response = get_portfolio.handle(self.build_event(query={"base": base}), {})
+
+                self.assertEqual(response["statusCode"], 400)
+                self.assertEqual(json.loads(response["body"]), {"message": message})
+
+    def test_handle_unauthorized(self):
+        response = get_portfolio.handle(
+            self.build_event("9a0b1c2d-3e4f-4a5b-9c6d-7e8f9a0b1c2e"), {}
+        )
+
+        self.assertEqual(response["statusCode"], 401)
@@ -0,0 +1,114 @@
+import json
+import unittest
+from datetime import datetime
+
+from pony.orm import db_session
+
+import fx
+from entities import User, Broker, Account, Strategy, Trade, FxRate
+from handlers import get_strategy_stats
+
+USER_UUID = "6c5b4a39-2817-4f6e-9d5c-4b3a29180f7e"
+STRATEGY_UUID = "7d6c5b4a-3928-4170-8e6d-5c4b3a291807"
+ACCOUNT_UUID = "8e7d6c5b-4a39-4281-9f7e-6d5c4b3a2918"
+
+
+class TestGetStrategyStats(unittest.TestCase):
+    @classmethod
+    @db_session
+    def setUpClass(cls):
+        user = User(uid=USER_UUID, encrypted_password="123456")
+        broker = Broker(name="Broker", user=user)
+        account = Account(
+            uid=ACCOUNT_UUID,
+            type_account="R",
+            currency="USD",
+            initial_balance=100.0,
+            broker=broker,
+            user=user,
+        )
+        strategy = Strategy(uid=STRATEGY_UUID, name="Strategy", user=user)
+
+        for profit, day in ((10.0, 1), (-4.0, 2)):
+            Trade(
+                value=10.0,
+                profit=profit,
+                result=profit > 0,
+                account=account,
+                user=user,
+                strategy=strategy,
+                created_at=datetime(2022, 3, day),
+            )
+
+    @classmethod
+    @db_session
+    def tearDownClass(cls):
+        FxRate.select().delete(bulk=True)
+        fx.rates_cache.clear()
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    def build_event(self, strategy_uuid=STRATEGY_UUID, query=None):
+        return {
+            "headers": {"Authorization": "Bearer foobar"},
+            "requestContext": {"authorizer": {"sub": "auth0", "user_uuid": USER_UUID}},
+            "pathParameters": {"uuid": strategy_uuid},
+            "queryStringParameters": query,
+        }
+
+    def test_handle_succeed(self):
+        response = get_strategy_stats.handle(self.build_event(), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(body["trades"], 2)
+        self.assertEqual(body["win_rate"], 0.5)
+        self.assertEqual(body["total_profit"], 6.0)
+        self.assertEqual(body["profit_factor"], 2.5)
+
+    def test_handle_filters(self):
+        query = {"account": ACCOUNT_UUID, "from": "2022-03-02", "to": "2022-03-02"}
+
+        response = get_strategy_stats.handle(self.build_event(query=query), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(body["trades"], 1)
+        self.assertEqual(body["largest_loss"], -4.0)
+
+    def test_handle_base_currency(self):
+        with db_session:
+            fx.store_rates({"USD": 1.0, "BRL": 0.2})
+
+        response = get_strategy_stats.handle(self.build_event(query={"base": "BRL"}), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(body["total_profit"], 30.0)
+        self.assertEqual(body["largest_loss"], -20.0)
+        self.assertEqual(body["profit_factor"], 2.5)
+
+    def test_handle_invalid_filters(self):
+        for query, message in (
+            ({"account": "0c1d2e3f-4a5b-4c6d-8e7f-9a0b1c2d3e4f"}, "Invalid account"),
+            ({"from": "yesterday"}, "'from' must be an ISO 8601 date or datetime"),
+            ({"base": "XYZ"}, "Missing FX rate for XYZ"),
+        ):
+            with self.subTest(query=query):
+                response = get_strategy_stats.handle(self.build_event(query=query), {})
+                body = json.loads(response["body"])
+
+                self.assertEqual(response["statusCode"], 400)
+                self.assertEqual(body, {"message": message})
+
+    def test_handle_strategy_not_found(self):
+        event = self.build_event("0c1d2e3f-4a5b-4c6d-8e7f-9a0b1c2d3e4f")
+
+        response = get_strategy_stats.handle(event, {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 404)
+        self.assertEqual(body, {"message": "Strategy not found"})
@@ -0,0 +1,56 @@
+import json
+import unittest
+from datetime import datetime
+
+from pony.orm import db_session
+
+import sync
+from entities import User, Broker
+from handlers import get_sync
+
+USER_UUID = "3b1f5c2e-8d4a-4e6b-9f7c-1a2b3c4d5e6f"
+
+
+class TestGetSync(unittest.TestCase):
+    @classmethod
+    @db_session
+    def setUpClass(cls):
+        user = User(uid=USER_UUID, encrypted_password="123456")
+        Broker(name="Broker", user=user, updated_at=datetime(2022, 1, 1))
+
+    @classmethod
+    @db_session
+    def tearDownClass(cls):
+        Broker.select().delete()
+        User.select().delete()
+
+    def build_event(self, query=None):
+        return {
+            "headers": {"Authorization": "Bearer foobar"},
+            "requestContext": {"authorizer": {"sub": "auth0", "user_uuid": USER_UUID}},
+            "queryStringParameters": query,
+        }
+
+    def test_handle_full_sync(self):
+        response = get_sync.handle(self.build_event(), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual([broker["name"] for broker in body["brokers"]], ["Broker"])
+        self.assertIsInstance(sync.decode_cursor(body["cursor"]), datetime)
+
+    def test_handle_since_cursor(self):
+        since = sync.encode_cursor(datetime(2022, 1, 2))
+        response = get_sync.handle(self.build_event({"since": since}), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(body["brokers"], [])
+        self.assertEqual(body["deleted"], [])
+
+    def test_handle_invalid_cursor(self):
+        response = get_sync.handle(self.build_event({"since": "invalid"}), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 400)
+        self.assertEqual(body["message"], "Invalid 'since' cursor")
@@ -193,3 +193,31 @@ class TestListAccounts(unittest.TestCase):
         self.assertIsInstance(body, dict)
         self.assertEqual(len(body["accounts"]), 1)
         self.assertDictEqual(body["accounts"][0], self.expected["accounts"][2])
+
+    def test_handle_list_accounts_paginated(self):
+        self.event["queryStringParameters"] = {"limit": "3"}
+
+        result = list_accounts.handle(self.event, {})
+        first_page = json.loads(result["body"])
+
+        self.assertEqual(result["statusCode"], 200)
+        self.assertListEqual(first_page["accounts"], self.expected["accounts"][:3])
+        self.assertIsNotNone(first_page["next"])
+
+        self.event["queryStringParameters"] = {"limit": "3", "after": first_page["next"]}
+
+        result = list_accounts.handle(self.event, {})
+        second_page = json.loads(result["body"])
+
+        self.assertEqual(result["statusCode"], 200)
+        self.assertListEqual(second_page["accounts"], self.expected["accounts"][3:])
+        self.assertIsNone(second_page["next"])
+
+    def test_handle_list_accounts_invalid_cursor(self):
+        self.event["queryStringParameters"] = {"after": "invalid"}
+
+        result = list_accounts.handle(self.event, {})
+        body = json.loads(result["body"])
+
+        self.assertEqual(result["statusCode"], 400)
+        self.assertEqual(body["message"], "Invalid 'after' cursor")
@@ -4,8 +4,9 @@ from operator import itemgetter
 
 from pony.orm import db_session
 
-from entities import User, Broker, Account
+from entities import User, Broker, Account, user_ids
 from handlers import list_brokers
+from queries import count_queries
 
 
 class TestListBrokers(unittest.TestCase):
@@ -220,3 +221,49 @@ class TestListBrokers(unittest.TestCase):
 
         self.assertEqual(len(sorted_result[0]["accounts"]), 1)
         self.assertEqual(len(sorted_result[1]["accounts"]), 2)
+
+    def test_handle_query_count_does_not_depend_on_brokers(self):
+        query_counts = []
+
+        for user_uuid in (self.uid_user_one_broker, self.uid_user_two_brokers):
+            event = {
+                "headers": {"Authorization": "Bearer api-key"},
+                "requestContext": {"authorizer": {"sub": "auth0", "user_uuid": user_uuid}},
+            }
+            user_ids.clear()
+
+            with count_queries() as counter:
+                result = list_brokers.handle(event, {})
+
+            self.assertEqual(result["statusCode"], 200)
+            query_counts.append(counter.total)
+
+        self.assertListEqual(query_counts, [4, 4])
+
+    def test_handle_paginated(self):
+        event = {
+            "headers": {"Authorization": "Bearer api-key"},
+            "requestContext": {
+                "authorizer": {"sub": "auth0", "user_uuid": self.uid_user_two_brokers}
+            },
+            "queryStringParameters": {"limit": "1"},
+        }
+
+        result = list_brokers.handle(event, {})
+        first_page = json.loads(result["body"])
+
+        self.assertEqual(result["statusCode"], 200)
+        self.assertEqual(len(first_page["brokers"]), 1)
+        self.assertEqual(first_page["brokers"][0]["name"], "Broker 2")
+        self.assertEqual(len(first_page["brokers"][0]["accounts"]), 1)
+
+        event["queryStringParameters"]["after"] = first_page["next"]
+
+        result = list_brokers.handle(event, {})
+        second_page = json.loads(result["body"])
+
+        self.assertEqual(result["statusCode"], 200)
+        self.assertEqual(len(second_page["brokers"]), 1)
+        self.assertEqual(second_page["brokers"][0]["name"], "Broker 3")
+        self.assertEqual(len(second_page["brokers"][0]["accounts"]), 2)
+        self.assertIsNone(second_page["next"])
@@ -0,0 +1,97 @@
+import json
+import unittest
+from datetime import datetime
+
+from pony.orm import db_session
+
+import rollups
+from entities import db, User, Broker, Account, Strategy, Trade, DailyTradeStats
+from handlers import list_daily_stats
+
+USER_UUID = "9c0d1e2f-3a4b-4c5d-8e6f-7a8b9c0d1e2f"
+ACCOUNT_UUID = "0d1e2f3a-4b5c-4d6e-9f7a-8b9c0d1e2f3a"
+STRATEGY_UUID = "1e2f3a4b-5c6d-4e7f-8a8b-9c0d1e2f3a4b"
+
+
+class TestListDailyStats(unittest.TestCase):
+    @classmethod
+    @db_session
+    def setUpClass(cls):
+        user = User(uid=USER_UUID, encrypted_password="123456")
+        broker = Broker(name="Broker", user=user)
+        account = Account(
+            uid=ACCOUNT_UUID,
+            type_account="R",
+            currency="USD",
+            initial_balance=100.0,
+            broker=broker,
+            user=user,
+        )
+        strategy = Strategy(uid=STRATEGY_UUID, name="Strategy", user=user)
+        other_strategy = Strategy(name="Other strategy", user=user)
+        trades = [
+            Trade(
+                value=10.0,
+                profit=profit,
+                result=profit > 0,
+                account=account,
+                user=user,
+                strategy=trade_strategy,
+                created_at=datetime(2022, 3, day),
+            )
+            for profit, day, trade_strategy in (
+                (10.0, 1, strategy),
+                (-5.0, 1, other_strategy),
+                (3.0, 2, strategy),
+            )
+        ]
+
+        db.flush()
+        rollups.apply_trades([trade.id for trade in trades])
+
+    @classmethod
+    @db_session
+    def tearDownClass(cls):
+        DailyTradeStats.select().delete(bulk=True)
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    def build_event(self, query=None):
+        return {
+            "headers": {"Authorization": "Bearer foobar"},
+            "requestContext": {"authorizer": {"sub": "auth0", "user_uuid": USER_UUID}},
+            "queryStringParameters": query,
+        }
+
+    def test_handle_succeed(self):
+        response = list_daily_stats.handle(self.build_event(), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual([day["day"] for day in body["days"]], ["2022-03-01", "2022-03-02"])
+        self.assertEqual([day["profit"] for day in body["days"]], [5.0, 3.0])
+
+    def test_handle_filters(self):
+        query = {"from": "2022-03-01", "to": "2022-03-01", "strategy": STRATEGY_UUID}
+
+        response = list_daily_stats.handle(self.build_event(query), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(len(body["days"]), 1)
+        self.assertEqual(body["days"][0]["trades"], 1)
+        self.assertEqual(body["days"][0]["profit"], 10.0)
+
+    def test_handle_invalid_filters(self):
+        for query in (
+            {"account": "2f3a4b5c-6d7e-4f8a-9b9c-0d1e2f3a4b5c"},
+            {"strategy": "foo"},
+            {"from": "2022-13-01"},
+        ):
+            with self.subTest(query=query):
+                response = list_daily_stats.handle(self.build_event(query), {})
+
+                self.assertEqual(response["statusCode"], 400)
@@ -5,6 +5,9 @@ from entities import User, Strategy
 from handlers import list_strategies
 from pony.orm import db_session
 
+import updates
+from queries import assert_single_statement
+
 
 class TestListStrategies(unittest.TestCase):
     @classmethod
@@ -74,3 +77,72 @@ class TestListStrategies(unittest.TestCase):
 
         self.assertEqual(response["statusCode"], 200)
         self.assertDictEqual(expected, body)
+
+    def test_handle_paginated(self):
+        self.event["queryStringParameters"] = {"limit": "1"}
+
+        response = list_strategies.handle(self.event, {})
+        first_page = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertListEqual(
+            first_page["strategies"],
+            [{"uid": "2d63b31b-98ce-42d3-a88f-5571ef2dea2d", "name": "Strategy 1"}],
+        )
+
+        self.event["queryStringParameters"] = {"limit": "1", "after": first_page["next"]}
+
+        response = list_strategies.handle(self.event, {})
+        second_page = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertListEqual(
+            second_page["strategies"],
+            [{"uid": "837614e4-6f2a-4867-b9d1-aa872cc84cd3", "name": "Strategy 2"}],
+        )
+        self.assertIsNone(second_page["next"])
+
+    def test_handle_invalid_limit(self):
+        self.event["queryStringParameters"] = {"limit": "0"}
+
+        response = list_strategies.handle(self.event, {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 400)
+        self.assertEqual(body["message"], "'limit' must be between 1 and 500")
+
+    def test_handle_returns_etag(self):
+        response = list_strategies.handle(self.event, {})
+
+        self.assertRegex(response["headers"]["ETag"], r'^"[0-9a-f]{32}"$')
+
+    def test_handle_not_modified(self):
+        etag = list_strategies.handle(self.event, {})["headers"]["ETag"]
+        self.event["headers"] = {"If-None-Match": f"W/{etag}"}
+
+        with db_session:
+            response = assert_single_statement(self, list_strategies.handle, self.event)
+
+        self.assertEqual(response["statusCode"], 304)
+        self.assertEqual(response["headers"]["ETag"], etag)
+
+    def test_handle_etag_changes_with_data_and_query(self):
+        etag = list_strategies.handle(self.event, {})["headers"]["ETag"]
+        self.event["headers"] = {"if-none-match": etag}
+        self.event["queryStringParameters"] = {"limit": "1"}
+
+        response = list_strategies.handle(self.event, {})
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertNotEqual(response["headers"]["ETag"], etag)
+
+        del self.event["queryStringParameters"]
+
+        with db_session:
+            user_id = User.get(uid="7035a52c-4e98-45de-b9cf-5de97d5b5bb5").id
+            updates.update_strategy(user_id, "2d63b31b-98ce-42d3-a88f-5571ef2dea2d", "Strategy 1")
+
+        response = list_strategies.handle(self.event, {})
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertNotEqual(response["headers"]["ETag"], etag)
@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import patch
+
+from pony.orm import db_session
+
+import settings
+from entities import db, User, Broker, Account, Strategy, Trade
+from handlers import purge_accounts
+
+
+class Context:
+    def __init__(self, remaining=60000):
+        self.remaining = remaining
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining
+
+
+class TestPurgeAccounts(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(encrypted_password="123456")
+        broker = Broker(name="Broker", user=user)
+        accounts = [
+            Account(
+                type_account="R", currency="USD", initial_balance=100.0, broker=broker, user=user
+            )
+            for _ in range(2)
+        ]
+        strategy = Strategy(name="Strategy", user=user)
+
+        for account in accounts:
+            for _ in range(5):
+                Trade(value=10.0, profit=1.0, account=account, user=user, strategy=strategy)
+
+        db.flush()
+        self.broker_id = broker.id
+        self.account_ids = [account.id for account in accounts]
+
+    @db_session
+    def tearDown(self):
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    @patch.object(settings, "PURGE_CHUNK_SIZE", 3)
+    def test_handle_purges_accounts_in_chunks(self):
+        result = purge_accounts.handle({"account_ids": self.account_ids[:1]}, Context())
+
+        self.assertEqual(result, {"finished": True, "trades": 5})
+
+        with db_session:
+            self.assertEqual(Trade.select().count(), 5)
+            self.assertEqual(Account.select().count(), 1)
+            self.assertEqual(Broker.select().count(), 1)
+
+    @patch.object(settings, "PURGE_CHUNK_SIZE", 3)
+    def test_handle_purges_broker(self):
+        result = purge_accounts.handle({"broker_id": self.broker_id}, Context())
+
+        self.assertEqual(result, {"finished": True, "trades": 10})
+
+        with db_session:
+            self.assertEqual(Trade.select().count(), 0)
+            self.assertEqual(Account.select().count(), 0)
+            self.assertEqual(Broker.select().count(), 0)
+
+    @patch("purge.schedule")
+    @patch.object(settings, "PURGE_CHUNK_SIZE", 3)
+    def test_handle_continues_before_timeout(self, schedule):
+        event = {"broker_id": self.broker_id}
+
+        result = purge_accounts.handle(event, Context(remaining=settings.PURGE_TIME_MARGIN - 1))
+
+        self.assertEqual(result, {"finished": False, "trades": 3})
+        schedule.assert_called_once_with(event)
+
+        with db_session:
+            self.assertEqual(Trade.select().count(), 7)
+            self.assertEqual(Broker.select().count(), 1)
@@ -0,0 +1,50 @@
+import unittest
+from datetime import datetime
+
+from pony.orm import db_session
+
+from entities import User, Broker, Account, Strategy, Trade, DailyTradeStats
+from handlers import rebuild_daily_stats
+
+
+class TestRebuildDailyStats(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(uid="3a4b5c6d-7e8f-4a9b-8c0d-1e2f3a4b5c6d", encrypted_password="123456")
+        broker = Broker(name="Broker", user=user)
+        account = Account(
+            type_account="R", currency="USD", initial_balance=100.0, broker=broker, user=user
+        )
+        strategy = Strategy(name="Strategy", user=user)
+
+        for profit, day in ((10.0, 1), (-5.0, 1), (3.0, 5)):
+            Trade(
+                value=10.0,
+                profit=profit,
+                result=profit > 0,
+                account=account,
+                user=user,
+                strategy=strategy,
+                created_at=datetime(2022, 3, day, 12),
+            )
+
+    @db_session
+    def tearDown(self):
+        DailyTradeStats.select().delete(bulk=True)
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    def test_handle_rebuilds_range(self):
+        result = rebuild_daily_stats.handle({"from": "2022-03-01", "to": "2022-03-02"}, {})
+
+        self.assertEqual(result, {"from": "2022-03-01", "to": "2022-03-02", "user_id": None})
+
+        with db_session:
+            rows = DailyTradeStats.select()[:]
+
+            self.assertEqual(len(rows), 1)
+            self.assertEqual(rows[0].trades, 2)
+            self.assertEqual(rows[0].profit, 5.0)
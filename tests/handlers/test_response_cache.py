@@ -0,0 +1,110 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from pony.orm import db_session
+
+import responses
+from entities import User, Strategy, user_ids
+from fake_redis import start_fake_redis
+from handlers import create_strategy, list_strategies, update_strategy
+from queries import count_queries
+
+USER_UUID = "5c6d7e8f-9a0b-4c1d-8e2f-3a4b5c6d7e8f"
+STRATEGY_UUID = "8a9b0c1d-2e3f-4a5b-9c6d-7e8f9a0b1c2d"
+
+
+class TestResponseCache(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(uid=USER_UUID, encrypted_password="123456")
+        Strategy(uid=STRATEGY_UUID, name="First", user=user)
+        user_ids.clear()
+
+        self.server = start_fake_redis(self)
+        self.use_new_container()
+        responses.cache.clear_stats()
+
+    @db_session
+    def tearDown(self):
+        Strategy.select().delete()
+        User.select().delete()
+
+    def use_new_container(self):
+        # Each handler is a Lambda of its own, only the Redis server is shared between them
+        backend = responses.RedisBackend(self.server.url)
+        self.addCleanup(backend.close)
+        patcher = patch.object(responses.cache, "backend", backend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def build_event(self, body=None, path=None):
+        event = {
+            "headers": {"Authorization": "Bearer api-key"},
+            "requestContext": {"authorizer": {"sub": "auth0", "user_uuid": USER_UUID}},
+        }
+
+        if body:
+            event["body"] = json.dumps(body)
+
+        if path:
+            event["pathParameters"] = {"uuid": path}
+
+        return event
+
+    def list_names(self):
+        response = list_strategies.handle(self.build_event(), {})
+        return [strategy["name"] for strategy in json.loads(response["body"])["strategies"]]
+
+    def test_repeated_reads_skip_the_database(self):
+        first = list_strategies.handle(self.build_event(), {})
+
+        with count_queries() as counter:
+            second = list_strategies.handle(self.build_event(), {})
+
+        self.assertEqual(counter.total, 0, counter.stats)
+        self.assertEqual(second["body"], first["body"])
+        self.assertEqual(second["headers"]["ETag"], first["headers"]["ETag"])
+        self.assertEqual(responses.cache.stats["hits"], 1)
+        self.assertGreater(responses.cache.stats["bytes_saved"], 0)
+
+    def test_writes_invalidate_cached_reads(self):
+        self.assertEqual(self.list_names(), ["First"])
+
+        response = create_strategy.handle(self.build_event({"name": "Second"}), {})
+
+        self.assertEqual(response["statusCode"], 201)
+        self.assertEqual(self.list_names(), ["First", "Second"])
+
+    def test_writes_in_another_function_invalidate_cached_reads(self):
+        self.assertEqual(self.list_names(), ["First"])
+
+        self.use_new_container()
+        event = self.build_event({"name": "Renamed"}, path=STRATEGY_UUID)
+        response = update_strategy.handle(event, {})
+
+        self.assertEqual(response["statusCode"], 204)
+
+        self.use_new_container()
+        self.assertEqual(self.list_names(), ["Renamed"])
+
+    def test_failed_writes_keep_cached_reads(self):
+        self.list_names()
+
+        response = create_strategy.handle(self.build_event({"name": True}), {})
+
+        self.assertEqual(response["statusCode"], 400)
+        self.list_names()
+        self.assertEqual(responses.cache.stats["hits"], 1)
+
+    def test_disabled_without_a_shared_backend(self):
+        with patch.object(responses.cache, "backend", None):
+            self.assertEqual(self.list_names(), ["First"])
+
+            response = update_strategy.handle(
+                self.build_event({"name": "Renamed"}, path=STRATEGY_UUID), {}
+            )
+
+            self.assertEqual(response["statusCode"], 204)
+            self.assertEqual(self.list_names(), ["Renamed"])
+            self.assertEqual(responses.cache.stats["hits"], 0)
@@ -0,0 +1,102 @@
+import json
+import unittest
+from datetime import datetime
+
+from pony.orm import db_session
+
+from entities import User, Broker, Account, Strategy, Trade
+from handlers import simulate_strategy
+
+USER_UUID = "4b5c6d7e-8f9a-4b0c-9d1e-2f3a4b5c6d7e"
+STRATEGY_UUID = "5c6d7e8f-9a0b-4c1d-8e2f-3a4b5c6d7e8f"
+EMPTY_STRATEGY_UUID = "6d7e8f9a-0b1c-4d2e-9f3a-4b5c6d7e8f9a"
+ACCOUNT_UUID = "7e8f9a0b-1c2d-4e3f-8a4b-5c6d7e8f9a0b"
+
+
+class TestSimulateStrategy(unittest.TestCase):
+    @classmethod
+    @db_session
+    def setUpClass(cls):
+        user = User(uid=USER_UUID, encrypted_password="123456", risk=10)
+        broker = Broker(name="Broker", user=user)
+        account = Account(
+            uid=ACCOUNT_UUID,
+            type_account="R",
+            currency="USD",
+            initial_balance=100.0,
+            current_balance=200.0,
+            broker=broker,
+            user=user,
+        )
+        strategy = Strategy(uid=STRATEGY_UUID, name="Strategy", user=user)
+        Strategy(uid=EMPTY_STRATEGY_UUID, name="Empty strategy", user=user)
+
+        for profit, day in ((10.0, 1), (-5.0, 2), (-10.0, 3), (20.0, 4)):
+            Trade(
+                value=10.0,
+                profit=profit,
+                result=profit > 0,
+                account=account,
+                user=user,
+                strategy=strategy,
+                created_at=datetime(2022, 3, day),
+            )
+
+    @classmethod
+    @db_session
+    def tearDownClass(cls):
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    def build_event(self, payload, strategy_uuid=STRATEGY_UUID):
+        return {
+            "headers": {"Authorization": "Bearer foobar"},
+            "requestContext": {"authorizer": {"sub": "auth0", "user_uuid": USER_UUID}},
+            "pathParameters": {"uuid": strategy_uuid},
+            "body": json.dumps(payload),
+        }
+
+    def test_handle_succeed(self):
+        payload = {"account_uid": ACCOUNT_UUID, "paths": 200, "trades": 30, "seed": 42}
+
+        response = simulate_strategy.handle(self.build_event(payload), {})
+        body = json.loads(response["body"])
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(body["seed"], 42)
+        self.assertEqual((body["paths"], body["trades"]), (200, 30))
+        self.assertEqual((body["initial_balance"], body["risk"]), (200.0, 10))
+        self.assertGreaterEqual(body["ruin_probability"], 0.0)
+        self.assertLessEqual(body["ruin_probability"], 1.0)
+        self.assertEqual(body["bands"][-1]["trade"], 30)
+
+        response = simulate_strategy.handle(self.build_event(payload), {})
+
+        self.assertEqual(json.loads(response["body"]), body)
+
+    def test_handle_not_found(self):
+        payload = {"account_uid": ACCOUNT_UUID}
+
+        for strategy_uuid in ("8f9a0b1c-2d3e-4f4a-9b5c-6d7e8f9a0b1c", "foo"):
+            with self.subTest(strategy_uuid=strategy_uuid):
+                response = simulate_strategy.handle(self.build_event(payload, strategy_uuid), {})
+
+                self.assertEqual(response["statusCode"], 404)
+
+    def test_handle_bad_request(self):
+        for payload, strategy_uuid in (
+            ({}, STRATEGY_UUID),
+            ({"account_uid": "9a0b1c2d-3e4f-4a5b-8c6d-7e8f9a0b1c2d"}, STRATEGY_UUID),
+            ({"account_uid": "foo"}, STRATEGY_UUID),
+            ({"account_uid": ACCOUNT_UUID, "paths": 0}, STRATEGY_UUID),
+            ({"account_uid": ACCOUNT_UUID, "paths": 100000, "trades": 5000}, STRATEGY_UUID),
+            ({"account_uid": ACCOUNT_UUID, "ruin": 0}, STRATEGY_UUID),
+            ({"account_uid": ACCOUNT_UUID}, EMPTY_STRATEGY_UUID),
+        ):
+            with self.subTest(payload=payload, strategy_uuid=strategy_uuid):
+                response = simulate_strategy.handle(self.build_event(payload, strategy_uuid), {})
+
+                self.assertEqual(response["statusCode"], 400)
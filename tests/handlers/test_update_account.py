@@ -78,6 +78,10 @@ class TestUpdateAccount(unittest.TestCase):
             self.assertEqual(updated_account.type_account, "R")
             self.assertEqual(updated_account.currency, "BRL")
             self.assertEqual(updated_account.initial_balance, 1000.0)
+            self.assertEqual(updated_account.current_balance, 1000.0)
+            self.assertEqual(
+                str(updated_account.broker.uid), "8b53a64a-9ccb-4db0-849e-dabb67341029"
+            )
 
     def test_handle_invalid_payload(self):
         payload = {
@@ -0,0 +1,179 @@
+import json
+import unittest
+
+from pony.orm import db_session
+
+from entities import User, Broker, Account, Strategy, Trade
+from handlers import (
+    create_account,
+    create_broker,
+    create_strategy,
+    delete_account,
+    delete_broker,
+    export_trades,
+    get_account,
+    get_account_stats,
+    get_sync,
+    list_accounts,
+    list_brokers,
+    list_strategies,
+    simulate_strategy,
+    update_account,
+    update_broker,
+    update_strategy,
+)
+from queries import assert_no_user_load, assert_single_user_lookup, assert_single_statement
+
+USER_UUID = "4f0f6c43-5d1b-4a8e-9d86-2a0e8d3b7c11"
+BROKER_UUID = "2c8f5a4e-8f62-4f5b-9b5c-7f1d0e6a9b21"
+EMPTY_BROKER_UUID = "9a1b2c3d-4e5f-4a6b-8c7d-9e0f1a2b3c41"
+ACCOUNT_UUID = "6d7e8f90-1a2b-4c3d-8e4f-5a6b7c8d9e51"
+STRATEGY_UUID = "7e8f9a0b-1c2d-4e3f-9a4b-5c6d7e8f9a61"
+
+
+class TestUserLookups(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(uid=USER_UUID, encrypted_password="123456", risk=5)
+        broker = Broker(uid=BROKER_UUID, name="Lookup Broker", user=user)
+        Broker(uid=EMPTY_BROKER_UUID, name="Empty Broker", user=user)
+        account = Account(
+            uid=ACCOUNT_UUID,
+            type_account="D",
+            currency="USD",
+            initial_balance=100.0,
+            broker=broker,
+            user=user,
+        )
+        strategy = Strategy(uid=STRATEGY_UUID, name="Lookup Strategy", user=user)
+        Trade(value=10.0, profit=5.0, result=True, account=account, user=user, strategy=strategy)
+
+    @db_session
+    def tearDown(self):
+        Trade.select().delete(bulk=True)
+        Account.select().delete()
+        Broker.select().delete()
+        Strategy.select().delete()
+        User.select().delete()
+
+    def build_event(self, path=None, body=None):
+        event = {
+            "headers": {"Authorization": "Bearer api-key"},
+            "requestContext": {"authorizer": {"sub": "auth0", "user_uuid": USER_UUID}},
+        }
+
+        if path:
+            event["pathParameters"] = {"uuid": path}
+
+        if body:
+            event["body"] = json.dumps(body)
+
+        return event
+
+    def test_list_handlers(self):
+        for handler in (list_brokers, list_accounts, list_strategies, get_sync, export_trades):
+            with self.subTest(handler=handler.__name__):
+                response = assert_single_user_lookup(self, handler.handle, self.build_event())
+                self.assertEqual(response["statusCode"], 200)
+
+    def test_get_account(self):
+        response = assert_single_user_lookup(
+            self, get_account.handle, self.build_event(path=ACCOUNT_UUID)
+        )
+
+        self.assertEqual(response["statusCode"], 200)
+
+    def test_get_account_stats(self):
+        event = self.build_event(path=ACCOUNT_UUID)
+
+        for assert_lookups in (assert_single_user_lookup, assert_no_user_load):
+            with self.subTest(assert_lookups=assert_lookups.__name__):
+                response = assert_lookups(self, get_account_stats.handle, event)
+                self.assertEqual(response["statusCode"], 200)
+
+    def test_simulate_strategy(self):
+        body = {"account_uid": ACCOUNT_UUID, "paths": 10, "trades": 10, "seed": 1}
+        event = self.build_event(path=STRATEGY_UUID, body=body)
+
+        for assert_lookups in (assert_single_user_lookup, assert_no_user_load):
+            with self.subTest(assert_lookups=assert_lookups.__name__):
+                response = assert_lookups(self, simulate_strategy.handle, event)
+                self.assertEqual(response["statusCode"], 200)
+
+    def test_create_handlers(self):
+        cases = (
+            (create_broker, {"name": "New Broker"}),
+            (create_strategy, {"name": "New Strategy"}),
+            (
+                create_account,
+                {
+                    "broker_uid": BROKER_UUID,
+                    "type_account": "R",
+                    "currency": "BRL",
+                    "initial_balance": 10.0,
+                },
+            ),
+        )
+
+        for handler, body in cases:
+            with self.subTest(handler=handler.__name__):
+                response = assert_single_user_lookup(
+                    self, handler.handle, self.build_event(body=body)
+                )
+                self.assertEqual(response["statusCode"], 201)
+
+    def test_update_handlers(self):
+        cases = (
+            (update_broker, BROKER_UUID, {"name": "Renamed Broker"}),
+            (update_strategy, STRATEGY_UUID, {"name": "Renamed Strategy"}),
+            (
+                update_account,
+                ACCOUNT_UUID,
+                {
+                    "broker_id": BROKER_UUID,
+                    "type_account": "R",
+                    "currency": "BRL",
+                    "initial_balance": 10.0,
+                },
+            ),
+        )
+
+        for handler, uuid, body in cases:
+            with self.subTest(handler=handler.__name__):
+                response = assert_single_user_lookup(
+                    self, handler.handle, self.build_event(path=uuid, body=body)
+                )
+                self.assertEqual(response["statusCode"], 204)
+
+    def test_update_handlers_run_a_single_statement(self):
+        cases = (
+            (update_broker, BROKER_UUID, {"name": "Renamed Broker"}),
+            (update_strategy, STRATEGY_UUID, {"name": "Renamed Strategy"}),
+            (
+                update_account,
+                ACCOUNT_UUID,
+                {
+                    "broker_id": EMPTY_BROKER_UUID,
+                    "type_account": "R",
+                    "currency": "BRL",
+                    "initial_balance": 100.0,
+                },
+            ),
+        )
+
+        for handler, uuid, body in cases:
+            with self.subTest(handler=handler.__name__):
+                response = assert_single_statement(
+                    self, handler.handle, self.build_event(path=uuid, body=body)
+                )
+                self.assertEqual(response["statusCode"], 204)
+
+    def test_delete_handlers(self):
+        cases = ((delete_account, ACCOUNT_UUID), (delete_broker, EMPTY_BROKER_UUID))
+
+        for handler, uuid in cases:
+            with self.subTest(handler=handler.__name__):
+                response = assert_single_user_lookup(
+                    self, handler.handle, self.build_event(path=uuid)
+                )
+                self.assertEqual(response["statusCode"], 204)
@@ -0,0 +1,57 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from pony.orm import db_session
+
+import exports
+from entities import db, User, Broker, Account, Strategy, Trade
+from handlers import write_export
+
+
+class TestWriteExport(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(encrypted_password="123456")
+        broker = Broker(name="Broker", user=user)
+        account = Account(
+            type_account="R", currency="USD", initial_balance=100.0, broker=broker, user=user
+        )
+        strategy = Strategy(name="Strategy", user=user)
+
+        for hour in range(12):
+            Trade(
+                value=10.0,
+                profit=1.0,
+                account=account,
+                user=user,
+                strategy=strategy,
+                created_at=datetime(2022, 3, 1) + timedelta(hours=hour),
+            )
+
+        db.flush()
+        self.user_id = user.id
+
+    @db_session
+    def tearDown(self):
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    @patch("settings.EXPORT_BATCH_SIZE", 5)
+    def test_handle(self):
+        event = {"user_id": self.user_id, "format": "csv", "key": "exports/user/trades.csv"}
+
+        with tempfile.TemporaryDirectory() as directory:
+            with patch("exports.store", exports.LocalStore(directory)):
+                result = write_export.handle(event, {})
+
+            content = (Path(directory) / "exports/user/trades.csv").read_text()
+
+        self.assertEqual(result, {"rows": 12, "size": len(content)})
+        self.assertEqual(content.splitlines()[0], ",".join(exports.FIELDS))
+        self.assertEqual(len(content.splitlines()), 13)
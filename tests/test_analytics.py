@@ -0,0 +1,147 @@
+import math
+import statistics
+import unittest
+from datetime import datetime
+
+import numpy as np
+from pony.orm import db_session
+
+import analytics
+from entities import db, User, Broker, Account, Strategy, Trade
+
+
+def build_trades(profits, values=None, results=None, hours=None, result_balances=None):
+    size = len(profits)
+    hours = range(size) if hours is None else hours
+
+    return analytics.Trades(
+        profit=np.array(profits, dtype=np.float64),
+        value=np.array(values or [0.0] * size, dtype=np.float64),
+        result=np.array(results or np.sign(profits), dtype=np.int8),
+        created_at=np.array([hour * 3600 for hour in hours]).astype("datetime64[s]"),
+        result_balance=np.array(result_balances or [np.nan] * size, dtype=np.float64),
+    )
+
+
+class TestMetrics(unittest.TestCase):
+    def test_drawdown(self):
+        trades = build_trades([10.0, -5.0, -10.0, 20.0, -1.0])
+
+        self.assertEqual(
+            analytics.drawdown(trades, 100.0),
+            {
+                "max_drawdown": 15.0,
+                "max_drawdown_percent": 15.0 / 110.0,
+                "max_drawdown_trades": 2,
+                "max_drawdown_duration": 7200,
+            },
+        )
+
+    def test_drawdown_from_the_start(self):
+        trades = build_trades([-10.0, -10.0, 5.0])
+
+        result = analytics.drawdown(trades, 100.0)
+
+        self.assertEqual(result["max_drawdown"], 20.0)
+        self.assertEqual(result["max_drawdown_trades"], 3)
+
+    def test_streaks(self):
+        trades = build_trades([1.0, 1.0, -1.0, 0.0, -1.0, -1.0, -1.0, 1.0, 1.0, 1.0, 1.0])
+
+        self.assertEqual(
+            analytics.streaks(trades), {"longest_win_streak": 4, "longest_loss_streak": 3}
+        )
+
+    def test_ratios(self):
+        returns = np.array([0.1, -0.05, 0.02, np.nan])
+
+        result = analytics.ratios(returns)
+
+        mean = statistics.mean([0.1, -0.05, 0.02])
+        downside_deviation = math.sqrt(0.05**2 / 3)
+
+        self.assertAlmostEqual(result["sharpe_ratio"], mean / statistics.stdev([0.1, -0.05, 0.02]))
+        self.assertAlmostEqual(result["sortino_ratio"], mean / downside_deviation)
+
+    def test_risk_exceeded(self):
+        trades = build_trades([10.0, -5.0, -10.0, 20.0], values=[5.0, 5.0, 20.0, 12.0])
+
+        result = analytics.metrics(trades, initial_balance=100.0, risk=10)
+
+        self.assertEqual(result["risk_exceeded"], 0.5)
+
+    def test_strategy_balances(self):
+        trades = build_trades([10.0, -5.0], values=[5.0, 5.0], result_balances=[60.0, np.nan])
+
+        result = analytics.metrics(trades, risk=10)
+
+        self.assertEqual(result["risk_exceeded"], 0.0)
+
+    def test_no_trades(self):
+        result = analytics.metrics(build_trades([]), initial_balance=100.0, risk=10)
+
+        self.assertEqual(result["trades"], 0)
+        self.assertEqual(result["max_drawdown"], 0.0)
+        self.assertEqual(result["longest_win_streak"], 0)
+        self.assertIsNone(result["sharpe_ratio"])
+        self.assertIsNone(result["risk_exceeded"])
+
+
+class TestLoadTrades(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(uid="4d5e6f7a-8b9c-4d0e-9f1a-2b3c4d5e6f7a", encrypted_password="123456")
+        broker = Broker(name="Broker", user=user)
+        account = Account(
+            type_account="R", currency="USD", initial_balance=100.0, broker=broker, user=user
+        )
+        strategy = Strategy(name="Strategy", user=user)
+
+        for profit, result, day in ((10.0, True, 2), (-5.0, False, 1), (None, None, 3)):
+            Trade(
+                value=10.0,
+                profit=profit,
+                result=result,
+                account=account,
+                user=user,
+                strategy=strategy,
+                created_at=datetime(2022, 3, day),
+            )
+
+        db.flush()
+        self.account_id = account.id
+        self.strategy_id = strategy.id
+
+    @db_session
+    def tearDown(self):
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    @db_session
+    def test_load_trades(self):
+        trades = analytics.load_trades(account_id=self.account_id)
+
+        self.assertEqual(len(trades), 3)
+        self.assertEqual(trades.profit.tolist(), [-5.0, 10.0, 0.0])
+        self.assertEqual(trades.result.tolist(), [-1, 1, 0])
+        self.assertEqual(
+            trades.created_at[0], np.datetime64(datetime(2022, 3, 1)).astype("datetime64[s]")
+        )
+
+    @db_session
+    def test_load_trades_filters(self):
+        trades = analytics.load_trades(
+            strategy_id=self.strategy_id, start=datetime(2022, 3, 2), end=datetime(2022, 3, 3)
+        )
+
+        self.assertEqual(trades.profit.tolist(), [10.0])
+        self.assertEqual(analytics.opening_balance(self.account_id, datetime(2022, 3, 2)), 95.0)
+
+    @db_session
+    def test_load_no_trades(self):
+        trades = analytics.load_trades(account_id=self.account_id, start=datetime(2023, 1, 1))
+
+        self.assertEqual(len(trades), 0)
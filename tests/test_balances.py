@@ -0,0 +1,148 @@
+import unittest
+from datetime import datetime
+
+from pony.orm import db_session
+
+import balances
+from entities import db, User, Broker, Account, Strategy, Trade
+
+
+class TestBalances(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(uid="3b0f6a7e-8c1d-4e2f-9a3b-4c5d6e7f8a9b", encrypted_password="123456")
+        broker = Broker(name="Broker", user=user)
+        account = Account(
+            type_account="R",
+            currency="USD",
+            initial_balance=100.0,
+            current_balance=100.0,
+            broker=broker,
+            user=user,
+        )
+        strategy = Strategy(name="Strategy", user=user)
+        db.flush()
+
+        self.account_id = account.id
+        self.user_id = user.id
+        self.strategy_id = strategy.id
+
+    @db_session
+    def tearDown(self):
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    def create_trade(self, profit, day):
+        trade = Trade(
+            value=10.0,
+            profit=profit,
+            result=profit > 0,
+            account=self.account_id,
+            user=self.user_id,
+            strategy=self.strategy_id,
+            created_at=datetime(2022, 3, day),
+        )
+        trade.flush()
+        balances.recompute_from(self.account_id, trade.created_at, trade.id)
+
+        return trade.id
+
+    @db_session
+    def get_balances(self):
+        trades = Trade.select(lambda trade: trade.account.id == self.account_id)
+        trades = trades.order_by(Trade.created_at, Trade.id)
+
+        return (
+            [trade.result_balance for trade in trades],
+            Account[self.account_id].current_balance,
+        )
+
+    def test_trades_in_order(self):
+        with db_session:
+            self.create_trade(10.0, 1)
+            self.create_trade(-5.5, 2)
+            self.create_trade(20.0, 3)
+
+        self.assertEqual(self.get_balances(), ([110.0, 104.5, 124.5], 124.5))
+
+    def test_backdated_trade(self):
+        with db_session:
+            self.create_trade(10.0, 2)
+            self.create_trade(20.0, 3)
+            self.create_trade(-5.0, 1)
+
+        self.assertEqual(self.get_balances(), ([95.0, 105.0, 125.0], 125.0))
+
+    def test_recompute_after_edit_and_delete(self):
+        with db_session:
+            first = self.create_trade(10.0, 1)
+            second = self.create_trade(20.0, 2)
+            self.create_trade(30.0, 3)
+
+        with db_session:
+            trade = Trade[second]
+            trade.profit = -20.0
+            balances.recompute_from(self.account_id, trade.created_at, trade.id)
+
+        self.assertEqual(self.get_balances(), ([110.0, 90.0, 120.0], 120.0))
+
+        with db_session:
+            trade = Trade[first]
+            created_at = trade.created_at
+            trade.delete()
+            balances.recompute_from(self.account_id, created_at, first)
+
+        self.assertEqual(self.get_balances(), ([80.0, 110.0], 110.0))
+
+    def test_recompute_only_touches_later_trades(self):
+        with db_session:
+            self.create_trade(10.0, 1)
+            second = self.create_trade(20.0, 2)
+
+        with db_session:
+            Trade.select(lambda trade: trade.id != second).first().result_balance = 0.0
+
+        with db_session:
+            balances.recompute_from(self.account_id, datetime(2022, 3, 2), second)
+
+        self.assertEqual(self.get_balances(), ([0.0, 20.0], 20.0))
+
+    def test_check_and_repair(self):
+        with db_session:
+            trade_id = self.create_trade(10.0, 1)
+            self.create_trade(20.0, 2)
+
+        with db_session:
+            self.assertEqual(balances.check(self.account_id), [])
+
+        with db_session:
+            Trade[trade_id].result_balance = 0.0
+            Account[self.account_id].current_balance = 0.0
+
+        with db_session:
+            differences = balances.check(repair=True)
+
+        self.assertEqual(
+            differences,
+            [
+                {
+                    "account_id": self.account_id,
+                    "trade_id": None,
+                    "stored": 0.0,
+                    "expected": 130.0,
+                },
+                {
+                    "account_id": self.account_id,
+                    "trade_id": trade_id,
+                    "stored": 0.0,
+                    "expected": 110.0,
+                },
+            ],
+        )
+        self.assertEqual(self.get_balances(), ([110.0, 130.0], 130.0))
+
+        with db_session:
+            self.assertEqual(balances.check(self.account_id), [])
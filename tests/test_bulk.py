@@ -0,0 +1,123 @@
+import csv
+import io
+import unittest
+from datetime import datetime
+
+import bulk
+
+STRATEGY_UID = "9d1e1b2e-2f40-4f0f-9b35-0d2f5a0f6c3a"
+
+
+class TestReadRows(unittest.TestCase):
+    def test_ndjson(self):
+        body = f'{{"strategy_uid": "{STRATEGY_UID}", "value": 10}}\n' "\n" "not json\n" "[1, 2]\n"
+
+        rows = list(bulk.read_rows(body, "application/x-ndjson"))
+
+        self.assertEqual(rows[0], (1, {"strategy_uid": STRATEGY_UID, "value": 10}))
+        self.assertEqual(rows[1][0], 3)
+        self.assertEqual(str(rows[1][1]), "Invalid JSON")
+        self.assertEqual(rows[2][0], 4)
+        self.assertEqual(str(rows[2][1]), "Row must be a JSON object")
+
+    def test_csv(self):
+        body = f"strategy_uid,value,result\n{STRATEGY_UID},10.5,true\n{STRATEGY_UID},,\n"
+
+        rows = list(bulk.read_rows(body, "text/csv; charset=utf-8"))
+
+        self.assertEqual(
+            rows,
+            [
+                (2, {"strategy_uid": STRATEGY_UID, "value": "10.5", "result": "true"}),
+                (3, {"strategy_uid": STRATEGY_UID, "value": "", "result": ""}),
+            ],
+        )
+
+    def test_parsed_body(self):
+        rows = list(bulk.read_rows({"strategy_uid": STRATEGY_UID}))
+
+        self.assertEqual(rows, [(1, {"strategy_uid": STRATEGY_UID})])
+
+
+class TestParseTrades(unittest.TestCase):
+    def test_valid_rows(self):
+        rows = [
+            (1, {"strategy_uid": STRATEGY_UID, "value": "10", "profit": "8.7", "result": "true"}),
+            (2, {"strategy_uid": STRATEGY_UID, "created_at": "2022-03-01T12:00:00"}),
+        ]
+
+        batch = bulk.parse_trades(rows)
+
+        self.assertEqual(batch.size, 2)
+        self.assertEqual(batch.errors, [])
+
+        first, second = csv.reader(io.StringIO(batch.buffer.getvalue()))
+
+        self.assertEqual(first[0], "1")
+        self.assertEqual(first[2:7], ["10.0", "8.7", "True", "T", STRATEGY_UID])
+        self.assertEqual(second[0], "2")
+        self.assertEqual(second[2:], ["", "", "", "T", STRATEGY_UID, "2022-03-01T12:00:00"])
+
+    def test_mixed_time_zones(self):
+        rows = [
+            (1, {"strategy_uid": STRATEGY_UID, "created_at": "2022-03-01T12:00:00"}),
+            (2, {"strategy_uid": STRATEGY_UID, "created_at": "2022-03-01T12:00:00+03:00"}),
+        ]
+
+        batch = bulk.parse_trades(rows)
+        first, second = csv.reader(io.StringIO(batch.buffer.getvalue()))
+
+        self.assertEqual(batch.errors, [])
+        self.assertEqual(batch.earliest, datetime(2022, 3, 1, 9))
+        self.assertEqual(second[-1], "2022-03-01T09:00:00")
+
+    def test_invalid_rows_are_reported(self):
+        rows = [
+            (1, ValueError("Invalid JSON")),
+            (2, {"value": 10}),
+            (3, {"strategy_uid": "foo"}),
+            (4, {"strategy_uid": STRATEGY_UID, "value": "ten"}),
+            (5, {"strategy_uid": STRATEGY_UID, "result": "maybe"}),
+            (6, {"strategy_uid": STRATEGY_UID, "profit": 10**9}),
+            (7, {"strategy_uid": STRATEGY_UID, "created_at": "yesterday"}),
+            (8, {"strategy_uid": STRATEGY_UID, "value": "nan"}),
+            (9, {"strategy_uid": STRATEGY_UID, "profit": float("nan")}),
+            (10, {"strategy_uid": STRATEGY_UID, "value": "-inf"}),
+            (11, {"strategy_uid": STRATEGY_UID, "profit": 99999999.995}),
+            (12, {"strategy_uid": STRATEGY_UID, "profit": "99999999.99"}),
+        ]
+
+        batch = bulk.parse_trades(rows)
+
+        self.assertEqual(batch.size, 1)
+        self.assertEqual(
+            [error["line"] for error in batch.errors], [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
+        )
+        self.assertEqual(batch.errors[2]["message"], "'strategy_uid' must be a valid UUID")
+        self.assertEqual(batch.errors[3]["message"], "'value' must be a number")
+        self.assertEqual(batch.errors[4]["message"], "'result' must be a boolean")
+        self.assertEqual(batch.errors[5]["message"], "'profit' is out of range")
+        self.assertEqual(batch.errors[6]["message"], "'created_at' must be an ISO 8601 datetime")
+        self.assertEqual(batch.errors[7]["message"], "'value' must be a finite number")
+        self.assertEqual(batch.errors[8]["message"], "'profit' must be a finite number")
+        self.assertEqual(batch.errors[9]["message"], "'value' must be a finite number")
+        self.assertEqual(batch.errors[10]["message"], "'profit' is out of range")
+
+
+class TestNormalizeRow(unittest.TestCase):
+    def test_drops_empty_values(self):
+        data = bulk.normalize_row(
+            {"strategy_uid": STRATEGY_UID, "value": "", "result": "0", "created_at": None}
+        )
+
+        self.assertEqual(data, {"strategy_uid": STRATEGY_UID, "result": False})
+
+    def test_converts_datetimes(self):
+        data = bulk.normalize_row({"updated_at": "2022-03-01T12:00:00"})
+
+        self.assertEqual(data["updated_at"], datetime(2022, 3, 1, 12))
+
+    def test_converts_aware_datetimes_to_utc(self):
+        data = bulk.normalize_row({"created_at": "2022-03-01T12:00:00-03:00"})
+
+        self.assertEqual(data["created_at"], datetime(2022, 3, 1, 15))
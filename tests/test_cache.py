@@ -0,0 +1,106 @@
+import unittest
+
+import cache
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.cache = cache.LRUCache(maxsize=2, clock=self.clock)
+
+    def test_get_missing_key(self):
+        self.assertIsNone(self.cache.get("missing"))
+        self.assertEqual(self.cache.get("missing", "default"), "default")
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_set_and_get(self):
+        self.cache.set("key", "value")
+
+        self.assertEqual(self.cache.get("key"), "value")
+        self.assertEqual(self.cache.hits, 1)
+        self.assertIn("key", self.cache)
+
+    def test_evicts_least_recently_used(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("c"), 3)
+
+    def test_entry_expires_at(self):
+        self.cache.set("key", "value", expires_at=1010.0)
+
+        self.clock.now = 1009.9
+        self.assertEqual(self.cache.get("key"), "value")
+
+        self.clock.now = 1010.0
+        self.assertIsNone(self.cache.get("key"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_default_ttl(self):
+        ttl_cache = cache.LRUCache(maxsize=10, ttl=5, clock=self.clock)
+        ttl_cache.set("key", "value")
+        ttl_cache.set("short", "value", ttl=1)
+
+        self.clock.now += 1
+        self.assertIsNone(ttl_cache.get("short"))
+        self.assertEqual(ttl_cache.get("key"), "value")
+
+        self.clock.now += 4
+        self.assertIsNone(ttl_cache.get("key"))
+
+    def test_disabled_cache(self):
+        disabled = cache.LRUCache(maxsize=0)
+        disabled.set("key", "value")
+
+        self.assertIsNone(disabled.get("key"))
+        self.assertEqual(len(disabled), 0)
+
+    def test_delete_and_clear(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.delete("a")
+
+        self.assertIsNone(self.cache.get("a"))
+
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertDictEqual(
+            self.cache.stats,
+            {
+                "hits": 0,
+                "misses": 0,
+                "size": 0,
+                "hit_ratio": 0.0,
+                "average_load_time": 0.0,
+                "time_saved": 0.0,
+            },
+        )
+
+    def test_time_saved(self):
+        self.cache.record_load(0.004)
+        self.cache.record_load(0.002)
+        self.cache.set("key", "value")
+        self.cache.get("key")
+        self.cache.get("key")
+        self.cache.get("missing")
+
+        stats = self.cache.stats
+
+        self.assertAlmostEqual(stats["average_load_time"], 0.003)
+        self.assertAlmostEqual(stats["time_saved"], 0.006)
+        self.assertAlmostEqual(stats["hit_ratio"], 2 / 3)
@@ -0,0 +1,64 @@
+import json
+import unittest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import encoding
+
+PAYLOAD = {
+    "accounts": [
+        {
+            "uid": UUID("26e369c9-b2db-44cd-9c1c-0c679a92cc40"),
+            "type_account": "R",
+            "currency": "BRL",
+            "initial_balance": 100.0,
+            "current_balance": None,
+            "profit": Decimal("12.50"),
+            "ratio": 0.1,
+            "trades": 3,
+            "broker": {"name": "Corretora São Paulo"},
+            "created_at": datetime(2022, 3, 1, 12, 30, 15, 123456),
+            "updated_at": datetime(2022, 3, 2, 8, 0, tzinfo=timezone.utc),
+            "day": date(2022, 3, 1),
+            "active": True,
+        }
+    ],
+    "types": {"R": 1},
+    "next": None,
+}
+
+GOLDEN = (
+    '{"accounts":[{"uid":"26e369c9-b2db-44cd-9c1c-0c679a92cc40","type_account":"R",'
+    '"currency":"BRL","initial_balance":100.0,"current_balance":null,"profit":12.5,'
+    '"ratio":0.1,"trades":3,"broker":{"name":"Corretora São Paulo"},'
+    '"created_at":"2022-03-01T12:30:15.123456","updated_at":"2022-03-02T08:00:00+00:00",'
+    '"day":"2022-03-01","active":true}],"types":{"R":1},"next":null}'
+)
+
+
+class TestEncoding(unittest.TestCase):
+    def test_stdlib_golden_output(self):
+        self.assertEqual(encoding.dumps_stdlib(PAYLOAD), GOLDEN)
+
+    @unittest.skipIf(encoding.orjson is None, "orjson is not installed")
+    def test_orjson_golden_output(self):
+        self.assertEqual(encoding.dumps_orjson(PAYLOAD), GOLDEN)
+
+    def test_output_round_trips(self):
+        account = json.loads(encoding.dumps(PAYLOAD))["accounts"][0]
+
+        self.assertEqual(account["uid"], "26e369c9-b2db-44cd-9c1c-0c679a92cc40")
+        self.assertEqual(account["profit"], 12.5)
+
+    def test_unknown_types_fail(self):
+        for dumps in (encoding.dumps_stdlib, encoding.dumps):
+            with self.subTest(dumps=dumps.__name__):
+                with self.assertRaises(TypeError):
+                    dumps({"value": object()})
+
+    def test_encode_response(self):
+        self.assertEqual(encoding.encode_response({"a": 1}), '{"a":1}')
+        self.assertEqual(encoding.encode_response((201, {"a": 1})), (201, '{"a":1}'))
+        self.assertEqual(encoding.encode_response((204, None)), (204, None))
+        self.assertEqual(encoding.encode_response('{"a":1}'), '{"a":1}')
@@ -0,0 +1,91 @@
+import unittest
+from datetime import datetime, timedelta
+
+from pony.orm import db_session
+
+import equity
+from entities import db, User, Broker, Account, Strategy, Trade
+
+
+def build_points(values):
+    start = datetime(2022, 3, 1)
+    return [(start + timedelta(hours=hour), float(value)) for hour, value in enumerate(values)]
+
+
+class TestDownsample(unittest.TestCase):
+    def test_keeps_points_below_threshold(self):
+        points = build_points([1, 2, 3])
+
+        self.assertEqual(list(equity.downsample(iter(points), 3, 10)), points)
+
+    def test_keeps_first_last_and_extremes(self):
+        values = [0] * 100
+        values[30] = 50
+        values[70] = -50
+        points = build_points(values)
+
+        result = list(equity.downsample(iter(points), len(points), 4))
+
+        self.assertEqual(result, [points[0], points[30], points[70], points[-1]])
+
+    def test_threshold_size(self):
+        points = build_points(range(1000))
+
+        for threshold in (3, 10, 333, 999):
+            with self.subTest(threshold=threshold):
+                result = list(equity.downsample(iter(points), len(points), threshold))
+
+                self.assertEqual(len(result), threshold)
+                self.assertEqual(result, sorted(result))
+                self.assertEqual((result[0], result[-1]), (points[0], points[-1]))
+
+    def test_fewer_points_than_counted(self):
+        points = build_points(range(50))
+
+        result = list(equity.downsample(iter(points), 60, 10))
+
+        self.assertEqual((result[0], result[-1]), (points[0], points[-1]))
+
+
+class TestStreamPoints(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(uid="9f8e7d6c-5b4a-4392-8170-6f5e4d3c2b1a", encrypted_password="123456")
+        broker = Broker(name="Broker", user=user)
+        account = Account(
+            type_account="R", currency="USD", initial_balance=100.0, broker=broker, user=user
+        )
+        strategy = Strategy(name="Strategy", user=user)
+
+        for profit, day in ((10.0, 2), (-5.0, 1), (None, 3)):
+            Trade(
+                value=10.0,
+                profit=profit,
+                account=account,
+                user=user,
+                strategy=strategy,
+                created_at=datetime(2022, 3, day),
+            )
+
+        db.flush()
+        self.account_id = account.id
+
+    @db_session
+    def tearDown(self):
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    @db_session
+    def test_stream_points(self):
+        self.assertEqual(equity.count_points(self.account_id), 3)
+        self.assertEqual(
+            list(equity.stream_points(self.account_id)),
+            [
+                (datetime(2022, 3, 1), 95.0),
+                (datetime(2022, 3, 2), 105.0),
+                (datetime(2022, 3, 3), 105.0),
+            ],
+        )
@@ -0,0 +1,85 @@
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+
+from pony.orm import db_session
+
+import etags
+from entities import db, User, Broker, Account
+
+
+class TestEtags(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(encrypted_password="123456")
+        broker = Broker(name="Broker", user=user, updated_at=datetime(2022, 1, 1))
+        account = Account(
+            type_account="R",
+            currency="USD",
+            initial_balance=100.0,
+            broker=broker,
+            user=user,
+            updated_at=datetime(2022, 1, 2),
+        )
+        db.flush()
+
+        self.user_id = user.id
+        self.account_uid = str(account.uid)
+
+    @db_session
+    def tearDown(self):
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    @db_session
+    def test_fingerprint_follows_count_and_updated_at(self):
+        state = etags.fingerprint(self.user_id, ("brokers", "accounts"))
+
+        self.assertIn("2022-01-02", state)
+        self.assertEqual(state, etags.fingerprint(self.user_id, ("brokers", "accounts")))
+
+        db.execute("UPDATE brokers SET updated_at = '2022-01-03' WHERE user_id = $(self.user_id)")
+        updated_state = etags.fingerprint(self.user_id, ("brokers", "accounts"))
+
+        self.assertNotEqual(state, updated_state)
+
+        db.execute("DELETE FROM accounts WHERE user_id = $(self.user_id)")
+
+        self.assertNotEqual(updated_state, etags.fingerprint(self.user_id, ("brokers", "accounts")))
+
+    @db_session
+    def test_fingerprint_by_uid(self):
+        state = etags.fingerprint(self.user_id, ("accounts",), self.account_uid)
+        other_state = etags.fingerprint(
+            self.user_id, ("accounts",), "17f95d8b-a039-47e5-9478-e4dceb78010f"
+        )
+
+        self.assertNotEqual(state, other_state)
+
+    def test_build_depends_on_path_and_query(self):
+        request = SimpleNamespace(path={"uuid": "a"}, query={"limit": "1"})
+        etag = etags.build("state", request)
+
+        self.assertRegex(etag, r'^"[0-9a-f]{32}"$')
+        self.assertEqual(etag, etags.build("state", request))
+        self.assertNotEqual(etag, etags.build("other", request))
+
+        request.query = {"limit": "2"}
+
+        self.assertNotEqual(etag, etags.build("state", request))
+
+    def test_matches(self):
+        cases = (
+            (None, False),
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"xyz", "abc"', True),
+            ("*", True),
+            ('"xyz"', False),
+            ("abc", False),
+        )
+
+        for header, expected in cases:
+            with self.subTest(header=header):
+                self.assertEqual(etags.matches(header, '"abc"'), expected)
@@ -0,0 +1,100 @@
+import csv
+import io
+import json
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+import exports
+
+ROWS = [
+    (
+        "26e369c9-b2db-44cd-9c1c-0c679a92cc40",
+        "6d7e8f90-1a2b-4c3d-8e4f-5a6b7c8d9e51",
+        "7e8f9a0b-1c2d-4e3f-9a4b-5c6d7e8f9a61",
+        10.0,
+        8.5,
+        True,
+        108.5,
+        "T",
+        datetime(2022, 3, 1, 10, 30),
+    ),
+    (
+        "3b1f5c2e-8d4a-4e6b-9f7c-1a2b3c4d5e6f",
+        "6d7e8f90-1a2b-4c3d-8e4f-5a6b7c8d9e51",
+        "7e8f9a0b-1c2d-4e3f-9a4b-5c6d7e8f9a61",
+        None,
+        -5.0,
+        False,
+        None,
+        "T",
+        datetime(2022, 3, 2),
+    ),
+]
+
+
+class TestChunks(unittest.TestCase):
+    def test_ndjson(self):
+        chunks = list(exports.ndjson_chunks([ROWS[:1], ROWS[1:]]))
+        lines = "".join(chunks).splitlines()
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(
+            json.loads(lines[0]),
+            {
+                "uid": "26e369c9-b2db-44cd-9c1c-0c679a92cc40",
+                "account_uid": "6d7e8f90-1a2b-4c3d-8e4f-5a6b7c8d9e51",
+                "strategy_uid": "7e8f9a0b-1c2d-4e3f-9a4b-5c6d7e8f9a61",
+                "value": 10.0,
+                "profit": 8.5,
+                "result": True,
+                "result_balance": 108.5,
+                "type_trade": "T",
+                "created_at": "2022-03-01T10:30:00",
+            },
+        )
+        self.assertIsNone(json.loads(lines[1])["value"])
+
+    def test_csv(self):
+        content = "".join(exports.csv_chunks([ROWS[:1], ROWS[1:]]))
+        rows = list(csv.DictReader(io.StringIO(content)))
+
+        self.assertEqual(content.splitlines()[0], ",".join(exports.FIELDS))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["result"], "true")
+        self.assertEqual(rows[0]["created_at"], "2022-03-01T10:30:00")
+        self.assertEqual(rows[1]["value"], "")
+        self.assertEqual(rows[1]["result"], "false")
+
+    def test_csv_without_trades(self):
+        self.assertEqual("".join(exports.csv_chunks([])), ",".join(exports.FIELDS) + "\n")
+
+
+class TestWrite(unittest.TestCase):
+    @patch("exports.stream_trades", return_value=iter([ROWS[:1], ROWS[1:]]))
+    def test_write_counts_rows(self, stream_trades):
+        file = io.BytesIO()
+
+        self.assertEqual(exports.write(1, "ndjson", file), 2)
+        self.assertEqual(len(file.getvalue().splitlines()), 2)
+        stream_trades.assert_called_once_with(1)
+
+    @patch("exports.stream_trades", return_value=iter([ROWS[:1], ROWS[1:]]))
+    def test_write_stops_after_max_bytes(self, stream_trades):
+        file = io.BytesIO()
+
+        self.assertEqual(exports.write(1, "ndjson", file, max_bytes=10), 1)
+        self.assertEqual(len(file.getvalue().splitlines()), 1)
+
+
+class TestLocalStore(unittest.TestCase):
+    def test_put(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = exports.LocalStore(directory)
+            store.put("exports/user/trades.csv", io.BytesIO(b"uid\n"), "text/csv")
+            location = store.location("exports/user/trades.csv")
+
+            self.assertEqual(Path(urlparse(location).path).read_bytes(), b"uid\n")
@@ -0,0 +1,57 @@
+import unittest
+from datetime import datetime
+
+import filters
+
+
+class TestToUuid(unittest.TestCase):
+    def test_normalizes_valid_uuids(self):
+        uid = "26E369C9-B2DB-44CD-9C1C-0C679A92CC40"
+
+        self.assertEqual(filters.to_uuid(uid), uid.lower())
+
+    def test_invalid_uuids(self):
+        for value in (None, "", "foo"):
+            with self.subTest(value=value):
+                self.assertIsNone(filters.to_uuid(value))
+
+
+class TestGetDateRange(unittest.TestCase):
+    def test_no_range(self):
+        self.assertEqual(filters.get_date_range({}), (None, None))
+
+    def test_dates_include_the_whole_last_day(self):
+        start, end = filters.get_date_range({"from": "2022-03-01", "to": "2022-03-31"})
+
+        self.assertEqual(start, datetime(2022, 3, 1))
+        self.assertEqual(end, datetime(2022, 4, 1))
+
+    def test_datetimes(self):
+        start, end = filters.get_date_range(
+            {"from": "2022-03-01T10:00:00", "to": "2022-03-01T12:30:00"}
+        )
+
+        self.assertEqual(start, datetime(2022, 3, 1, 10))
+        self.assertEqual(end, datetime(2022, 3, 1, 12, 30))
+
+    def test_invalid_date(self):
+        with self.assertRaisesRegex(ValueError, "'from' must be an ISO 8601 date or datetime"):
+            filters.get_date_range({"from": "yesterday"})
+
+    def test_empty_range(self):
+        with self.assertRaisesRegex(ValueError, "'from' must be before 'to'"):
+            filters.get_date_range({"from": "2022-03-02", "to": "2022-03-01"})
+
+
+class TestGetBaseCurrency(unittest.TestCase):
+    def test_without_base(self):
+        self.assertIsNone(filters.get_base_currency({}))
+
+    def test_base(self):
+        self.assertEqual(filters.get_base_currency({"base": "usd"}), "USD")
+
+    def test_invalid_base(self):
+        for base in ("", "US", "US1", "DOLLAR"):
+            with self.subTest(base=base):
+                with self.assertRaisesRegex(ValueError, "'base' must be a 3-letter currency code"):
+                    filters.get_base_currency({"base": base})
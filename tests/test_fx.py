@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+from pony.orm import db_session
+
+import fx
+from entities import FxRate
+from queries import count_queries
+
+
+class TestFx(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        fx.store_rates({"USD": 1.0, "EUR": 1.1, "brl": 0.2})
+
+    @db_session
+    def tearDown(self):
+        FxRate.select().delete(bulk=True)
+        fx.rates_cache.clear()
+
+    @db_session
+    def test_get_rates_is_cached(self):
+        with count_queries() as counter:
+            rates = fx.get_rates()
+            fx.get_rates()
+
+        self.assertEqual(rates, {"USD": 1.0, "EUR": 1.1, "BRL": 0.2})
+        self.assertEqual(counter.selects("fx_rates"), 1, counter.stats)
+
+    @db_session
+    def test_store_rates_updates_and_invalidates(self):
+        fx.get_rates()
+        fx.store_rates({"EUR": 1.2, "GBP": 1.3})
+
+        self.assertEqual(fx.get_rates(), {"USD": 1.0, "EUR": 1.2, "BRL": 0.2, "GBP": 1.3})
+
+    @db_session
+    def test_get_factors(self):
+        factors = fx.get_factors(["usd", "EUR"], "BRL")
+
+        self.assertAlmostEqual(factors["usd"], 5.0)
+        self.assertAlmostEqual(factors["EUR"], 5.5)
+
+    @db_session
+    def test_missing_rate(self):
+        for currencies, base in ((["USD", "XYZ", "ABC"], "EUR"), (["USD"], "XYZ")):
+            with self.subTest(currencies=currencies, base=base):
+                with self.assertRaises(fx.MissingRateError) as context:
+                    fx.get_factors(currencies, base)
+
+                self.assertEqual(
+                    context.exception.currencies, sorted({"ABC", "XYZ"} & {*currencies, base})
+                )
+
+    @db_session
+    def test_convert(self):
+        amounts = np.array([[10.0, 20.0, 30.0], [1.0, 2.0, 3.0]])
+
+        converted = fx.convert(amounts, ["USD", "EUR", "USD"], "USD")
+
+        np.testing.assert_allclose(converted, [[10.0, 22.0, 30.0], [1.0, 2.2, 3.0]])
+        np.testing.assert_array_equal(fx.convert(amounts, ["USD", "EUR", "USD"], None), amounts)
+        self.assertEqual(fx.convert(np.zeros(0), [], "EUR").shape, (0,))
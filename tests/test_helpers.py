@@ -1,12 +1,14 @@
 import json
 import unittest
 from datetime import datetime
+from uuid import UUID
 
 from pony.orm import db_session
 from serpens import api
 
 import helpers
-from entities import User
+from entities import User, user_ids
+from queries import count_queries
 
 
 class TestAuthorized(unittest.TestCase):
@@ -28,6 +30,9 @@ class TestAuthorized(unittest.TestCase):
     def tearDownClass(cls):
         User.select().delete()
 
+    def setUp(self):
+        user_ids.clear()
+
     def test_authorize_with_user_uuid(self):
         with db_session:
             event = {
@@ -68,11 +73,7 @@ class TestAuthorized(unittest.TestCase):
         expected = {
             "headers": {"Access-Control-Allow-Origin": "*"},
             "statusCode": 401,
-            "body": json.dumps(
-                {
-                    "message": "Unauthorized",
-                }
-            ),
+            "body": '{"message":"Unauthorized"}',
         }
 
         @helpers.authorized
@@ -81,3 +82,92 @@ class TestAuthorized(unittest.TestCase):
 
         response = handler(event, {})
         self.assertDictEqual(response, expected)
+
+    def test_user_identity_is_cached(self):
+        event = {
+            "requestContext": {
+                "authorizer": {
+                    "sub": "auth0",
+                    "user_uuid": "802bee76-78f6-4113-a8a5-8562df5a2901",
+                }
+            }
+        }
+
+        @helpers.authorized
+        def handler(request: api.Request):
+            return {"user_id": request.user_id}
+
+        first = handler(event, {})
+
+        with count_queries() as counter:
+            second = handler(event, {})
+
+        self.assertEqual(first["body"], second["body"])
+        self.assertEqual(counter.selects("users"), 0)
+        self.assertEqual(user_ids.hits, 1)
+        self.assertEqual(user_ids.misses, 1)
+
+    def test_unknown_user_is_cached(self):
+        event = {
+            "requestContext": {
+                "authorizer": {"sub": "auth0", "user_uuid": "3e4b4c1a-6a53-4b43-9a0c-0b8a8f7c2d10"}
+            }
+        }
+
+        @helpers.authorized
+        def handler(request):
+            return {}
+
+        handler(event, {})
+
+        with count_queries() as counter:
+            response = handler(event, {})
+
+        self.assertEqual(response["statusCode"], 401)
+        self.assertEqual(counter.selects("users"), 0)
+
+    def test_created_user_replaces_cached_miss(self):
+        user_uuid = "0d3c9c7e-27a5-4d0c-8a48-6f0e2f7f9b21"
+        self.assertIsNone(User.get_id_by_uid(user_uuid))
+
+        with db_session:
+            user = User(uid=user_uuid, encrypted_password="123456")
+
+        self.assertEqual(User.get_id_by_uid(user_uuid), user.id)
+
+        with db_session:
+            User[user.id].delete()
+
+        self.assertIsNone(User.get_id_by_uid(user_uuid))
+
+    def test_forget_user(self):
+        user_uuid = "802BEE76-78F6-4113-A8A5-8562DF5A2901"
+        User.get_id_by_uid(user_uuid)
+
+        self.assertIn(user_uuid.lower(), user_ids)
+
+        User.forget(user_uuid)
+
+        self.assertNotIn(user_uuid.lower(), user_ids)
+
+    def test_response_body_is_encoded(self):
+        event = {
+            "requestContext": {
+                "authorizer": {"sub": "auth0", "user_uuid": "802bee76-78f6-4113-a8a5-8562df5a2901"}
+            }
+        }
+
+        @helpers.authorized
+        def handler(request: api.Request):
+            return 201, {
+                "uid": UUID("802bee76-78f6-4113-a8a5-8562df5a2901"),
+                "at": datetime(1970, 1, 1),
+            }
+
+        response = handler(event, {})
+
+        self.assertEqual(response["statusCode"], 201)
+        self.assertEqual(
+            response["body"],
+            '{"uid":"802bee76-78f6-4113-a8a5-8562df5a2901","at":"1970-01-01T00:00:00"}',
+        )
@@ -0,0 +1,199 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock
+from urllib.request import urlopen
+
+import rsa
+from jose import jwk
+
+import jwks
+
+
+def make_jwk(kid, **extra):
+    public_key, _ = rsa.newkeys(512)
+    key = jwk.construct(public_key.save_pkcs1().decode(), "RS256").to_dict()
+    key.update({"kid": kid, "use": "sig"}, **extra)
+
+    return key
+
+
+KEY_1 = make_jwk("key-1")
+KEY_2 = make_jwk("key-2")
+KEY_3 = make_jwk("key-3")
+
+JWKS = {"keys": [KEY_1, KEY_2]}
+
+ROTATED_JWKS = {"keys": [KEY_3]}
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class StubJWKSHandler(BaseHTTPRequestHandler):
+    requests = 0
+
+    def do_GET(self):
+        StubJWKSHandler.requests += 1
+        body = json.dumps(JWKS).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestKeyStore(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.fetcher = MagicMock(return_value=JWKS)
+        self.key_store = jwks.KeyStore(self.fetcher, ttl=60, refresh_interval=10, clock=self.clock)
+
+    def test_get_key_fetches_once_within_ttl(self):
+        first = self.key_store.get_key("key-1")
+        second = self.key_store.get_key("key-2")
+
+        self.assertEqual(first.to_dict()["n"], KEY_1["n"])
+        self.assertEqual(second.to_dict()["n"], KEY_2["n"])
+        self.assertEqual(self.fetcher.call_count, 1)
+        self.assertDictEqual(self.key_store.stats, {"hits": 1, "misses": 1, "refreshes": 1})
+
+    def test_get_key_refetches_after_ttl(self):
+        self.key_store.get_key("key-1")
+        self.clock.now += 60
+        self.key_store.get_key("key-1")
+
+        self.assertEqual(self.fetcher.call_count, 2)
+        self.assertEqual(self.key_store.misses, 2)
+
+    def test_unknown_kid_forces_refresh(self):
+        self.key_store.get_key("key-1")
+        self.fetcher.return_value = ROTATED_JWKS
+        self.clock.now += 10
+
+        key = self.key_store.get_key("key-3")
+
+        self.assertEqual(key.to_dict()["n"], KEY_3["n"])
+        self.assertEqual(self.fetcher.call_count, 2)
+
+    def test_unknown_kid_refresh_is_rate_limited(self):
+        self.key_store.get_key("key-1")
+
+        for _ in range(100):
+            self.assertIsNone(self.key_store.get_key("unknown"))
+
+        self.assertEqual(self.fetcher.call_count, 1)
+
+        self.clock.now += 10
+        self.key_store.get_key("unknown")
+
+        self.assertEqual(self.fetcher.call_count, 2)
+
+    def test_failed_refresh_keeps_previous_keys(self):
+        self.key_store.get_key("key-1")
+        self.fetcher.side_effect = OSError("IdP is down")
+        self.clock.now += 60
+
+        key = self.key_store.get_key("key-1")
+
+        self.assertEqual(key.to_dict()["n"], KEY_1["n"])
+
+    def test_failed_first_fetch_raises(self):
+        self.fetcher.side_effect = OSError("IdP is down")
+
+        with self.assertRaises(OSError):
+            self.key_store.get_key("key-1")
+
+    def test_cache_file_warms_new_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache_file = os.path.join(directory, "jwks.json")
+            key_store = jwks.KeyStore(self.fetcher, ttl=60, cache_file=cache_file, clock=self.clock)
+            key_store.get_key("key-1")
+
+            cold_fetcher = MagicMock(return_value=ROTATED_JWKS)
+            cold_store = jwks.KeyStore(
+                cold_fetcher, ttl=60, cache_file=cache_file, clock=self.clock
+            )
+            key = cold_store.get_key("key-2")
+
+            self.assertEqual(key.to_dict()["n"], KEY_2["n"])
+            self.assertEqual(cold_fetcher.call_count, 0)
+            self.assertEqual(cold_store.hits, 1)
+
+    def test_expired_cache_file_is_refreshed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache_file = os.path.join(directory, "jwks.json")
+            jwks.KeyStore(self.fetcher, ttl=60, cache_file=cache_file, clock=self.clock).get_key(
+                "key-1"
+            )
+            self.clock.now += 60
+
+            cold_fetcher = MagicMock(return_value=ROTATED_JWKS)
+            cold_store = jwks.KeyStore(
+                cold_fetcher, ttl=60, cache_file=cache_file, clock=self.clock
+            )
+
+            self.assertEqual(cold_store.get_key("key-3").to_dict()["n"], KEY_3["n"])
+            self.assertEqual(cold_fetcher.call_count, 1)
+
+    def test_invalid_cache_file_is_ignored(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache_file = os.path.join(directory, "jwks.json")
+
+            with open(cache_file, "w") as file:
+                file.write("not json")
+
+            key_store = jwks.KeyStore(self.fetcher, cache_file=cache_file, clock=self.clock)
+
+            self.assertEqual(key_store.get_key("key-1").to_dict()["n"], KEY_1["n"])
+            self.assertEqual(self.fetcher.call_count, 1)
+
+    def test_stub_jwks_server(self):
+        server = HTTPServer(("127.0.0.1", 0), StubJWKSHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_port}/.well-known/jwks.json"
+
+        try:
+            key_store = jwks.KeyStore(lambda: json.loads(urlopen(url).read()), ttl=60)
+
+            for _ in range(10):
+                self.assertEqual(key_store.get_key("key-1").to_dict()["n"], KEY_1["n"])
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(StubJWKSHandler.requests, 1)
+        self.assertEqual(key_store.hits, 9)
+
+    def test_only_rs256_signing_keys_are_kept(self):
+        self.fetcher.return_value = {
+            "keys": [
+                KEY_1,
+                make_jwk("encryption-key", use="enc"),
+                make_jwk("hs256-key", alg="HS256"),
+                dict(KEY_2, kty="EC"),
+                dict(KEY_3, n="!!!"),
+            ]
+        }
+
+        self.key_store.get_key("key-1")
+
+        self.assertListEqual(list(self.key_store.keys), ["key-1"])
+
+    def test_keys_are_built_once_per_refresh(self):
+        first = self.key_store.get_key("key-1")
+        second = self.key_store.get_key("key-1")
+
+        self.assertIs(first, second)
@@ -0,0 +1,125 @@
+import unittest
+from datetime import datetime
+from uuid import uuid4
+
+from queries import explain, run_migration
+
+TABLES = ("brokers", "accounts", "strategies", "trades")
+
+
+class TestUidIndexes(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        run_migration("0003.add-uid-indexes.sql")
+
+    @classmethod
+    def tearDownClass(cls):
+        run_migration("0003.add-uid-indexes.rollback.sql")
+
+    def test_uid_lookups_use_unique_index(self):
+        for table in ("users",) + TABLES:
+            with self.subTest(table=table):
+                plan = explain(f"SELECT id FROM {table} WHERE uid = $uid", uid=str(uuid4()))
+
+                self.assertRegex(plan, rf"Index (Only )?Scan using index_{table}_on_uid")
+
+    def test_tenant_scoped_lookups_use_uid_indexes(self):
+        for table in TABLES:
+            with self.subTest(table=table):
+                plan = explain(
+                    f"SELECT id FROM {table} WHERE uid = $uid AND user_id = $user_id",
+                    uid=str(uuid4()),
+                    user_id=1,
+                )
+
+                self.assertRegex(
+                    plan, rf"Index (Only )?Scan using index_{table}_on_(user_id_and_)?uid"
+                )
+
+
+class TestKeysetPaginationIndexes(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        run_migration("0004.add-keyset-pagination-indexes.sql")
+
+    @classmethod
+    def tearDownClass(cls):
+        run_migration("0004.add-keyset-pagination-indexes.rollback.sql")
+
+    def test_keyset_pages_use_composite_index(self):
+        for table in ("brokers", "accounts", "strategies"):
+            with self.subTest(table=table):
+                plan = explain(
+                    f"SELECT id FROM {table} WHERE user_id = $user_id "
+                    "AND created_at >= $created_at AND (created_at > $created_at OR id > $id) "
+                    "ORDER BY created_at, id LIMIT 51",
+                    user_id=1,
+                    created_at=datetime(2022, 1, 1),
+                    id=1,
+                )
+
+                self.assertIn(f"index_{table}_on_user_id_and_created_at_and_id", plan)
+
+
+class TestTradesBalanceIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        run_migration("0005.add-trades-balance-index.sql")
+
+    @classmethod
+    def tearDownClass(cls):
+        run_migration("0005.add-trades-balance-index.rollback.sql")
+
+    def test_previous_trade_lookup_uses_composite_index(self):
+        plan = explain(
+            "SELECT result_balance FROM trades WHERE account_id = $account_id "
+            "AND (created_at, id) < ($created_at, $id) ORDER BY created_at DESC, id DESC LIMIT 1",
+            account_id=1,
+            created_at=datetime(2022, 1, 1),
+            id=1,
+        )
+
+        self.assertIn("index_trades_on_account_id_and_created_at_and_id", plan)
+
+
+class TestStrategyStatsIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        run_migration("0006.add-trades-strategy-stats-index.sql")
+
+    @classmethod
+    def tearDownClass(cls):
+        run_migration("0006.add-trades-strategy-stats-index.rollback.sql")
+
+    def test_stats_aggregate_uses_covering_index(self):
+        plan = explain(
+            "SELECT count(*), sum(profit) FILTER (WHERE result) FROM trades "
+            "WHERE strategy_id = $strategy_id AND account_id = $account_id "
+            "AND created_at >= $start AND created_at < $end",
+            strategy_id=1,
+            account_id=1,
+            start=datetime(2022, 1, 1),
+            end=datetime(2022, 2, 1),
+        )
+
+        self.assertIn("index_trades_on_strategy_id_and_created_at", plan)
+
+
+class TestFingerprintIndexes(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        run_migration("0009.add-updated-at-fingerprint-indexes.sql")
+
+    @classmethod
+    def tearDownClass(cls):
+        run_migration("0009.add-updated-at-fingerprint-indexes.rollback.sql")
+
+    def test_fingerprint_uses_updated_at_index(self):
+        for table in ("brokers", "accounts", "strategies"):
+            with self.subTest(table=table):
+                plan = explain(
+                    f"SELECT count(*), max(updated_at) FROM {table} WHERE user_id = $user_id",
+                    user_id=1,
+                )
+
+                self.assertIn(f"index_{table}_on_user_id_and_updated_at", plan)
@@ -0,0 +1,61 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import pagination
+import settings
+
+
+class TestPagination(unittest.TestCase):
+    def test_cursor_round_trip(self):
+        created_at = datetime(2022, 3, 1, 12, 30, 15, 123456)
+        cursor = pagination.encode_cursor(created_at, 42)
+
+        self.assertNotIn("=", cursor)
+        self.assertEqual(pagination.decode_cursor(cursor), (created_at, 42))
+
+    def test_decode_invalid_cursor(self):
+        for cursor in (
+            "not-a-cursor",
+            "W10",
+            pagination.encode_cursor(datetime(2022, 1, 1), 1)[:-3],
+        ):
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(ValueError) as error:
+                    pagination.decode_cursor(cursor)
+
+                self.assertEqual(str(error.exception), "Invalid 'after' cursor")
+
+    @patch.object(settings, "LEGACY_UNPAGINATED_LISTS", True)
+    def test_get_page_legacy_without_params(self):
+        self.assertIsNone(pagination.get_page({}))
+
+    @patch.object(settings, "LEGACY_UNPAGINATED_LISTS", False)
+    @patch.object(settings, "DEFAULT_PAGE_SIZE", 25)
+    def test_get_page_default_size(self):
+        page = pagination.get_page({})
+
+        self.assertEqual(page.limit, 25)
+        self.assertIsNone(page.after)
+
+    def test_get_page_with_cursor(self):
+        cursor = pagination.encode_cursor(datetime(2022, 1, 1), 7)
+        page = pagination.get_page({"limit": "10", "after": cursor})
+
+        self.assertEqual(page.limit, 10)
+        self.assertEqual(page.after, (datetime(2022, 1, 1), 7))
+
+    @patch.object(settings, "MAX_PAGE_SIZE", 100)
+    def test_get_page_invalid_limit(self):
+        cases = (
+            ("abc", "'limit' must be an integer"),
+            ("0", "'limit' must be between 1 and 100"),
+            ("101", "'limit' must be between 1 and 100"),
+        )
+
+        for limit, message in cases:
+            with self.subTest(limit=limit):
+                with self.assertRaises(ValueError) as error:
+                    pagination.get_page({"limit": limit})
+
+                self.assertEqual(str(error.exception), message)
@@ -0,0 +1,151 @@
+import unittest
+from datetime import datetime
+
+from pony.orm import db_session
+
+import fx
+import portfolio
+from entities import db, User, Broker, Account, Strategy, Trade, FxRate
+from queries import count_queries
+
+
+class TestPortfolio(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(encrypted_password="123456")
+        other_user = User(encrypted_password="123456")
+        first_broker = Broker(name="A Broker", user=user)
+        second_broker = Broker(name="B Broker", user=user)
+        Broker(name="C Broker", user=user)
+        strategy = Strategy(name="Strategy", user=user)
+        accounts = [
+            Account(
+                type_account=type_account,
+                currency=currency,
+                initial_balance=initial_balance,
+                current_balance=current_balance,
+                broker=broker,
+                user=user,
+                created_at=datetime(2022, 1, day),
+            )
+            for type_account, currency, initial_balance, current_balance, broker, day in (
+                ("R", "USD", 100.0, 110.0, first_broker, 1),
+                ("D", "USD", 50.0, None, first_broker, 2),
+                ("R", "BRL", 1000.0, 900.0, second_broker, 3),
+            )
+        ]
+        Account(
+            type_account="R",
+            currency="USD",
+            initial_balance=5000.0,
+            broker=Broker(name="Other", user=other_user),
+            user=other_user,
+        )
+
+        for profit in (15.0, -5.0):
+            Trade(value=10.0, profit=profit, account=accounts[0], user=user, strategy=strategy)
+
+        self.user_id = user.id
+        self.account_uids = [str(account.uid) for account in accounts]
+        self.broker_uids = [str(first_broker.uid), str(second_broker.uid)]
+
+    @db_session
+    def tearDown(self):
+        FxRate.select().delete(bulk=True)
+        fx.rates_cache.clear()
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    @db_session
+    def test_summary(self):
+        result = portfolio.summary(self.user_id)
+
+        self.assertEqual(
+            result["currencies"],
+            [
+                {
+                    "currency": "BRL",
+                    "accounts": 1,
+                    "initial_balance": 1000.0,
+                    "current_balance": 900.0,
+                },
+                {
+                    "currency": "USD",
+                    "accounts": 2,
+                    "initial_balance": 150.0,
+                    "current_balance": 160.0,
+                },
+            ],
+        )
+        self.assertEqual(result["account_types"], {"D": 1, "R": 2})
+        self.assertEqual(
+            [(broker["name"], len(broker["currencies"])) for broker in result["brokers"]],
+            [("A Broker", 1), ("B Broker", 1), ("C Broker", 0)],
+        )
+        self.assertEqual(result["brokers"][0]["uid"], self.broker_uids[0])
+        self.assertEqual(result["brokers"][0]["currencies"][0]["accounts"], 2)
+        self.assertEqual([account["uid"] for account in result["accounts"]], self.account_uids)
+        self.assertEqual(
+            [(account["trades"], account["profit"]) for account in result["accounts"]],
+            [(2, 10.0), (0, 0.0), (0, 0.0)],
+        )
+        self.assertEqual(result["accounts"][2]["broker_uid"], self.broker_uids[1])
+
+    @db_session
+    def test_summary_without_accounts(self):
+        user = User(encrypted_password="123456")
+        Broker(name="Broker", user=user)
+        db.flush()
+
+        result = portfolio.summary(user.id)
+
+        self.assertEqual(result["currencies"], [])
+        self.assertEqual(result["account_types"], {})
+        self.assertEqual(result["brokers"][0]["currencies"], [])
+        self.assertEqual(result["accounts"], [])
+
+    @db_session
+    def test_summary_with_base(self):
+        fx.store_rates({"USD": 1.0, "BRL": 0.2})
+
+        result = portfolio.summary(self.user_id, "USD")
+
+        self.assertEqual(result["base"], "USD")
+        self.assertEqual(
+            result["total"],
+            {
+                "currency": "USD",
+                "accounts": 3,
+                "initial_balance": 350.0,
+                "current_balance": 340.0,
+                "profit": 10.0,
+            },
+        )
+        self.assertEqual(
+            [broker["total"]["current_balance"] for broker in result["brokers"]],
+            [160.0, 180.0, 0.0],
+        )
+        self.assertEqual(result["accounts"][2]["converted"]["initial_balance"], 200.0)
+
+    @db_session
+    def test_summary_with_missing_rate(self):
+        fx.store_rates({"USD": 1.0})
+
+        with self.assertRaisesRegex(fx.MissingRateError, "Missing FX rate for BRL"):
+            portfolio.summary(self.user_id, "USD")
+
+    @db_session
+    def test_conversion_adds_no_queries(self):
+        fx.store_rates({"USD": 1.0, "BRL": 0.2})
+        fx.get_rates()
+
+        with count_queries() as plain:
+            portfolio.summary(self.user_id)
+
+        with count_queries() as converted:
+            portfolio.summary(self.user_id, "BRL")
+
+        self.assertEqual(converted.total, plain.total, converted.stats)
@@ -0,0 +1,150 @@
+import unittest
+from datetime import datetime
+
+from pony.orm import db_session
+
+import pagination
+import reads
+from entities import db, User, Broker, Account, Strategy
+
+
+class TestReads(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(encrypted_password="123456", risk=7)
+        other_user = User(encrypted_password="123456")
+        first_broker = Broker(name="A Broker", user=user, created_at=datetime(2022, 1, 2))
+        second_broker = Broker(name="B Broker", user=user, created_at=datetime(2022, 1, 1))
+        accounts = [
+            Account(
+                type_account=type_account,
+                currency="USD",
+                initial_balance=100.0,
+                current_balance=current_balance,
+                broker=broker,
+                user=user,
+                created_at=datetime(2022, 1, day),
+            )
+            for type_account, current_balance, broker, day in (
+                ("R", 110.0, first_broker, 3),
+                ("D", None, first_broker, 1),
+                ("R", 90.0, second_broker, 2),
+            )
+        ]
+        Strategy(name="First", user=user)
+        Strategy(name="Second", user=user)
+        Strategy(name="Other", user=other_user)
+        Account(
+            type_account="R",
+            currency="USD",
+            initial_balance=100.0,
+            broker=Broker(name="Other", user=other_user),
+            user=other_user,
+        )
+        db.flush()
+
+        self.user_id = user.id
+        self.broker_ids = [first_broker.id, second_broker.id]
+        self.broker_uids = [str(first_broker.uid), str(second_broker.uid)]
+        self.account_ids = [account.id for account in accounts]
+        self.account_uids = [str(account.uid) for account in accounts]
+
+    @db_session
+    def tearDown(self):
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    @db_session
+    def test_list_strategies_without_page(self):
+        strategies = reads.list_strategies(self.user_id)
+
+        self.assertEqual([strategy.name for strategy in strategies], ["First", "Second"])
+        self.assertIsInstance(strategies[0].uid, str)
+        self.assertEqual(set(strategies[0].to_dict()), {"uid", "name"})
+
+    @db_session
+    def test_list_brokers_by_page(self):
+        page = pagination.Page(1)
+        brokers, next_cursor = pagination.trim(reads.list_brokers(self.user_id, page), page)
+
+        self.assertEqual([broker.name for broker in brokers], ["B Broker"])
+        self.assertIsNotNone(next_cursor)
+
+        page = pagination.Page(1, pagination.decode_cursor(next_cursor))
+        brokers, next_cursor = pagination.trim(reads.list_brokers(self.user_id, page), page)
+
+        self.assertEqual([broker.name for broker in brokers], ["A Broker"])
+        self.assertIsNone(next_cursor)
+
+    @db_session
+    def test_broker_accounts(self):
+        accounts = reads.broker_accounts([self.broker_ids[0]])
+
+        self.assertEqual([account.id for account in accounts], self.account_ids[:2])
+        self.assertEqual(
+            accounts[1].to_dict(),
+            {
+                "uid": self.account_uids[1],
+                "type_account": "D",
+                "currency": "USD",
+                "initial_balance": 100.0,
+                "current_balance": None,
+            },
+        )
+        self.assertEqual(reads.broker_accounts([]), [])
+
+    @db_session
+    def test_list_accounts_filters(self):
+        cases = (
+            ({}, self.account_ids),
+            ({"type_account": "R"}, [self.account_ids[0], self.account_ids[2]]),
+            ({"broker_uid": self.broker_uids[1]}, [self.account_ids[2]]),
+            ({"broker_uid": self.broker_uids[0], "type_account": "D"}, [self.account_ids[1]]),
+            ({"broker_uid": "invalid"}, []),
+        )
+
+        for filters, expected in cases:
+            with self.subTest(filters=filters):
+                accounts = reads.list_accounts(self.user_id, **filters)
+
+                self.assertEqual([account.id for account in accounts], expected)
+
+    @db_session
+    def test_list_accounts_by_page(self):
+        page = pagination.Page(2)
+        accounts, next_cursor = pagination.trim(reads.list_accounts(self.user_id, page), page)
+
+        self.assertEqual([account.id for account in accounts], self.account_ids[1:])
+        self.assertEqual(accounts[0].broker_name, "A Broker")
+
+        page = pagination.Page(2, pagination.decode_cursor(next_cursor))
+        accounts, next_cursor = pagination.trim(reads.list_accounts(self.user_id, page), page)
+
+        self.assertEqual([account.id for account in accounts], self.account_ids[:1])
+        self.assertIsNone(next_cursor)
+
+    @db_session
+    def test_get_account(self):
+        account = reads.get_account(self.user_id, self.account_uids[2])
+
+        self.assertEqual(account.broker_uid, self.broker_uids[1])
+        self.assertEqual(account.current_balance, 90.0)
+        self.assertIsNone(reads.get_account(self.user_id, "invalid"))
+        self.assertIsNone(reads.get_account(self.user_id + 1, self.account_uids[2]))
+
+    @db_session
+    def test_get_account_with_risk(self):
+        account = reads.get_account_with_risk(self.user_id, self.account_uids[0])
+
+        self.assertEqual((account.id, account.initial_balance), (self.account_ids[0], 100.0))
+        self.assertEqual(account.risk, 7)
+        self.assertIsNone(reads.get_account_with_risk(self.user_id, "invalid"))
+        self.assertIsNone(reads.get_account_with_risk(self.user_id + 1, self.account_uids[0]))
+
+    def test_rows_have_no_instance_dict(self):
+        row = reads.StrategyRow(1, datetime(2022, 1, 1), "uid", "name")
+
+        self.assertFalse(hasattr(row, "__dict__"))
+        self.assertEqual(row.to_dict(), {"uid": "uid", "name": "name"})
@@ -0,0 +1,184 @@
+import abc
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import responses
+from fake_redis import start_fake_redis
+
+
+def build_request(path=None, query=None, headers=None):
+    return SimpleNamespace(user_id=1, path=path or {}, query=query or {}, headers=headers or {})
+
+
+class ResponseCacheTests(abc.ABC):
+    @abc.abstractmethod
+    def build_backend(self):
+        pass
+
+    def setUp(self):
+        self.cache = responses.ResponseCache(self.build_backend(), ttl=60)
+        self.calls = 0
+
+        @self.cache.cached("list_things")
+        def handle(request):
+            self.calls += 1
+            return 200, {"things": ["a" * 100], "calls": self.calls}, {"ETag": '"v1"'}
+
+        self.handle = handle
+
+    def test_hits_and_bytes_saved(self):
+        first = self.handle(build_request(query={"limit": "10"}))
+
+        for _ in range(3):
+            self.assertEqual(self.handle(build_request(query={"limit": "10"})), first)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.cache.stats["hits"], 3)
+        self.assertEqual(self.cache.stats["hit_ratio"], 0.75)
+        self.assertGreater(self.cache.stats["bytes_saved"], 300)
+
+    def test_key_depends_on_query_and_path(self):
+        self.handle(build_request(query={"limit": "10"}))
+        self.handle(build_request(query={"limit": "20"}))
+        self.handle(build_request(path={"uuid": "a"}, query={"limit": "10"}))
+
+        self.assertEqual(self.calls, 3)
+
+    def test_key_escapes_values(self):
+        self.handle(build_request(query={"broker_uid": "X&type_account=R"}))
+        self.handle(build_request(query={"broker_uid": "X", "type_account": "R"}))
+
+        self.assertEqual(self.calls, 2)
+
+    def test_bump_invalidates_every_entry_of_the_user(self):
+        self.handle(build_request(query={"limit": "10"}))
+        self.handle(build_request(query={"limit": "20"}))
+        self.cache.bump(1)
+
+        response = self.handle(build_request(query={"limit": "10"}))
+        self.handle(build_request(query={"limit": "20"}))
+
+        self.assertEqual(response[1]["calls"], 3)
+        self.assertEqual(self.calls, 4)
+
+    def test_bump_of_other_user_keeps_entries(self):
+        self.handle(build_request())
+        self.cache.bump(2)
+        self.handle(build_request())
+
+        self.assertEqual(self.calls, 1)
+
+    def test_no_stale_read_after_bump(self):
+        # A read that started before the write stores under the version it read first
+        request = build_request()
+        version = self.cache.backend.version(self.cache.version_key(1))
+        self.cache.bump(1)
+        stale_key = self.cache.key(1, version, "list_things", request)
+        self.cache.store(stale_key, (200, {"things": [], "calls": 0}, {}))
+
+        self.assertEqual(self.handle(request)[1]["calls"], 1)
+
+    def test_versions_only_move_forward(self):
+        key = self.cache.version_key(1)
+        versions = [self.cache.backend.version(key)]
+
+        for _ in range(3):
+            self.cache.backend.bump(key)
+            versions.append(self.cache.backend.version(key))
+
+        self.assertEqual(versions, sorted(set(versions)))
+
+    def test_errors_are_not_cached(self):
+        @self.cache.cached("get_thing")
+        def handle(request):
+            self.calls += 1
+            return 404, {"message": "Thing not found"}
+
+        for _ in range(2):
+            self.assertEqual(handle(build_request())[0], 404)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_not_modified_from_cache(self):
+        self.handle(build_request())
+        response = self.handle(build_request(headers={"If-None-Match": '"v1"'}))
+
+        self.assertEqual(response, (304, None, {"ETag": '"v1"'}))
+        self.assertEqual(self.calls, 1)
+
+
+class TestLocalResponseCache(ResponseCacheTests, unittest.TestCase):
+    def build_backend(self):
+        return responses.LocalBackend(maxsize=16)
+
+    def test_evicted_version_restarts_above_previous_ones(self):
+        backend = responses.LocalBackend(maxsize=1)
+        version = backend.version("responses:1:version")
+        backend.bump("responses:1:version")
+        backend.version("responses:2:version")
+
+        self.assertGreater(backend.version("responses:1:version"), version + 1)
+
+    def test_disabled_cache(self):
+        self.cache.backend = responses.LocalBackend(maxsize=0)
+
+        for _ in range(2):
+            self.handle(build_request())
+
+        self.assertEqual(self.calls, 2)
+
+    def test_no_backend_disables_the_cache(self):
+        self.cache.backend = None
+
+        for _ in range(2):
+            self.handle(build_request())
+
+        self.cache.bump(1)
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.cache.stats["misses"], 0)
+
+
+class TestBuildBackend(unittest.TestCase):
+    @patch("settings.RESPONSE_CACHE_URL", None)
+    def test_disabled_without_a_shared_backend(self):
+        self.assertIsNone(responses.build_backend())
+
+    @patch("settings.RESPONSE_CACHE_URL", "redis://cache:6380/2")
+    def test_redis_backend(self):
+        backend = responses.build_backend()
+
+        self.assertIsInstance(backend, responses.RedisBackend)
+        self.assertEqual((backend.address, backend.database), (("cache", 6380), "2"))
+
+
+class TestRedisResponseCache(ResponseCacheTests, unittest.TestCase):
+    def build_backend(self):
+        self.server = start_fake_redis(self)
+        backend = responses.RedisBackend(self.server.url)
+        self.addCleanup(backend.close)
+
+        return backend
+
+    def test_entries_are_stored_with_ttl(self):
+        self.handle(build_request())
+        command, key, _, *options = self.server.commands[-1]
+
+        self.assertEqual(command, "SET")
+        self.assertRegex(key, rb"^responses:1:\d+:list_things:$")
+        self.assertEqual(options, [b"EX", b"60"])
+
+    def test_unavailable_server_fails_open(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.cache.backend.close()
+        self.cache.backend.address = ("127.0.0.1", 1)
+
+        for _ in range(2):
+            self.assertEqual(self.handle(build_request())[0], 200)
+
+        self.cache.bump(1)
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.cache.stats["errors"], 3)
@@ -0,0 +1,146 @@
+import unittest
+from datetime import date, datetime
+
+from pony.orm import db_session
+
+import rollups
+from entities import db, User, Broker, Account, Strategy, Trade, DailyTradeStats
+
+
+class TestRollups(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(uid="8b9c0d1e-2f3a-4b4c-9d5e-6f7a8b9c0d1e", encrypted_password="123456")
+        broker = Broker(name="Broker", user=user)
+        account = Account(
+            type_account="R", currency="USD", initial_balance=100.0, broker=broker, user=user
+        )
+        strategy = Strategy(name="Strategy", user=user)
+        trades = [
+            Trade(
+                value=10.0,
+                profit=profit,
+                result=profit > 0,
+                account=account,
+                user=user,
+                strategy=strategy,
+                created_at=created_at,
+            )
+            for profit, created_at in (
+                (10.0, datetime(2022, 3, 1, 10)),
+                (-4.0, datetime(2022, 3, 1, 15)),
+                (6.0, datetime(2022, 3, 2, 9)),
+            )
+        ]
+
+        db.flush()
+        self.user_id = user.id
+        self.account_id = account.id
+        self.trade_ids = [trade.id for trade in trades]
+
+    @db_session
+    def tearDown(self):
+        DailyTradeStats.select().delete(bulk=True)
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    @db_session
+    def test_apply_trades(self):
+        rollups.apply_trades(self.trade_ids[:2])
+        rollups.apply_trades(self.trade_ids[2:])
+
+        self.assertEqual(
+            rollups.daily_stats(self.user_id),
+            [
+                {
+                    "day": "2022-03-01",
+                    "trades": 2,
+                    "wins": 1,
+                    "losses": 1,
+                    "profit": 6.0,
+                    "gross_profit": 10.0,
+                    "gross_loss": 4.0,
+                },
+                {
+                    "day": "2022-03-02",
+                    "trades": 1,
+                    "wins": 1,
+                    "losses": 0,
+                    "profit": 6.0,
+                    "gross_profit": 6.0,
+                    "gross_loss": 0.0,
+                },
+            ],
+        )
+
+    @db_session
+    def test_remove_trades(self):
+        rollups.apply_trades(self.trade_ids)
+        rollups.apply_trades(self.trade_ids[1:], sign=-1)
+
+        days = rollups.daily_stats(self.user_id)
+
+        self.assertEqual([day["day"] for day in days], ["2022-03-01"])
+        self.assertEqual(days[0]["profit"], 10.0)
+        self.assertEqual(days[0]["losses"], 0)
+
+    @db_session
+    def test_daily_stats_range(self):
+        rollups.apply_trades(self.trade_ids)
+
+        days = rollups.daily_stats(self.user_id, datetime(2022, 3, 2), datetime(2022, 3, 3))
+
+        self.assertEqual([day["day"] for day in days], ["2022-03-02"])
+
+    @db_session
+    def test_rebuild(self):
+        rollups.apply_trades(self.trade_ids)
+        DailyTradeStats.select().first().profit = 1000.0
+        rollups.apply_trades(self.trade_ids)
+
+        rollups.rebuild(date(2022, 3, 1), date(2022, 3, 1), self.user_id)
+
+        days = rollups.daily_stats(self.user_id)
+
+        self.assertEqual([day["trades"] for day in days], [2, 2])
+        self.assertEqual(days[0]["profit"], 6.0)
+
+    @db_session
+    def test_user_rebuild_does_not_lock_the_table(self):
+        rollups.rebuild(date(2022, 3, 1), date(2022, 3, 1), self.user_id)
+
+        self.assertEqual(self.held_locks(), [("advisory", "ExclusiveLock")])
+
+    @db_session
+    def test_full_rebuild_locks_the_table(self):
+        rollups.rebuild(date(2022, 3, 1), date(2022, 3, 1))
+
+        self.assertIn(("relation", "ShareRowExclusiveLock"), self.held_locks())
+
+    @db_session
+    def test_writes_share_the_user_lock(self):
+        rollups.apply_trades(self.trade_ids)
+
+        self.assertIn(("advisory", "ShareLock"), self.held_locks())
+
+    def held_locks(self):
+        return db.select(
+            """
+            SELECT locktype, mode
+            FROM pg_locks
+            WHERE pid = pg_backend_pid()
+                AND (locktype = 'advisory' OR relation = 'daily_trade_stats'::regclass)
+                AND mode NOT IN ('AccessShareLock', 'RowExclusiveLock')
+            ORDER BY locktype, mode
+            """
+        )
+
+    @db_session
+    def test_remove_accounts(self):
+        rollups.apply_trades(self.trade_ids)
+        rollups.remove_accounts([self.account_id])
+
+        self.assertEqual(rollups.daily_stats(self.user_id), [])
@@ -0,0 +1,109 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+from pony.orm import db_session
+
+import settings
+import simulation
+from entities import User, Broker, Account, Strategy, Trade
+
+
+class TestSimulate(unittest.TestCase):
+    def setUp(self):
+        self.outcomes = np.random.default_rng(1).normal(0.05, 1.0, 100)
+
+    def test_simulate_is_seedable(self):
+        first = simulation.simulate(self.outcomes, 1000.0, 10, 300, 50, seed=7)
+        second = simulation.simulate(self.outcomes, 1000.0, 10, 300, 50, seed=7)
+        other = simulation.simulate(self.outcomes, 1000.0, 10, 300, 50, seed=8)
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first["final_balance"], other["final_balance"])
+
+    @patch.object(settings, "SIMULATION_CHUNK_DRAWS", 1000)
+    def test_simulate_does_not_depend_on_processes(self):
+        inline = simulation.simulate(self.outcomes, 1000.0, 10, 300, 50, seed=7)
+        pooled = simulation.simulate(self.outcomes, 1000.0, 10, 300, 50, seed=7, processes=2)
+
+        self.assertEqual(inline, pooled)
+
+    def test_simulate_reports_seed(self):
+        result = simulation.simulate(self.outcomes, 1000.0, 10, 10, 5)
+
+        self.assertEqual(
+            simulation.simulate(self.outcomes, 1000.0, 10, 10, 5, seed=result["seed"]), result
+        )
+
+    def test_simulate_sizes_trades_by_risk(self):
+        result = simulation.simulate(np.array([0.5]), 100.0, 10, 5, 3, seed=1)
+
+        self.assertAlmostEqual(result["final_balance"]["mean"], 100.0 * 1.05**3)
+        self.assertEqual(result["ruin_probability"], 0.0)
+
+    def test_simulate_stops_ruined_paths(self):
+        result = simulation.simulate(np.array([-1.0]), 100.0, 30, 5, 10, seed=1, ruin=50)
+
+        self.assertEqual(result["ruin_probability"], 1.0)
+        self.assertAlmostEqual(result["final_balance"]["max"], 100.0 * 0.7**2)
+
+    def test_simulate_bands(self):
+        result = simulation.simulate(self.outcomes, 1000.0, 10, 200, 120, seed=3)
+        bands = result["bands"]
+
+        self.assertEqual(len(bands), simulation.BAND_POINTS)
+        self.assertEqual((bands[0]["trade"], bands[-1]["trade"]), (1, 120))
+        self.assertEqual(
+            {key: value for key, value in bands[-1].items() if key != "trade"},
+            result["final_balance"]["percentiles"],
+        )
+
+        for band in bands:
+            self.assertLessEqual(band["p5"], band["p50"])
+            self.assertLessEqual(band["p50"], band["p95"])
+
+        self.assertEqual(sum(result["histogram"]["counts"]), 200)
+        self.assertEqual(len(result["histogram"]["edges"]), simulation.HISTOGRAM_BINS + 1)
+
+    @patch.object(settings, "SIMULATION_CHUNK_DRAWS", 100)
+    def test_chunk_sizes(self):
+        self.assertEqual(simulation.chunk_sizes(25, 10), [10, 10, 5])
+        self.assertEqual(simulation.chunk_sizes(3, 1000), [1, 1, 1])
+
+
+class TestLoadOutcomes(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(encrypted_password="123456")
+        broker = Broker(name="Broker", user=user)
+        account = Account(
+            type_account="R", currency="USD", initial_balance=100.0, broker=broker, user=user
+        )
+        strategy = Strategy(name="Strategy", user=user)
+
+        for profit, value, day in ((5.0, 10.0, 2), (-2.0, 8.0, 1), (3.0, 0.0, 3), (None, 5.0, 4)):
+            Trade(
+                value=value,
+                profit=profit,
+                account=account,
+                user=user,
+                strategy=strategy,
+                created_at=datetime(2022, 3, day),
+            )
+
+        self.strategy_id = strategy.id
+
+    @db_session
+    def tearDown(self):
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    @db_session
+    def test_load_outcomes(self):
+        outcomes = simulation.load_outcomes(self.strategy_id)
+
+        self.assertEqual(outcomes.tolist(), [-0.25, 0.5, 0.0])
@@ -0,0 +1,98 @@
+import unittest
+from datetime import datetime
+
+from pony.orm import db_session
+
+import stats
+from entities import db, User, Broker, Account, Strategy, Trade
+
+
+class TestStrategyStats(unittest.TestCase):
+    @classmethod
+    @db_session
+    def setUpClass(cls):
+        user = User(uid="0f1e2d3c-4b5a-4968-8776-a5b4c3d2e1f0", encrypted_password="123456")
+        broker = Broker(name="Broker", user=user)
+        accounts = [
+            Account(
+                type_account="R", currency="USD", initial_balance=100.0, broker=broker, user=user
+            )
+            for _ in range(2)
+        ]
+        strategy = Strategy(name="Strategy", user=user)
+        empty_strategy = Strategy(name="Empty strategy", user=user)
+
+        for account, profit, result, day in (
+            (accounts[0], 10.0, True, 1),
+            (accounts[0], -5.0, False, 2),
+            (accounts[0], 20.0, True, 3),
+            (accounts[1], -10.0, False, 4),
+            (accounts[1], 0.0, None, 5),
+        ):
+            Trade(
+                value=10.0,
+                profit=profit,
+                result=result,
+                account=account,
+                user=user,
+                strategy=strategy,
+                created_at=datetime(2022, 3, day),
+            )
+
+        db.flush()
+        cls.account_id = accounts[0].id
+        cls.strategy_id = strategy.id
+        cls.empty_strategy_id = empty_strategy.id
+
+    @classmethod
+    @db_session
+    def tearDownClass(cls):
+        Trade.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    @db_session
+    def test_all_trades(self):
+        result = stats.strategy_stats(self.strategy_id)
+
+        self.assertEqual(
+            result,
+            {
+                "trades": 5,
+                "wins": 2,
+                "losses": 2,
+                "win_rate": 0.5,
+                "total_profit": 15.0,
+                "average_profit": 3.0,
+                "profit_factor": 2.0,
+                "expectancy": 3.75,
+                "largest_win": 20.0,
+                "largest_loss": -10.0,
+            },
+        )
+
+    @db_session
+    def test_filters(self):
+        result = stats.strategy_stats(
+            self.strategy_id,
+            account_id=self.account_id,
+            start=datetime(2022, 3, 2),
+            end=datetime(2022, 3, 4),
+        )
+
+        self.assertEqual(result["trades"], 2)
+        self.assertEqual(result["total_profit"], 15.0)
+        self.assertEqual(result["profit_factor"], 4.0)
+        self.assertEqual(result["largest_loss"], -5.0)
+
+    @db_session
+    def test_no_trades(self):
+        result = stats.strategy_stats(self.empty_strategy_id)
+
+        self.assertEqual(result["trades"], 0)
+        self.assertEqual(result["total_profit"], 0.0)
+        self.assertIsNone(result["win_rate"])
+        self.assertIsNone(result["profit_factor"])
+        self.assertIsNone(result["expectancy"])
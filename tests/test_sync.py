@@ -0,0 +1,128 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from pony.orm import db_session
+
+import purge
+import settings
+import sync
+from entities import db, User, Broker, Account, Strategy, Tombstone
+
+OLD = datetime(2022, 1, 1)
+
+
+class TestSync(unittest.TestCase):
+    @db_session
+    def setUp(self):
+        user = User(encrypted_password="123456")
+        other_user = User(encrypted_password="123456")
+        broker = Broker(name="Broker", user=user, updated_at=OLD)
+        kept_account = Account(
+            type_account="R",
+            currency="USD",
+            initial_balance=100.0,
+            broker=broker,
+            user=user,
+            updated_at=OLD,
+        )
+        deleted_account = Account(
+            type_account="D",
+            currency="BRL",
+            initial_balance=50.0,
+            broker=broker,
+            user=user,
+            updated_at=OLD,
+        )
+        Strategy(name="Strategy", user=user, updated_at=OLD)
+        Strategy(name="Other", user=other_user)
+        db.flush()
+
+        self.user_id = user.id
+        self.broker_id = broker.id
+        self.broker_uid = str(broker.uid)
+        self.kept_account_uid = str(kept_account.uid)
+        self.deleted_account_id = deleted_account.id
+        self.deleted_account_uid = str(deleted_account.uid)
+
+    @db_session
+    def tearDown(self):
+        Tombstone.select().delete(bulk=True)
+        Strategy.select().delete()
+        Account.select().delete()
+        Broker.select().delete()
+        User.select().delete()
+
+    def test_cursor_round_trip(self):
+        since = datetime(2022, 3, 1, 12, 30, 15, 123456)
+
+        self.assertEqual(sync.decode_cursor(sync.encode_cursor(since)), since)
+
+        for cursor in ("invalid", "W10", "_-_-"):
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(ValueError) as error:
+                    sync.decode_cursor(cursor)
+
+                self.assertEqual(str(error.exception), "Invalid 'since' cursor")
+
+    @patch.object(settings, "SYNC_OVERLAP", 60)
+    @db_session
+    def test_first_sync_returns_everything(self):
+        before = datetime.utcnow()
+        result = sync.changes(self.user_id)
+
+        self.assertEqual(result["brokers"], [{"uid": self.broker_uid, "name": "Broker"}])
+        self.assertEqual(len(result["accounts"]), 2)
+        self.assertEqual(result["accounts"][0]["broker_uid"], self.broker_uid)
+        self.assertEqual([strategy["name"] for strategy in result["strategies"]], ["Strategy"])
+        self.assertEqual(result["deleted"], [])
+
+        cursor = sync.decode_cursor(result["cursor"])
+
+        self.assertLessEqual(cursor, before - timedelta(seconds=59))
+        self.assertGreater(cursor, before - timedelta(seconds=120))
+
+    @db_session
+    def test_sync_returns_changes_and_tombstones(self):
+        since = OLD + timedelta(days=1)
+        db.execute(
+            "UPDATE accounts SET current_balance = 110.0, updated_at = $(since + timedelta(1)) "
+            "WHERE uid = CAST($(self.kept_account_uid) AS uuid)"
+        )
+        purge.delete_accounts([self.deleted_account_id])
+
+        result = sync.changes(self.user_id, since)
+
+        self.assertEqual(result["brokers"], [])
+        self.assertEqual(result["strategies"], [])
+        self.assertEqual(
+            result["accounts"],
+            [
+                {
+                    "uid": self.kept_account_uid,
+                    "broker_uid": self.broker_uid,
+                    "type_account": "R",
+                    "currency": "USD",
+                    "initial_balance": 100.0,
+                    "current_balance": 110.0,
+                }
+            ],
+        )
+        self.assertEqual(result["deleted"], [{"type": "account", "uid": self.deleted_account_uid}])
+
+    @db_session
+    def test_deleted_broker_leaves_tombstones(self):
+        purge.delete_broker(self.broker_id)
+
+        result = sync.changes(self.user_id, OLD)
+
+        self.assertEqual(result["accounts"], [])
+        self.assertCountEqual(
+            result["deleted"],
+            [
+                {"type": "account", "uid": self.kept_account_uid},
+                {"type": "account", "uid": self.deleted_account_uid},
+                {"type": "broker", "uid": self.broker_uid},
+            ],
+        )
+        self.assertEqual(result["deleted"][-1]["type"], "broker")
@@ -0,0 +1,168 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from entities import db
+
+WIN = 1
+LOSS = -1
+
+
+@dataclass
+class Trades:
+    # One entry per trade, ordered by (created_at, id). result holds WIN, LOSS or 0 when unknown
+    profit: np.ndarray
+    value: np.ndarray
+    result: np.ndarray
+    created_at: np.ndarray
+    result_balance: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.profit)
+
+
+def load_trades(
+    account_id: Optional[int] = None,
+    strategy_id: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Trades:
+    # One row of arrays avoids a row tuple per trade, psycopg2 still decodes each value
+    (row,) = db.select(
+        """
+        SELECT
+            array_agg(coalesce(profit, 0)::float8 ORDER BY created_at, id),
+            array_agg(coalesce(value, 0)::float8 ORDER BY created_at, id),
+            array_agg(
+                CASE WHEN result THEN 1 WHEN NOT result THEN -1 ELSE 0 END ORDER BY created_at, id
+            ),
+            array_agg(extract(epoch FROM created_at)::int8 ORDER BY created_at, id),
+            array_agg(coalesce(result_balance::float8, 'NaN') ORDER BY created_at, id)
+        FROM trades
+        WHERE ($account_id IS NULL OR account_id = $account_id)
+            AND ($strategy_id IS NULL OR strategy_id = $strategy_id)
+            AND ($start IS NULL OR created_at >= $start)
+            AND ($end IS NULL OR created_at < $end)
+        """
+    )
+    profit, value, result, created_at, result_balance = (column or [] for column in row)
+
+    return Trades(
+        profit=np.array(profit, dtype=np.float64),
+        value=np.array(value, dtype=np.float64),
+        result=np.array(result, dtype=np.int8),
+        created_at=np.array(created_at, dtype=np.int64).astype("datetime64[s]"),
+        result_balance=np.array(result_balance, dtype=np.float64),
+    )
+
+
+def opening_balance(account_id: int, start: datetime) -> float:
+    (balance,) = db.select(
+        """
+        SELECT accounts.initial_balance + coalesce(sum(trades.profit), 0)
+        FROM accounts
+        LEFT JOIN trades ON trades.account_id = accounts.id AND trades.created_at < $start
+        WHERE accounts.id = $account_id
+        GROUP BY accounts.id
+        """
+    )
+
+    return float(balance)
+
+
+def balances_before(trades: Trades, initial_balance: Optional[float] = None) -> np.ndarray:
+    if initial_balance is not None:
+        equity = initial_balance + np.cumsum(trades.profit)
+        return np.concatenate(([initial_balance], equity))[:-1]
+
+    # Trades of a strategy span several accounts, so rely on the stored running balances
+    return trades.result_balance - trades.profit
+
+
+def drawdown(trades: Trades, initial_balance: float = 0.0) -> dict:
+    if not len(trades):
+        return {
+            "max_drawdown": 0.0,
+            "max_drawdown_percent": 0.0,
+            "max_drawdown_trades": 0,
+            "max_drawdown_duration": 0,
+        }
+
+    equity = np.concatenate(([initial_balance], initial_balance + np.cumsum(trades.profit)))
+    created_at = np.concatenate((trades.created_at[:1], trades.created_at))
+    peaks = np.maximum.accumulate(equity)
+    drawdowns = peaks - equity
+
+    positions = np.arange(len(equity))
+    peak_positions = np.maximum.accumulate(np.where(equity >= peaks, positions, 0))
+    durations = created_at - created_at[peak_positions]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percents = np.where(peaks > 0, drawdowns / peaks, 0.0)
+
+    return {
+        "max_drawdown": float(drawdowns.max()),
+        "max_drawdown_percent": float(percents.max()),
+        "max_drawdown_trades": int((positions - peak_positions).max()),
+        "max_drawdown_duration": int(durations.max() / np.timedelta64(1, "s")),
+    }
+
+
+def streaks(trades: Trades) -> dict:
+    if not len(trades):
+        return {"longest_win_streak": 0, "longest_loss_streak": 0}
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(trades.result)) + 1))
+    lengths = np.diff(np.concatenate((starts, [len(trades)])))
+    kinds = trades.result[starts]
+
+    return {
+        "longest_win_streak": int(lengths[kinds == WIN].max(initial=0)),
+        "longest_loss_streak": int(lengths[kinds == LOSS].max(initial=0)),
+    }
+
+
+def ratios(returns: np.ndarray) -> dict:
+    returns = returns[np.isfinite(returns)]
+
+    if len(returns) < 2:
+        return {"sharpe_ratio": None, "sortino_ratio": None}
+
+    mean = returns.mean()
+    deviation = returns.std(ddof=1)
+    downside_deviation = np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2))
+
+    return {
+        "sharpe_ratio": float(mean / deviation) if deviation else None,
+        "sortino_ratio": float(mean / downside_deviation) if downside_deviation else None,
+    }
+
+
+def risk_exceeded(trades: Trades, balances: np.ndarray, risk: Optional[float]) -> Optional[float]:
+    known = np.isfinite(balances)
+
+    if risk is None or not known.any():
+        return None
+
+    exceeded = trades.value[known] > balances[known] * risk / 100
+
+    return float(exceeded.mean())
+
+
+def metrics(
+    trades: Trades, initial_balance: Optional[float] = None, risk: Optional[float] = None
+) -> dict:
+    balances = balances_before(trades, initial_balance)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = trades.profit / balances
+
+    return {
+        "trades": len(trades),
+        **drawdown(trades, initial_balance or 0.0),
+        **streaks(trades),
+        **ratios(returns),
+        "risk_exceeded": risk_exceeded(trades, balances, risk),
+    }
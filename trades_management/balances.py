@@ -0,0 +1,142 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+from entities import db
+
+BEGINNING = datetime.min
+
+
+def lock_account(account_id: int):
+    # Concurrent balance writers of the same account wait here until the holder commits
+    db.execute("SELECT id FROM accounts WHERE id = $account_id FOR UPDATE")
+
+
+def recompute_from(account_id: int, created_at: datetime = BEGINNING, trade_id: int = 0):
+    db.flush()
+    lock_account(account_id)
+
+    previous_balance = db.select(
+        """
+        SELECT result_balance
+        FROM trades
+        WHERE account_id = $account_id AND (created_at, id) < ($created_at, $trade_id)
+        ORDER BY created_at DESC, id DESC
+        LIMIT 1
+        """
+    )
+
+    if previous_balance and previous_balance[0] is not None:
+        update_running_balances(account_id, previous_balance[0], created_at, trade_id)
+    else:
+        # Nothing comes before this point, or that history was never computed
+        initial_balance = db.select("SELECT initial_balance FROM accounts WHERE id = $account_id")
+        update_running_balances(account_id, initial_balance[0])
+
+
+def update_running_balances(
+    account_id: int, balance: Decimal, created_at: datetime = BEGINNING, trade_id: int = 0
+):
+    db.execute(
+        """
+        WITH running AS (
+            SELECT
+                id,
+                $balance + sum(coalesce(profit, 0)) OVER (ORDER BY created_at, id) AS balance
+            FROM trades
+            WHERE account_id = $account_id AND (created_at, id) >= ($created_at, $trade_id)
+        )
+        UPDATE trades
+        SET result_balance = running.balance
+        FROM running
+        WHERE trades.id = running.id AND trades.result_balance IS DISTINCT FROM running.balance
+        """
+    )
+    db.execute(
+        """
+        UPDATE accounts
+        SET current_balance = coalesce(
+            (
+                SELECT result_balance
+                FROM trades
+                WHERE account_id = $account_id
+                ORDER BY created_at DESC, id DESC
+                LIMIT 1
+            ),
+            initial_balance
+        ),
+        updated_at = now() AT TIME ZONE 'utc'
+        WHERE id = $account_id
+        """
+    )
+
+
+def rebuild(account_id: int):
+    recompute_from(account_id)
+
+
+def check(account_id: Optional[int] = None, repair: bool = False) -> List[dict]:
+    db.flush()
+
+    trades = db.select(
+        """
+        SELECT account_id, id, result_balance, expected
+        FROM (
+            SELECT
+                trades.account_id,
+                trades.id,
+                trades.result_balance,
+                accounts.initial_balance + sum(coalesce(trades.profit, 0)) OVER (
+                    PARTITION BY trades.account_id ORDER BY trades.created_at, trades.id
+                ) AS expected
+            FROM trades
+            JOIN accounts ON accounts.id = trades.account_id
+            WHERE $account_id IS NULL OR trades.account_id = $account_id
+        ) balances
+        WHERE result_balance IS DISTINCT FROM expected
+        ORDER BY account_id, id
+        """
+    )
+    accounts = db.select(
+        """
+        SELECT
+            accounts.id,
+            accounts.current_balance,
+            accounts.initial_balance + coalesce(sum(trades.profit), 0) AS expected
+        FROM accounts
+        LEFT JOIN trades ON trades.account_id = accounts.id
+        WHERE $account_id IS NULL OR accounts.id = $account_id
+        GROUP BY accounts.id
+        HAVING accounts.current_balance
+            IS DISTINCT FROM accounts.initial_balance + coalesce(sum(trades.profit), 0)
+        ORDER BY accounts.id
+        """
+    )
+
+    differences = [
+        build_difference(item_id, stored, expected) for item_id, stored, expected in accounts
+    ]
+    differences.extend(
+        build_difference(item_account_id, stored, expected, trade_id)
+        for item_account_id, trade_id, stored, expected in trades
+    )
+
+    if repair:
+        for inconsistent_account_id in sorted({item["account_id"] for item in differences}):
+            rebuild(inconsistent_account_id)
+
+    return differences
+
+
+def build_difference(
+    account_id: int,
+    stored: Optional[Decimal],
+    expected: Decimal,
+    trade_id: Optional[int] = None,
+) -> dict:
+    return {
+        "account_id": account_id,
+        "trade_id": trade_id,
+        "stored": None if stored is None else float(stored),
+        "expected": float(expected),
+    }
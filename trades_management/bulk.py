@@ -0,0 +1,195 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import Iterator, List, Tuple, Union
+from uuid import uuid4
+
+from entities import db
+from schemas import TradeSchema
+
+CSV_CONTENT_TYPES = ("text/csv", "application/csv")
+AMOUNT_FIELDS = ("value", "profit")
+BOOLEAN_VALUES = {"true": True, "1": True, "false": False, "0": False}
+STAGING_COLUMNS = (
+    "line",
+    "uid",
+    "value",
+    "profit",
+    "result",
+    "type_trade",
+    "strategy_uid",
+    "created_at",
+)
+
+
+class TradeBatch:
+    def __init__(self):
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+        self.size = 0
+        self.errors = []
+        self.earliest = None
+
+    def add(self, line: int, data: TradeSchema):
+        self.writer.writerow(
+            (
+                line,
+                uuid4(),
+                data.value,
+                data.profit,
+                data.result,
+                data.type_trade,
+                data.strategy_uid,
+                data.created_at.isoformat(),
+            )
+        )
+        self.size += 1
+
+        if self.earliest is None or data.created_at < self.earliest:
+            self.earliest = data.created_at
+
+    def reject(self, line: int, message: str):
+        self.errors.append({"line": line, "message": message})
+
+
+def read_rows(
+    body: Union[str, dict, list], content_type: str = None
+) -> Iterator[Tuple[int, Union[dict, Exception]]]:
+    if isinstance(body, dict):
+        body = [body]
+
+    if isinstance(body, list):
+        yield from enumerate(body, start=1)
+        return
+
+    lines = io.StringIO(body or "")
+
+    if (content_type or "").split(";")[0].strip().lower() in CSV_CONTENT_TYPES:
+        reader = csv.DictReader(lines)
+
+        for row in reader:
+            yield reader.line_num, {key: value for key, value in row.items() if key is not None}
+
+        return
+
+    for line, text in enumerate(lines, start=1):
+        if not text.strip():
+            continue
+
+        try:
+            row = json.loads(text)
+        except ValueError:
+            yield line, ValueError("Invalid JSON")
+            continue
+
+        yield line, row if isinstance(row, dict) else ValueError("Row must be a JSON object")
+
+
+def normalize_row(row: dict) -> dict:
+    data = {key: value for key, value in row.items() if value is not None and value != ""}
+
+    for name in AMOUNT_FIELDS:
+        if name in data:
+            try:
+                data[name] = float(data[name])
+            except (TypeError, ValueError):
+                raise ValueError(f"'{name}' must be a number")
+
+    if isinstance(data.get("result"), str):
+        try:
+            data["result"] = BOOLEAN_VALUES[data["result"].strip().lower()]
+        except KeyError:
+            raise ValueError("'result' must be a boolean")
+
+    for name in ("created_at", "updated_at"):
+        if isinstance(data.get(name), str):
+            try:
+                data[name] = datetime.fromisoformat(data[name])
+            except ValueError:
+                raise ValueError(f"'{name}' must be an ISO 8601 datetime")
+
+        # trades columns have no time zone, offsets are folded into naive UTC
+        if isinstance(data.get(name), datetime) and data[name].tzinfo is not None:
+            data[name] = data[name].astimezone(timezone.utc).replace(tzinfo=None)
+
+    return data
+
+
+def parse_trades(rows: Iterator[Tuple[int, Union[dict, Exception]]]) -> TradeBatch:
+    batch = TradeBatch()
+
+    for line, row in rows:
+        if isinstance(row, Exception):
+            batch.reject(line, str(row))
+            continue
+
+        try:
+            data = TradeSchema.load(normalize_row(row))
+        except (KeyError, ValueError, TypeError) as error:
+            batch.reject(line, str(error))
+            continue
+
+        batch.add(line, data)
+
+    return batch
+
+
+def copy_trades(batch: TradeBatch, account_id: int, user_id: int) -> List[int]:
+    columns = ", ".join(STAGING_COLUMNS)
+    connection = db.get_connection()
+    batch.buffer.seek(0)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            CREATE TEMPORARY TABLE trades_staging (
+                line integer,
+                uid uuid,
+                value numeric(10,2),
+                profit numeric(10,2),
+                result boolean,
+                type_trade character varying(1),
+                strategy_uid uuid,
+                created_at timestamp without time zone
+            ) ON COMMIT DROP
+            """
+        )
+        cursor.copy_expert(
+            f"COPY trades_staging ({columns}) FROM STDIN WITH (FORMAT csv)", batch.buffer
+        )
+        cursor.execute(
+            """
+            SELECT staging.line
+            FROM trades_staging staging
+            LEFT JOIN strategies ON strategies.uid = staging.strategy_uid
+                AND strategies.user_id = %(user_id)s
+            WHERE strategies.id IS NULL
+            ORDER BY staging.line
+            """,
+            {"user_id": user_id},
+        )
+
+        for (line,) in cursor.fetchall():
+            batch.reject(line, "Invalid strategy")
+
+        cursor.execute(
+            """
+            INSERT INTO trades (
+                uid, value, profit, result, type_trade,
+                account_id, user_id, strategy_id, created_at, updated_at
+            )
+            SELECT
+                staging.uid, staging.value, staging.profit, staging.result, staging.type_trade,
+                %(account_id)s, %(user_id)s, strategies.id,
+                staging.created_at, now() AT TIME ZONE 'utc'
+            FROM trades_staging staging
+            JOIN strategies ON strategies.uid = staging.strategy_uid
+                AND strategies.user_id = %(user_id)s
+            ORDER BY staging.created_at, staging.line
+            RETURNING trades.id
+            """,
+            {"account_id": account_id, "user_id": user_id},
+        )
+
+        return [trade_id for (trade_id,) in cursor.fetchall()]
@@ -0,0 +1,98 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+MISSING = object()
+
+
+class LRUCache:
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.load_time = 0.0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, MISSING, count=False) is not MISSING
+
+    @property
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        hit_ratio = self.hits / lookups if lookups else 0.0
+        average_load_time = self.load_time / self.loads if self.loads else 0.0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.entries),
+            "hit_ratio": hit_ratio,
+            "average_load_time": average_load_time,
+            "time_saved": self.hits * average_load_time,
+        }
+
+    def get(self, key: Hashable, default: Any = None, count: bool = True) -> Any:
+        entry = self.entries.get(key)
+
+        if entry is not None:
+            value, expires_at = entry
+
+            if expires_at is None or self.clock() < expires_at:
+                self.entries.move_to_end(key)
+
+                if count:
+                    self.hits += 1
+
+                return value
+
+            del self.entries[key]
+
+        if count:
+            self.misses += 1
+
+        return default
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        expires_at: Optional[float] = None,
+    ):
+        if self.maxsize <= 0:
+            return
+
+        ttl = self.ttl if ttl is None else ttl
+
+        if expires_at is None and ttl is not None:
+            expires_at = self.clock() + ttl
+
+        self.entries[key] = (value, expires_at)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def record_load(self, seconds: float):
+        self.loads += 1
+        self.load_time += seconds
+
+    def delete(self, key: Hashable):
+        self.entries.pop(key, None)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.load_time = 0.0
@@ -0,0 +1,46 @@
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def default(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+
+    if isinstance(value, Decimal):
+        return float(value)
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_orjson(body: Any) -> str:
+    return orjson.dumps(body, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def dumps_stdlib(body: Any) -> str:
+    # Same bytes as orjson: compact separators and raw UTF-8
+    return json.dumps(body, default=default, separators=(",", ":"), ensure_ascii=False)
+
+
+dumps = dumps_orjson if orjson else dumps_stdlib
+
+
+def encode_response(response: Any) -> Any:
+    # Strings and empty bodies are passed through, serpens sends them as they are
+    if isinstance(response, (dict, list)):
+        return dumps(response)
+
+    if isinstance(response, tuple) and isinstance(response[1], (dict, list)):
+        return (response[0], dumps(response[1]), *response[2:])
+
+    return response
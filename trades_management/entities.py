@@ -1,14 +1,18 @@
-from datetime import datetime
-from typing import Union
+import time
+from datetime import date, datetime
+from typing import Union, Optional as OptionalType
 from uuid import UUID, uuid4
 
-from pony.orm.core import PrimaryKey, Required, Optional, Set, db_session
+from pony.orm.core import PrimaryKey, Required, Optional, Set, composite_index, db_session
 from serpens import database
 
 import settings
+from cache import LRUCache, MISSING
 
 db = database.Database()
 
+user_ids = LRUCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
+
 
 class Broker(db.Entity):
     _table_ = "brokers"
@@ -87,6 +91,42 @@ class Trade(db.Entity):
         return Trade.get(uid=uid)
 
 
+class DailyTradeStats(db.Entity):
+    _table_ = "daily_trade_stats"
+
+    user_id = Required(int)
+    account_id = Required(int)
+    strategy_id = Required(int, size=64)
+    day = Required(date)
+    trades = Required(int, default=0)
+    wins = Required(int, default=0)
+    losses = Required(int, default=0)
+    profit = Required(float, default=0.0)
+    gross_profit = Required(float, default=0.0)
+    gross_loss = Required(float, default=0.0)
+    PrimaryKey(user_id, account_id, strategy_id, day)
+    composite_index(user_id, day)
+
+
+class FxRate(db.Entity):
+    _table_ = "fx_rates"
+
+    currency = PrimaryKey(str, 3)
+    rate = Required(float)
+    updated_at = Required(datetime, default=datetime.utcnow)
+
+
+class Tombstone(db.Entity):
+    _table_ = "tombstones"
+
+    id = PrimaryKey(int, auto=True, size=64)
+    user_id = Required(int)
+    entity = Required(str, 16)
+    uid = Required(UUID)
+    deleted_at = Required(datetime, default=datetime.utcnow)
+    composite_index(user_id, deleted_at)
+
+
 class User(db.Entity):
     _table_ = "users"
 
@@ -105,6 +145,36 @@ class User(db.Entity):
     created_at = Required(datetime, default=datetime.utcnow)
     updated_at = Required(datetime, default=datetime.utcnow)
 
+    @staticmethod
+    @db_session
+    def get_id_by_uid(uid: Union[str, UUID]) -> OptionalType[int]:
+        key = str(uid).lower()
+        user_id = user_ids.get(key, MISSING)
+
+        if user_id is not MISSING:
+            return user_id
+
+        start = time.perf_counter()
+        user = User.get(uid=uid)
+        user_ids.record_load(time.perf_counter() - start)
+
+        if user is None:
+            user_ids.set(key, None, ttl=settings.USER_CACHE_MISS_TTL)
+            return None
+
+        user_ids.set(key, user.id)
+        return user.id
+
+    @staticmethod
+    def forget(uid: Union[str, UUID]):
+        user_ids.delete(str(uid).lower())
+
+    def after_insert(self):
+        User.forget(self.uid)
+
+    def after_delete(self):
+        User.forget(self.uid)
+
 
 if settings.DATABASE_URL:  # pragma: no cover
     db.bind(mapping=True)
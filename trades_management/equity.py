@@ -0,0 +1,91 @@
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator, Tuple
+
+import settings
+from entities import db
+
+Point = Tuple[datetime, float]
+
+
+def count_points(account_id: int) -> int:
+    return db.select("SELECT count(*) FROM trades WHERE account_id = $account_id")[0]
+
+
+def stream_points(account_id: int) -> Iterator[Point]:
+    connection = db.get_connection()
+
+    # A named cursor keeps the rows on the server and fetches them itersize at a time
+    with connection.cursor(name=f"equity_{account_id}") as cursor:
+        cursor.itersize = settings.EQUITY_CURSOR_ITERSIZE
+        cursor.execute(
+            """
+            SELECT
+                trades.created_at,
+                accounts.initial_balance + sum(coalesce(trades.profit, 0)) OVER (
+                    ORDER BY trades.created_at, trades.id
+                )
+            FROM trades
+            JOIN accounts ON accounts.id = trades.account_id
+            WHERE trades.account_id = %(account_id)s
+            ORDER BY trades.created_at, trades.id
+            """,
+            {"account_id": account_id},
+        )
+
+        for created_at, balance in cursor:
+            yield created_at, float(balance)
+
+
+def downsample(points: Iterable[Point], total: int, threshold: int) -> Iterator[Point]:
+    # Largest-Triangle-Three-Buckets, reading one bucket ahead of the one being reduced
+    if threshold >= total or threshold < 3:
+        yield from points
+        return
+
+    points = iter(points)
+    every = (total - 2) / (threshold - 2)
+    selected = next(points)
+    bucket = list(islice(points, bucket_size(0, every)))
+
+    yield selected
+
+    for index in range(1, threshold - 1):
+        if index < threshold - 2:
+            next_bucket = list(islice(points, bucket_size(index, every)))
+        else:
+            # The last bucket is whatever is left, normally just the last point
+            next_bucket = list(points)
+
+        if not bucket or not next_bucket:
+            # Fewer points than counted, as trades were removed in the meantime
+            break
+
+        average_x = sum(to_x(point) for point in next_bucket) / len(next_bucket)
+        average_y = sum(point[1] for point in next_bucket) / len(next_bucket)
+        selected = max(
+            bucket, key=lambda point: triangle_area(selected, point, average_x, average_y)
+        )
+
+        yield selected
+
+        bucket = next_bucket
+
+    if bucket:
+        yield bucket[-1]
+
+
+def bucket_size(index: int, every: float) -> int:
+    return int((index + 1) * every) - int(index * every)
+
+
+def triangle_area(first: Point, point: Point, third_x: float, third_y: float) -> float:
+    first_x = to_x(first)
+
+    return abs(
+        (first_x - third_x) * (point[1] - first[1]) - (first_x - to_x(point)) * (third_y - first[1])
+    )
+
+
+def to_x(point: Point) -> float:
+    return point[0].timestamp()
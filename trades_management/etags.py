@@ -0,0 +1,80 @@
+import hashlib
+from functools import wraps
+from typing import Optional, Tuple
+
+from serpens import api
+
+from entities import db
+from filters import to_uuid
+
+
+def fingerprint(user_id: int, tables: Tuple[str, ...], uid: Optional[str] = None) -> str:
+    # Writes bump updated_at and deletes change the count, so both are enough to detect changes
+    columns = ", ".join(
+        f"""
+        (
+            SELECT row(count(*), max(updated_at))::text
+            FROM {table}
+            WHERE user_id = $user_id AND ($uid IS NULL OR uid = CAST($uid AS uuid))
+        )
+        """
+        for table in tables
+    )
+    (state,) = db.select(f"SELECT row({columns})::text", globals={}, locals=locals())
+
+    return state
+
+
+def build(state: str, request: api.Request) -> str:
+    scope = sorted((request.path or {}).items()) + sorted((request.query or {}).items())
+    digest = hashlib.blake2b(f"{state}{scope}".encode(), digest_size=16).hexdigest()
+
+    return f'"{digest}"'
+
+
+def matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+
+        # Weak comparison, as RFC 9110 requires for If-None-Match
+        if candidate == "*" or candidate.replace("W/", "", 1) == etag:
+            return True
+
+    return False
+
+
+def get_header(request: api.Request, name: str) -> Optional[str]:
+    for key, value in (request.headers or {}).items():
+        if key.lower() == name:
+            return value
+
+    return None
+
+
+def conditional(*tables: str, by_uid: bool = False):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(request: api.Request):
+            uid = request.path.get("uuid") if by_uid else None
+
+            if by_uid and not to_uuid(uid):
+                return func(request)
+
+            etag = build(fingerprint(request.user_id, tables, uid), request)
+
+            if matches(get_header(request, "if-none-match"), etag):
+                return 304, None, {"ETag": etag}
+
+            response = func(request)
+
+            if isinstance(response, dict):
+                return 200, response, {"ETag": etag}
+
+            return response
+
+        return wrapper
+
+    return decorator
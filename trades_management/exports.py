@@ -0,0 +1,169 @@
+import csv
+import io
+import json
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Optional
+
+import boto3
+
+import encoding
+import settings
+from entities import db
+
+FIELDS = (
+    "uid",
+    "account_uid",
+    "strategy_uid",
+    "value",
+    "profit",
+    "result",
+    "result_balance",
+    "type_trade",
+    "created_at",
+)
+CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def stream_trades(user_id: int) -> Iterator[List[tuple]]:
+    connection = db.get_connection()
+
+    # A named cursor keeps the rows on the server, only one batch is held in memory
+    with connection.cursor(name=f"export_{user_id}") as cursor:
+        cursor.execute(
+            """
+            SELECT
+                trades.uid::text,
+                accounts.uid::text,
+                strategies.uid::text,
+                trades.value::float8,
+                trades.profit::float8,
+                trades.result,
+                trades.result_balance::float8,
+                trades.type_trade,
+                trades.created_at
+            FROM trades
+            JOIN accounts ON accounts.id = trades.account_id
+            JOIN strategies ON strategies.id = trades.strategy_id
+            WHERE trades.user_id = %(user_id)s
+            ORDER BY trades.id
+            """,
+            {"user_id": user_id},
+        )
+
+        while True:
+            batch = cursor.fetchmany(settings.EXPORT_BATCH_SIZE)
+
+            if not batch:
+                return
+
+            yield batch
+
+
+def ndjson_chunks(batches: Iterable[List[tuple]]) -> Iterator[str]:
+    for batch in batches:
+        yield "".join(encoding.dumps(dict(zip(FIELDS, row))) + "\n" for row in batch)
+
+
+def csv_chunks(batches: Iterable[List[tuple]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(FIELDS)
+
+    for batch in batches:
+        writer.writerows([csv_value(value) for value in row] for row in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+def csv_value(value):
+    # Same spelling the bulk import reads back
+    if isinstance(value, bool):
+        return "true" if value else "false"
+
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    return value
+
+
+FORMATS = {"ndjson": ndjson_chunks, "csv": csv_chunks}
+
+
+def write(user_id: int, export_format: str, file: BinaryIO, max_bytes: Optional[int] = None) -> int:
+    rows = 0
+
+    def counted(batches):
+        nonlocal rows
+
+        for batch in batches:
+            rows += len(batch)
+            yield batch
+
+    chunks = FORMATS[export_format](counted(stream_trades(user_id)))
+
+    for chunk in chunks:
+        file.write(chunk.encode())
+
+        # Stops reading once the file can't be sent inline, closing the server cursor
+        if max_bytes is not None and file.tell() > max_bytes:
+            chunks.close()
+            break
+
+    return rows
+
+
+def schedule(payload: dict):
+    boto3.client("lambda").invoke(
+        FunctionName=settings.EXPORT_FUNCTION_NAME,
+        InvocationType="Event",
+        Payload=json.dumps(payload).encode(),
+    )
+
+
+class LocalStore:
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+
+    def location(self, key: str) -> str:
+        return (self.directory / key).as_uri()
+
+    def put(self, key: str, file: BinaryIO, content_type: str):
+        path = self.directory / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with path.open("wb") as target:
+            shutil.copyfileobj(file, target)
+
+
+class S3Store:
+    def __init__(self, bucket: str, expires_in: int = 3600):
+        self.bucket = bucket
+        self.expires_in = expires_in
+
+    def location(self, key: str) -> str:
+        # Presigning needs no object, so the link is handed out before the file is written
+        return boto3.client("s3").generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": key},
+            ExpiresIn=self.expires_in,
+        )
+
+    def put(self, key: str, file: BinaryIO, content_type: str):
+        boto3.client("s3").upload_fileobj(
+            file, self.bucket, key, ExtraArgs={"ContentType": content_type}
+        )
+
+
+def build_store():
+    if settings.EXPORT_BUCKET:
+        return S3Store(settings.EXPORT_BUCKET, settings.EXPORT_URL_TTL)
+
+    return LocalStore(settings.EXPORT_DIRECTORY)
+
+
+store = build_store()
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from uuid import UUID
+
+DATE_LENGTH = len("YYYY-MM-DD")
+CURRENCY_LENGTH = 3
+
+
+def to_uuid(value) -> Optional[str]:
+    # Malformed uuids would abort the transaction once cast by Postgres
+    try:
+        return str(UUID(str(value)))
+    except ValueError:
+        return None
+
+
+def parse_datetime(value: Optional[str], name: str) -> Optional[datetime]:
+    if not value:
+        return None
+
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"'{name}' must be an ISO 8601 date or datetime")
+
+
+def get_date_range(query: dict) -> Tuple[Optional[datetime], Optional[datetime]]:
+    start = parse_datetime(query.get("from"), "from")
+    end = parse_datetime(query.get("to"), "to")
+
+    if end and len(query["to"]) == DATE_LENGTH:
+        # A bare date includes the whole day
+        end += timedelta(days=1)
+
+    if start and end and start >= end:
+        raise ValueError("'from' must be before 'to'")
+
+    return start, end
+
+
+def get_base_currency(query: dict) -> Optional[str]:
+    base = query.get("base")
+
+    if base is None:
+        return None
+
+    if len(base) != CURRENCY_LENGTH or not base.isalpha():
+        raise ValueError("'base' must be a 3-letter currency code")
+
+    return base.upper()
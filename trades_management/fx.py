@@ -0,0 +1,72 @@
+import time
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+import settings
+from cache import LRUCache, MISSING
+from entities import db
+
+RATES_KEY = "rates"
+
+rates_cache = LRUCache(maxsize=1, ttl=settings.FX_RATES_TTL)
+
+
+class MissingRateError(ValueError):
+    def __init__(self, currencies: Iterable[str]):
+        self.currencies = sorted(currencies)
+        super().__init__(f"Missing FX rate for {', '.join(self.currencies)}")
+
+
+def get_rates() -> Dict[str, float]:
+    rates = rates_cache.get(RATES_KEY, MISSING)
+
+    if rates is MISSING:
+        start = time.perf_counter()
+        rates = {
+            currency.upper(): float(rate)
+            for currency, rate in db.select("SELECT currency, rate FROM fx_rates")
+        }
+        rates_cache.record_load(time.perf_counter() - start)
+        rates_cache.set(RATES_KEY, rates)
+
+    return rates
+
+
+def store_rates(rates: Dict[str, float]):
+    db.execute(
+        """
+        INSERT INTO fx_rates (currency, rate, updated_at)
+        SELECT currency, rate, now() AT TIME ZONE 'utc'
+        FROM unnest($currencies::varchar[], $values::numeric[]) rates (currency, rate)
+        ON CONFLICT (currency) DO UPDATE SET rate = excluded.rate, updated_at = excluded.updated_at
+        """,
+        globals={},
+        locals={
+            "currencies": [currency.upper() for currency in rates],
+            "values": list(rates.values()),
+        },
+    )
+    rates_cache.delete(RATES_KEY)
+
+
+def get_factors(currencies: Iterable[str], base: str) -> Dict[str, float]:
+    # Multiplying an amount in a currency by its factor gives the amount in base
+    currencies = set(currencies)
+    rates = get_rates()
+    missing = {currency.upper() for currency in currencies | {base}} - rates.keys()
+
+    if missing:
+        raise MissingRateError(missing)
+
+    return {currency: rates[currency.upper()] / rates[base.upper()] for currency in currencies}
+
+
+def convert(amounts: np.ndarray, currencies: Sequence[str], base: Optional[str]) -> np.ndarray:
+    if base is None:
+        return np.asarray(amounts, dtype=np.float64)
+
+    codes, positions = np.unique(np.asarray(currencies, dtype=str), return_inverse=True)
+    factors = get_factors(codes.tolist(), base)
+
+    return amounts * np.array([factors[code] for code in codes])[positions]
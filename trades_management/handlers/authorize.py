@@ -1,4 +1,6 @@
+import hashlib
 import json
+import logging
 from typing import Optional
 from urllib.request import urlopen
 
@@ -6,35 +8,50 @@ from jose import jwt
 from serpens import initializers
 
 import authpolicy
+import cache
+import jwks
 import settings
 
 initializers.setup()
 
+logger = logging.getLogger(__name__)
+
+
+def fetch_jwks() -> dict:
+    jsonurl = urlopen(f"https://{settings.JWKS_DOMAIN}/.well-known/jwks.json")
+    return json.loads(jsonurl.read())
+
+
+key_store = jwks.KeyStore(
+    fetch_jwks,
+    ttl=settings.JWKS_CACHE_TTL,
+    refresh_interval=settings.JWKS_REFRESH_INTERVAL,
+    cache_file=settings.JWKS_CACHE_FILE,
+)
+
+decisions = cache.LRUCache(maxsize=settings.AUTH_DECISION_CACHE_SIZE)
+
 
 def handle(event, context):
     authorization = event.get("headers", {}).get("Authorization")
     token = get_oauth_token(authorization)
     method_arn = event.get("methodArn")
-    jsonurl = urlopen(f"https://{settings.JWKS_DOMAIN}/.well-known/jwks.json")
-    jwks = json.loads(jsonurl.read())
+    decision_key = get_decision_key(token, method_arn)
+    cached_policy = decisions.get(decision_key)
+
+    if cached_policy is not None:
+        logger.debug(f"Authorizer decision cache stats: {decisions.stats}")
+        return cached_policy
+
     unverified_header = jwt.get_unverified_header(token)
-    rsa_key = {}
-
-    for key in jwks["keys"]:
-        if key["kid"] == unverified_header["kid"]:
-            rsa_key = {
-                "kty": key["kty"],
-                "kid": key["kid"],
-                "use": key["use"],
-                "n": key["n"],
-                "e": key["e"],
-            }
+    public_key = key_store.get_key(unverified_header.get("kid"))
+    logger.debug(f"JWKS cache stats: {key_store.stats}")
 
-    if rsa_key:
+    if public_key is not None:
         try:
             payload = jwt.decode(
                 token,
-                rsa_key,
+                public_key,
                 algorithms=["RS256"],
                 audience=settings.API_AUDIENCE,
                 issuer=f"https://{settings.JWKS_DOMAIN}/",
@@ -58,7 +75,12 @@ def handle(event, context):
         except (ValueError, IndexError):
             raise Exception("Unauthorized")
 
-        return policy.build()
+        result = policy.build()
+
+        if "exp" in payload:
+            decisions.set(decision_key, result, expires_at=payload["exp"])
+
+        return result
 
     raise Exception("Unable to find appropriate key")
 
@@ -77,3 +99,9 @@ def get_oauth_token(authorization: Optional[str]) -> Optional[str]:
         raise Exception("Authorization header must be Bearer token")
 
     return authorization_parts[1]
+
+
+def get_decision_key(token: str, method_arn: Optional[str]) -> tuple:
+    # The built policy only depends on the API and stage part of the method ARN
+    api_scope = "/".join((method_arn or "").split("/")[:2])
+    return hashlib.sha256(token.encode()).hexdigest(), api_scope
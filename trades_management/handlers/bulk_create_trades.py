@@ -0,0 +1,65 @@
+from operator import itemgetter
+
+from serpens import api
+
+import balances
+import bulk
+import rollups
+import settings
+from entities import Account
+from helpers import writes
+
+
+@writes
+def handle(request: api.Request):
+    user_id = request.user_id
+    account_uuid = request.path.get("uuid")
+
+    try:
+        account = Account.get(uid=account_uuid, user=user_id)
+    except ValueError:
+        account = None
+
+    if not account:
+        return 404, {"message": "Account not found"}
+
+    headers = {key.lower(): value for key, value in (request.headers or {}).items()}
+    rows = bulk.read_rows(request.body, headers.get("content-type"))
+
+    if settings.BULK_MAX_ROWS:
+        rows = limit_rows(rows, settings.BULK_MAX_ROWS)
+
+    try:
+        batch = bulk.parse_trades(rows)
+    except OverflowError as error:
+        return 413, {"message": str(error)}
+
+    inserted = 0
+
+    if batch.size:
+        balances.lock_account(account.id)
+        trade_ids = bulk.copy_trades(batch, account.id, user_id)
+        balances.recompute_from(account.id, batch.earliest)
+        rollups.apply_trades(trade_ids)
+        inserted = len(trade_ids)
+
+    errors = sorted(batch.errors, key=itemgetter("line"))
+
+    result = {
+        "inserted": inserted,
+        "rejected": len(errors),
+        "errors": errors[: settings.BULK_MAX_ERRORS],
+    }
+
+    if not inserted:
+        return 400, dict(result, message="No valid trades")
+
+    return 201, result
+
+
+def limit_rows(rows, max_rows):
+    for count, row in enumerate(rows, start=1):
+        if count > max_rows:
+            raise OverflowError(f"A bulk request accepts at most {max_rows} trades")
+
+        yield row
@@ -2,17 +2,16 @@ from uuid import uuid4
 
 from serpens import api
 
-from entities import User, Broker, Account
-from helpers import authorized
+from entities import Broker, Account
+from helpers import writes
 from schemas import AccountSchema
 
 
-@authorized
+@writes
 def handle(request: api.Request):
     payload = request.body
-    user_uuid = request.authorizer.get("user_uuid")
-    user = User.get(uid=user_uuid)
-    broker = Broker.get(uid=payload.get("broker_uid"), user=user)
+    user_id = request.user_id
+    broker = Broker.get(uid=payload.get("broker_uid"), user=user_id)
 
     if not broker:
         return 400, {"message": "Invalid broker"}
@@ -29,9 +28,8 @@ def handle(request: api.Request):
         initial_balance=data.initial_balance,
         current_balance=data.current_balance,
         broker=broker,
-        user=user,
+        user=user_id,
         created_at=data.created_at,
-        updated_at=data.updated_at,
     )
 
     return 201, {"uid": str(account.uid)}
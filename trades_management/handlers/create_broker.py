@@ -2,21 +2,20 @@ from uuid import uuid4
 
 from serpens import api
 
-from entities import Broker, User
-from helpers import authorized
+from entities import Broker
+from helpers import writes
 from schemas import BrokerSchema
 
 
-@authorized
+@writes
 def handle(request: api.Request):
-    user_uuid = request.authorizer.get("user_uuid")
-    user = User.get(uid=user_uuid)
+    user_id = request.user_id
 
     try:
         data = BrokerSchema.load(request.body)
     except (TypeError, ValueError) as error:
         return 400, {"message": f"{error}"}
 
-    broker = Broker(uid=uuid4(), name=data.name, user=user)
+    broker = Broker(uid=uuid4(), name=data.name, user=user_id)
 
     return 201, {"uid": str(broker.uid)}
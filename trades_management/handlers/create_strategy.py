@@ -2,23 +2,22 @@ from uuid import uuid4
 
 from serpens import api
 
-from entities import User, Strategy
-from helpers import authorized
+from entities import Strategy
+from helpers import writes
 from schemas import StrategySchema
 
 
-@authorized
+@writes
 def handle(request: api.Request):
-    user_uuid = request.authorizer.get("user_uuid")
-    user = User.get(uid=user_uuid)
+    user_id = request.user_id
     payload = request.body
-    payload.update({"user_id": user.id})
+    payload.update({"user_id": user_id})
 
     try:
         data = StrategySchema.load(payload)
     except (ValueError, TypeError) as error:
         return 400, {"message": f"{error}"}
 
-    strategy = Strategy(uid=uuid4(), name=data.name, user=user)
+    strategy = Strategy(uid=uuid4(), name=data.name, user=user_id)
 
     return 201, {"uid": strategy.uid}
@@ -1,23 +1,27 @@
 from serpens import api
 
-from entities import User, Account
-from helpers import authorized
+import purge
+from entities import Account
+from helpers import writes
 
 
-@authorized
+@writes
 def handle(request: api.Request):
     account_uuid = request.path.get("uuid")
-    user_uuid = request.authorizer.get("user_uuid")
-    user = User.get(uid=user_uuid)
+    user_id = request.user_id
 
     try:
-        account = Account.get(user=user, uid=account_uuid)
+        account = Account.get(user=user_id, uid=account_uuid)
     except ValueError:
         account = None
 
     if account is None:
         return 400, {"message": "Invalid account"}
 
-    account.delete()
+    if request.query.get("async") == "true":
+        purge.schedule({"account_ids": [account.id]})
+        return 202, {"message": "Account deletion scheduled"}
+
+    purge.delete_accounts([account.id])
 
     return 204, None
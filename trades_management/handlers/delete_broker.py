@@ -1,27 +1,30 @@
 from serpens import api
 
-from entities import Broker, User
-from helpers import authorized
+import purge
+from entities import Broker
+from helpers import writes
 
 
-@authorized
+@writes
 def handle(request: api.Request):
-    user_uuid = request.authorizer.get("user_uuid")
+    user_id = request.user_id
     broker_uuid = request.path.get("uuid")
 
     if not broker_uuid:
         return 400, {"message": "Invalid broker"}
 
-    user = User.get(uid=user_uuid)
-
     try:
-        broker = Broker.get(uid=broker_uuid, user=user)
+        broker = Broker.get(uid=broker_uuid, user=user_id)
     except ValueError:
         broker = None
 
     if not broker:
         return 400, {"message": "Invalid broker"}
 
-    broker.delete()
+    if request.query.get("async") == "true":
+        purge.schedule({"broker_id": broker.id})
+        return 202, {"message": "Broker deletion scheduled"}
+
+    purge.delete_broker(broker.id)
 
     return 204, None
@@ -0,0 +1,37 @@
+import tempfile
+from uuid import uuid4
+
+from serpens import api
+
+import exports
+import settings
+from helpers import readonly
+
+
+@readonly
+def handle(request: api.Request):
+    export_format = request.query.get("format") or "ndjson"
+
+    if export_format not in exports.FORMATS:
+        return 400, {"message": f"'format' must be one of {', '.join(exports.FORMATS)}"}
+
+    content_type = exports.CONTENT_TYPES[export_format]
+
+    # Only the first response worth of rows is read here, larger exports are written in the
+    # background so the request stays within the API Gateway timeout
+    with tempfile.SpooledTemporaryFile(max_size=settings.EXPORT_MAX_INLINE_BYTES) as file:
+        exports.write(request.user_id, export_format, file, settings.EXPORT_MAX_INLINE_BYTES)
+
+        if file.tell() <= settings.EXPORT_MAX_INLINE_BYTES:
+            file.seek(0)
+            headers = {
+                "Content-Type": content_type,
+                "Content-Disposition": f'attachment; filename="trades.{export_format}"',
+            }
+            return 200, file.read().decode(), headers
+
+    user_uuid = request.authorizer.get("user_uuid")
+    key = f"exports/{user_uuid}/{uuid4()}.{export_format}"
+    exports.schedule({"user_id": request.user_id, "format": export_format, "key": key})
+
+    return 202, {"location": exports.store.location(key), "format": export_format}
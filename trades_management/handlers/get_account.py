@@ -1,21 +1,22 @@
 from serpens import api
 
-from entities import Account, User
-from helpers import authorized
+import etags
+import reads
+import responses
+from helpers import readonly
 
 
-@authorized
+@readonly
+@responses.cache.cached("get_account")
+@etags.conditional("accounts", by_uid=True)
 def handle(request: api.Request):
-    user_uuid = request.authorizer["user_uuid"]
-    account_uuid = request.path.get("uuid")
-    user = User.get(uid=user_uuid)
-    account = Account.get(uid=account_uuid, user=user)
+    account = reads.get_account(request.user_id, request.path.get("uuid"))
 
     if not account:
         return 404, {"message": "Account not found"}
 
     result = {
-        "broker_uuid": str(account.broker.uid),
+        "broker_uuid": account.broker_uid,
         "type_account": account.type_account,
         "currency": account.currency,
         "initial_balance": account.initial_balance,
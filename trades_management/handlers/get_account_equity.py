@@ -0,0 +1,49 @@
+from serpens import api
+
+import equity
+import settings
+from entities import Account
+from helpers import authorized
+
+
+@authorized
+def handle(request: api.Request):
+    user_id = request.user_id
+    account_uuid = request.path.get("uuid")
+
+    try:
+        account = Account.get(uid=account_uuid, user=user_id)
+    except ValueError:
+        account = None
+
+    if not account:
+        return 404, {"message": "Account not found"}
+
+    try:
+        threshold = get_threshold(request.query)
+    except ValueError as error:
+        return 400, {"message": str(error)}
+
+    total = equity.count_points(account.id)
+    points = equity.downsample(equity.stream_points(account.id), total, threshold)
+
+    return {
+        "initial_balance": account.initial_balance,
+        "total": total,
+        "points": [
+            {"created_at": created_at.isoformat(), "balance": balance}
+            for created_at, balance in points
+        ],
+    }
+
+
+def get_threshold(query: dict) -> int:
+    try:
+        threshold = int(query.get("points", settings.EQUITY_DEFAULT_POINTS))
+    except (TypeError, ValueError):
+        raise ValueError("'points' must be an integer")
+
+    if not 3 <= threshold <= settings.EQUITY_MAX_POINTS:
+        raise ValueError(f"'points' must be between 3 and {settings.EQUITY_MAX_POINTS}")
+
+    return threshold
@@ -0,0 +1,37 @@
+from serpens import api
+
+import analytics
+import filters
+import fx
+import reads
+from helpers import authorized
+
+
+@authorized
+def handle(request: api.Request):
+    user_id = request.user_id
+    account_uuid = request.path.get("uuid")
+
+    account = reads.get_account_with_risk(user_id, account_uuid)
+
+    if not account:
+        return 404, {"message": "Account not found"}
+
+    try:
+        start, end = filters.get_date_range(request.query)
+        base = filters.get_base_currency(request.query)
+        factor = fx.get_factors([account.currency], base)[account.currency] if base else 1.0
+    except ValueError as error:
+        return 400, {"message": str(error)}
+
+    trades = analytics.load_trades(account_id=account.id, start=start, end=end)
+    initial_balance = account.initial_balance
+
+    if start:
+        initial_balance = analytics.opening_balance(account.id, start)
+
+    result = analytics.metrics(trades, initial_balance, account.risk)
+    # Every other metric is a ratio, count or duration and does not depend on the currency
+    result["max_drawdown"] *= factor
+
+    return result
@@ -0,0 +1,13 @@
+from serpens import api
+
+import filters
+import portfolio
+from helpers import authorized
+
+
+@authorized
+def handle(request: api.Request):
+    try:
+        return portfolio.summary(request.user_id, filters.get_base_currency(request.query))
+    except ValueError as error:
+        return 400, {"message": str(error)}
@@ -0,0 +1,40 @@
+from serpens import api
+
+import filters
+import fx
+import stats
+from entities import Account, Strategy
+from helpers import authorized
+
+
+@authorized
+def handle(request: api.Request):
+    user_id = request.user_id
+    strategy_uuid = request.path.get("uuid")
+    account_uuid = request.query.get("account")
+    account = None
+
+    try:
+        strategy = Strategy.get(uid=strategy_uuid, user=user_id)
+    except ValueError:
+        strategy = None
+
+    if not strategy:
+        return 404, {"message": "Strategy not found"}
+
+    try:
+        start, end = filters.get_date_range(request.query)
+        base = filters.get_base_currency(request.query)
+
+        if account_uuid:
+            account = Account.get(uid=account_uuid, user=user_id)
+
+            if not account:
+                raise ValueError("Invalid account")
+    except ValueError as error:
+        return 400, {"message": str(error)}
+
+    try:
+        return stats.strategy_stats(strategy.id, account and account.id, start, end, base)
+    except fx.MissingRateError as error:
+        return 400, {"message": str(error)}
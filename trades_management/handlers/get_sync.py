@@ -0,0 +1,16 @@
+from serpens import api
+
+import sync
+from helpers import readonly
+
+
+@readonly
+def handle(request: api.Request):
+    since = request.query.get("since")
+
+    try:
+        since = sync.decode_cursor(since) if since else None
+    except ValueError as error:
+        return 400, {"message": str(error)}
+
+    return sync.changes(request.user_id, since)
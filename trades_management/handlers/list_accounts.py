@@ -1,41 +1,38 @@
 from serpens import api
 
-from entities import User, Broker, Account
-from helpers import authorized
+import etags
+import pagination
+import reads
+import responses
+from helpers import readonly
 
 ALLOWED_QUERY_PARAMS = ["broker_uid", "type_account"]
 
 
-@authorized
+@readonly
+@responses.cache.cached("list_accounts")
+@etags.conditional("brokers", "accounts")
 def handle(request: api.Request):
-    user_uuid = request.authorizer.get("user_uuid")
-    user = User.get(uid=user_uuid)
-    filters = {}
     params = request.query
-    broker_uid = params.get("broker_uid")
-    type_account = params.get("type_account")
-    filters["user"] = user
     result = {"accounts": []}
 
-    if broker_uid:
-        filters["broker"] = Broker.get(uid=broker_uid)
-
-    if type_account:
-        filters["type_account"] = type_account
-
-    filters = {key: value for key, value in filters.items() if value is not None}
-    accounts = Account.select(**filters)[:]
-
-    for account in accounts:
-        result["accounts"].append(
-            {
-                "uid": account.uid,
-                "type_account": account.type_account,
-                "currency": account.currency,
-                "initial_balance": account.initial_balance,
-                "current_balance": account.current_balance,
-                "broker": {"name": account.broker.name},
-            }
-        )
+    try:
+        page = pagination.get_page(params)
+    except ValueError as error:
+        return 400, {"message": str(error)}
+
+    accounts = reads.list_accounts(
+        request.user_id,
+        page,
+        broker_uid=params.get("broker_uid") or None,
+        type_account=params.get("type_account") or None,
+    )
+
+    if page is not None:
+        accounts, result["next"] = pagination.trim(accounts, page)
+
+    result["accounts"] = [
+        {**account.to_dict(), "broker": {"name": account.broker_name}} for account in accounts
+    ]
 
     return result
@@ -1,32 +1,38 @@
 from serpens import api
 
-from entities import Broker, User
-from helpers import authorized
+import etags
+import pagination
+import reads
+import responses
+from helpers import readonly
 
 
-@authorized
+@readonly
+@responses.cache.cached("list_brokers")
+@etags.conditional("brokers", "accounts")
 def handle(request: api.Request):
-    user_uuid = request.authorizer.get("user_uuid")
-    user = User.get(uid=user_uuid)
+    brokers = {}
+    result = {"brokers": []}
 
-    user_brokers = Broker.select(user=user)[:]
-    brokers = []
+    try:
+        page = pagination.get_page(request.query)
+    except ValueError as error:
+        return 400, {"message": str(error)}
+
+    user_brokers = reads.list_brokers(request.user_id, page)
+
+    if page is not None:
+        user_brokers, result["next"] = pagination.trim(user_brokers, page)
 
     for broker in user_brokers:
-        item = {"uid": broker.uid, "name": broker.name, "accounts": []}
-        accounts = list(broker.accounts)
-
-        for account in accounts:
-            item["accounts"].append(
-                {
-                    "uid": account.uid,
-                    "type_account": account.type_account,
-                    "currency": account.currency,
-                    "initial_balance": account.initial_balance,
-                    "current_balance": account.current_balance,
-                }
-            )
-
-        brokers.append(item)
-
-    return {"brokers": brokers}
+        brokers[broker.id] = {"uid": broker.uid, "name": broker.name, "accounts": []}
+
+    if not brokers:
+        return result
+
+    for account in reads.broker_accounts(list(brokers)):
+        brokers[account.broker_id]["accounts"].append(account.to_dict())
+
+    result["brokers"] = list(brokers.values())
+
+    return result
@@ -0,0 +1,48 @@
+from serpens import api
+
+import filters
+import fx
+import rollups
+from entities import Account, Strategy
+from helpers import authorized
+
+
+@authorized
+def handle(request: api.Request):
+    user_id = request.user_id
+    account_uuid = request.query.get("account")
+    strategy_uuid = request.query.get("strategy")
+    account = None
+    strategy = None
+
+    try:
+        start, end = filters.get_date_range(request.query)
+        base = filters.get_base_currency(request.query)
+
+        if account_uuid:
+            account = Account.get(uid=account_uuid, user=user_id)
+
+            if not account:
+                raise ValueError("Invalid account")
+
+        if strategy_uuid:
+            strategy = Strategy.get(uid=strategy_uuid, user=user_id)
+
+            if not strategy:
+                raise ValueError("Invalid strategy")
+    except ValueError as error:
+        return 400, {"message": str(error)}
+
+    try:
+        days = rollups.daily_stats(
+            user_id,
+            start,
+            end,
+            account_id=account and account.id,
+            strategy_id=strategy and strategy.id,
+            base=base,
+        )
+    except fx.MissingRateError as error:
+        return 400, {"message": str(error)}
+
+    return {"days": days}
@@ -1,22 +1,28 @@
-from entities import User, Strategy
-from helpers import authorized
 from serpens import api
 
+import etags
+import pagination
+import reads
+import responses
+from helpers import readonly
 
-@authorized
+
+@readonly
+@responses.cache.cached("list_strategies")
+@etags.conditional("strategies")
 def handle(request: api.Request):
-    user_uuid = request.authorizer.get("user_uuid")
-    user = User.get(uid=user_uuid)
-    user_strategies = []
+    result = {"strategies": []}
+
+    try:
+        page = pagination.get_page(request.query)
+    except ValueError as error:
+        return 400, {"message": str(error)}
+
+    strategies = reads.list_strategies(request.user_id, page)
 
-    strategies = Strategy.select(user=user)[:]
+    if page is not None:
+        strategies, result["next"] = pagination.trim(strategies, page)
 
-    for strategy in strategies:
-        user_strategies.append(
-            {
-                "uid": strategy.uid,
-                "name": strategy.name,
-            }
-        )
+    result["strategies"] = [strategy.to_dict() for strategy in strategies]
 
-    return {"strategies": user_strategies}
+    return result
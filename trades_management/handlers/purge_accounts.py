@@ -0,0 +1,50 @@
+import logging
+
+from pony.orm import db_session
+from serpens import initializers
+
+import purge
+import responses
+import settings
+
+initializers.setup()
+
+logger = logging.getLogger(__name__)
+
+
+def handle(event, context):
+    broker_id = event.get("broker_id")
+    account_ids = event.get("account_ids") or []
+    deleted = 0
+
+    if broker_id:
+        with db_session:
+            account_ids = purge.broker_account_ids(broker_id)
+
+    while True:
+        # Each chunk commits on its own, so locks and WAL stay small
+        with db_session:
+            chunk = purge.delete_trades_chunk(account_ids, settings.PURGE_CHUNK_SIZE)
+
+        deleted += chunk
+
+        if chunk < settings.PURGE_CHUNK_SIZE:
+            break
+
+        if context.get_remaining_time_in_millis() < settings.PURGE_TIME_MARGIN:
+            purge.schedule(event)
+            logger.info(f"Purged {deleted} trades, continuing in a new invocation")
+            return {"finished": False, "trades": deleted}
+
+    with db_session:
+        if broker_id:
+            user_ids = purge.delete_broker(broker_id)
+        else:
+            user_ids = purge.delete_accounts(account_ids)
+
+    for user_id in user_ids:
+        responses.cache.bump(user_id)
+
+    logger.info(f"Purged {deleted} trades of accounts {account_ids}")
+
+    return {"finished": True, "trades": deleted}
@@ -0,0 +1,25 @@
+import logging
+from datetime import date, timedelta
+
+from pony.orm import db_session
+from serpens import initializers
+
+import rollups
+import settings
+
+initializers.setup()
+
+logger = logging.getLogger(__name__)
+
+
+@db_session
+def handle(event, context):
+    today = date.today()
+    start = event.get("from") or (today - timedelta(days=settings.ROLLUP_REPAIR_DAYS)).isoformat()
+    end = event.get("to") or today.isoformat()
+    user_id = event.get("user_id")
+
+    rollups.rebuild(date.fromisoformat(start), date.fromisoformat(end), user_id)
+    logger.info(f"Daily trade stats rebuilt from {start} to {end} for user {user_id or 'all'}")
+
+    return {"from": start, "to": end, "user_id": user_id}
@@ -0,0 +1,51 @@
+from serpens import api
+
+import reads
+import simulation
+from entities import Strategy
+from helpers import authorized
+from schemas import SimulationSchema
+
+
+@authorized
+def handle(request: api.Request):
+    user_id = request.user_id
+    strategy_uuid = request.path.get("uuid")
+
+    try:
+        strategy = Strategy.get(uid=strategy_uuid, user=user_id)
+    except ValueError:
+        strategy = None
+
+    if not strategy:
+        return 404, {"message": "Strategy not found"}
+
+    try:
+        data = SimulationSchema.load(request.body)
+    except (KeyError, ValueError, TypeError) as error:
+        return 400, {"message": str(error)}
+
+    account = reads.get_account_with_risk(user_id, data.account_uid)
+
+    if not account:
+        return 400, {"message": "Invalid account"}
+
+    risk = account.risk
+
+    if not risk:
+        return 400, {"message": "User risk is not set"}
+
+    outcomes = simulation.load_outcomes(strategy.id)
+
+    if not len(outcomes):
+        return 400, {"message": "Strategy has no trades to simulate"}
+
+    return simulation.simulate(
+        outcomes,
+        simulation.starting_balance(account),
+        risk,
+        data.paths,
+        data.trades,
+        data.seed,
+        data.ruin,
+    )
@@ -1,39 +1,38 @@
-from datetime import datetime
-
 from serpens import api
 
-from entities import User, Account, Broker
-from helpers import authorized
+import balances
+import filters
+import updates
+from helpers import writes
 from schemas import AccountSchema
 
 
-@authorized
+@writes
 def handle(request: api.Request):
-    user_uuid = request.authorizer.get("user_uuid")
-    user = User.get(uid=user_uuid)
-    account_uuid = request.path.get("uuid")
+    user_id = request.user_id
     payload = request.body
-    broker = None
-    account = None
-
-    try:
-        broker = Broker.get(uid=payload.get("broker_id"), user=user)
-        account = Account.get(user=user, uid=account_uuid)
-    except (KeyError, ValueError, IndexError):
-        account = None
+    account_uuid = filters.to_uuid(request.path.get("uuid"))
+    broker_uuid = filters.to_uuid(payload.get("broker_id")) if isinstance(payload, dict) else None
 
-    if not account or not broker:
+    if not account_uuid or not broker_uuid:
         return 400, {"message": "Invalid broker or account"}
 
     try:
         data = AccountSchema.load(payload)
     except (TypeError, ValueError) as error:
+        if not updates.account_exists(user_id, account_uuid, broker_uuid):
+            return 400, {"message": "Invalid broker or account"}
+
         return 400, {"message": f"{error}"}
 
-    account.type_account = data.type_account
-    account.broker = broker
-    account.currency = data.currency
-    account.initial_balance = data.initial_balance
-    account.updated_at = datetime.utcnow()
+    updated = updates.update_account(user_id, account_uuid, broker_uuid, data)
+
+    if not updated:
+        return 400, {"message": "Invalid broker or account"}
+
+    account_id, previous_initial_balance = updated
+
+    if previous_initial_balance != data.initial_balance:
+        balances.rebuild(account_id)
 
     return 204, None
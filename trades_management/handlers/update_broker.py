@@ -1,30 +1,28 @@
 from serpens import api
 
-from entities import Broker, User
-from helpers import authorized
+import filters
+import updates
+from helpers import writes
 from schemas import BrokerSchema
 
 
-@authorized
+@writes
 def handle(request: api.Request):
-    payload = request.body
-    user_uuid = request.authorizer.get("user_uuid")
-    user = User.get(uid=user_uuid)
-    broker_uuid = request.path.get("uuid")
+    user_id = request.user_id
+    broker_uuid = filters.to_uuid(request.path.get("uuid"))
 
-    try:
-        broker = Broker.get(uid=broker_uuid, user=user)
-    except (ValueError, KeyError, IndexError):
-        broker = None
-
-    if not broker:
+    if not broker_uuid:
         return 404, {"message": "Broker not found"}
 
     try:
-        data = BrokerSchema.load(payload)
+        data = BrokerSchema.load(request.body)
     except (TypeError, ValueError) as error:
+        if not updates.broker_exists(user_id, broker_uuid):
+            return 404, {"message": "Broker not found"}
+
         return 400, {"message": f"{error}"}
 
-    broker.name = data.name
+    if not updates.update_broker(user_id, broker_uuid, data.name):
+        return 404, {"message": "Broker not found"}
 
     return 204, None
@@ -1,30 +1,28 @@
 from serpens import api
 
-from entities import User, Strategy
-from helpers import authorized
+import filters
+import updates
+from helpers import writes
 from schemas import StrategySchema
 
 
-@authorized
+@writes
 def handle(request: api.Request):
-    user_uuid = request.authorizer.get("user_uuid")
-    user = User.get(uid=user_uuid)
-    strategy_uuid = request.path.get("uuid")
-    payload = request.body
+    user_id = request.user_id
+    strategy_uuid = filters.to_uuid(request.path.get("uuid"))
 
-    try:
-        strategy = Strategy.get(user=user, uid=strategy_uuid)
-    except (KeyError, IndexError, ValueError):
-        strategy = None
-
-    if not strategy:
+    if not strategy_uuid:
         return 404, {"message": "Strategy not found"}
 
     try:
-        data = StrategySchema.load(payload)
+        data = StrategySchema.load(request.body)
     except (TypeError, ValueError) as error:
+        if not updates.strategy_exists(user_id, strategy_uuid):
+            return 404, {"message": "Strategy not found"}
+
         return 400, {"message": f"{error}"}
 
-    strategy.name = data.name
+    if not updates.update_strategy(user_id, strategy_uuid, data.name):
+        return 404, {"message": "Strategy not found"}
 
     return 204, None
@@ -0,0 +1,28 @@
+import logging
+import tempfile
+
+from pony.orm import db_session
+from serpens import initializers
+
+import exports
+import settings
+
+initializers.setup()
+
+logger = logging.getLogger(__name__)
+
+
+def handle(event, context):
+    user_id, export_format, key = event["user_id"], event["format"], event["key"]
+
+    with tempfile.SpooledTemporaryFile(max_size=settings.EXPORT_MAX_INLINE_BYTES) as file:
+        with db_session(strict=True):
+            rows = exports.write(user_id, export_format, file)
+
+        size = file.tell()
+        file.seek(0)
+        exports.store.put(key, file, exports.CONTENT_TYPES[export_format])
+
+    logger.info(f"Exported {rows} trades of user {user_id} to {key}")
+
+    return {"rows": rows, "size": size}
@@ -1,29 +1,71 @@
 import logging
 from functools import wraps
-from typing import Union, Tuple, Any
+from typing import Any, Callable, Optional, Tuple, Union
 
 from pony.orm import db_session
 from serpens import api
 
-from entities import User
+import encoding
+import responses
+from entities import User, user_ids
 
 logger = logging.getLogger(__name__)
 
 
-def authorized(func):
-    @wraps(func)
+def authorized(func, session=db_session, committed: Optional[Callable[[int], None]] = None):
+    # Handlers may return (status, body, headers); api.handler only knows about status and body
+    headers = {}
+    user_ids_seen = []
+
     @api.handler
-    @db_session
+    @session
     def wrapper(request: api.Request) -> Union[Tuple[int, Any], str]:
+        return encoding.encode_response(respond(request))
+
+    def respond(request: api.Request) -> Any:
         user_uuid = request.authorizer.get("user_uuid")
-        user = User.get(uid=user_uuid)
+        user_id = User.get_id_by_uid(user_uuid)
+        logger.debug(f"User identity cache stats: {user_ids.stats}")
 
-        if not user:
+        if not user_id:
             return 401, {"message": "Unauthorized"}
 
+        request.user_id = user_id
+        user_ids_seen.append(user_id)
+
         logger.debug(f"Injected authorization: {request.authorizer}")
 
         response = func(request)
+
+        if isinstance(response, tuple) and len(response) == 3:
+            status, body, extra_headers = response
+            headers.update(extra_headers)
+            return status, body
+
+        return response
+
+    @wraps(func)
+    def handler(event, context):
+        headers.clear()
+        user_ids_seen.clear()
+        response = wrapper(event, context)
+
+        if headers:
+            response["headers"] = {**response.get("headers", {}), **headers}
+
+        # Runs once the session has committed, so readers can't see the previous data afterwards
+        if committed and user_ids_seen and response["statusCode"] < 400:
+            committed(user_ids_seen[0])
+
         return response
 
-    return wrapper
+    return handler
+
+
+def writes(func):
+    return authorized(func, committed=responses.cache.bump)
+
+
+def readonly(func):
+    # Strict sessions drop every loaded object on exit instead of keeping the identity map alive
+    return authorized(func, db_session(strict=True))
@@ -0,0 +1,131 @@
+import json
+import logging
+import os
+import time
+from typing import Callable, Optional
+
+from jose import jwk
+from jose.backends.base import Key
+from jose.exceptions import JWKError
+
+ALGORITHM = "RS256"
+
+logger = logging.getLogger(__name__)
+
+
+class KeyStore:
+    def __init__(
+        self,
+        fetcher: Callable[[], dict],
+        ttl: int = 3600,
+        refresh_interval: int = 60,
+        cache_file: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.fetcher = fetcher
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval
+        self.cache_file = cache_file
+        self.clock = clock
+        self.clear()
+
+    def clear(self):
+        self.keys = {}
+        self.fetched_at = None
+        self.refreshed_at = None
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    @property
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "refreshes": self.refreshes}
+
+    def get_key(self, kid: str) -> Optional[Key]:
+        if self.fetched_at is None:
+            self.load_file()
+
+        if self.fetched_at is None or self.clock() - self.fetched_at >= self.ttl:
+            self.misses += 1
+
+            if self.fetched_at is None or self.can_refresh():
+                self.refresh()
+        else:
+            self.hits += 1
+
+        if kid not in self.keys and self.can_refresh():
+            logger.debug(f"Unknown kid {kid}, forcing JWKS refresh")
+            self.refresh()
+
+        return self.keys.get(kid)
+
+    def can_refresh(self) -> bool:
+        return (
+            self.refreshed_at is None or self.clock() - self.refreshed_at >= self.refresh_interval
+        )
+
+    def refresh(self):
+        self.refreshed_at = self.clock()
+        self.refreshes += 1
+
+        try:
+            jwks = self.fetcher()
+        except Exception as error:
+            if not self.keys:
+                raise
+
+            logger.warning(f"Unable to refresh JWKS, keeping previous key set: {error}")
+            return
+
+        self.set_keys(jwks, self.refreshed_at)
+        self.save_file(jwks)
+
+    def set_keys(self, jwks: dict, fetched_at: float):
+        keys = {}
+
+        for key in jwks["keys"]:
+            if not is_signing_key(key):
+                continue
+
+            try:
+                keys[key["kid"]] = jwk.construct(key, ALGORITHM)
+            except (JWKError, KeyError, ValueError) as error:
+                logger.warning(f"Ignoring invalid JWKS key {key.get('kid')}: {error}")
+
+        self.keys = keys
+        self.fetched_at = fetched_at
+
+    def load_file(self):
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file) as cache_file:
+                cached = json.load(cache_file)
+
+            self.set_keys(cached["jwks"], cached["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            logger.warning(f"Ignoring invalid JWKS cache file {self.cache_file}: {error}")
+
+    def save_file(self, jwks: dict):
+        if not self.cache_file:
+            return
+
+        tmp_file = f"{self.cache_file}.tmp"
+
+        try:
+            with open(tmp_file, "w") as cache_file:
+                json.dump({"jwks": jwks, "fetched_at": self.fetched_at}, cache_file)
+
+            os.replace(tmp_file, self.cache_file)
+        except OSError as error:
+            logger.warning(f"Unable to write JWKS cache file {self.cache_file}: {error}")
+
+
+def is_signing_key(key: dict) -> bool:
+    return (
+        key.get("kty") == "RSA"
+        and key.get("use") == "sig"
+        and key.get("alg", ALGORITHM) == ALGORITHM
+        and "kid" in key
+    )
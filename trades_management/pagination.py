@@ -0,0 +1,59 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+import settings
+
+
+class Page:
+    def __init__(self, limit: int, after: Optional[Tuple[datetime, int]] = None):
+        self.limit = limit
+        self.after = after
+
+
+def get_page(query: dict) -> Optional[Page]:
+    limit = query.get("limit")
+    after = query.get("after")
+
+    if limit is None and after is None and settings.LEGACY_UNPAGINATED_LISTS:
+        return None
+
+    if limit is None:
+        limit = settings.DEFAULT_PAGE_SIZE
+
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError("'limit' must be an integer")
+
+    if not 1 <= limit <= settings.MAX_PAGE_SIZE:
+        raise ValueError(f"'limit' must be between 1 and {settings.MAX_PAGE_SIZE}")
+
+    return Page(limit, decode_cursor(after) if after else None)
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    payload = json.dumps([created_at.isoformat(), item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (binascii.Error, TypeError, ValueError):
+        raise ValueError("Invalid 'after' cursor")
+
+
+def trim(items: list, page: Page) -> Tuple[list, Optional[str]]:
+    # Items are fetched with one extra row that only tells whether another page exists
+    next_cursor = None
+
+    if len(items) > page.limit:
+        items = items[: page.limit]
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+
+    return items, next_cursor
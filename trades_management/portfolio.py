@@ -0,0 +1,156 @@
+from typing import Optional
+
+import numpy as np
+
+import fx
+from entities import db
+from stats import to_float
+
+
+def summary(user_id: int, base: Optional[str] = None) -> dict:
+    result = {**balance_totals(user_id), "accounts": account_totals(user_id)}
+
+    if base:
+        result.update(convert_totals(result["brokers"], result["accounts"], base))
+
+    return result
+
+
+def balance_totals(user_id: int) -> dict:
+    # One pass over the user's brokers and accounts computes every grouping of the summary
+    rows = db.select(
+        """
+        SELECT
+            GROUPING(brokers.uid, accounts.currency, accounts.type_account),
+            brokers.uid,
+            brokers.name,
+            accounts.currency,
+            accounts.type_account,
+            count(accounts.id),
+            coalesce(sum(accounts.initial_balance), 0),
+            coalesce(sum(coalesce(accounts.current_balance, accounts.initial_balance)), 0)
+        FROM brokers
+        LEFT JOIN accounts ON accounts.broker_id = brokers.id
+        WHERE brokers.user_id = $user_id
+        GROUP BY GROUPING SETS (
+            (brokers.uid, brokers.name, accounts.currency),
+            (accounts.currency),
+            (accounts.type_account)
+        )
+        ORDER BY brokers.name, brokers.uid, accounts.currency, accounts.type_account
+        """
+    )
+    brokers = {}
+    currencies = []
+    account_types = {}
+
+    for grouping, broker_uid, name, currency, type_account, count, initial, current in rows:
+        if grouping == 1:
+            broker = brokers.setdefault(broker_uid, {"uid": str(broker_uid), "name": name})
+            broker.setdefault("currencies", [])
+
+            if count:
+                broker["currencies"].append(build_totals(currency, count, initial, current))
+        elif grouping == 5 and count:
+            currencies.append(build_totals(currency, count, initial, current))
+        elif grouping == 6 and count:
+            account_types[type_account] = count
+
+    return {
+        "currencies": currencies,
+        "account_types": account_types,
+        "brokers": list(brokers.values()),
+    }
+
+
+def account_totals(user_id: int) -> list:
+    rows = db.select(
+        """
+        SELECT
+            accounts.uid,
+            brokers.uid,
+            accounts.type_account,
+            accounts.currency,
+            accounts.initial_balance,
+            accounts.current_balance,
+            trades.count,
+            trades.profit
+        FROM accounts
+        JOIN brokers ON brokers.id = accounts.broker_id
+        LEFT JOIN LATERAL (
+            SELECT count(*), coalesce(sum(profit), 0)
+            FROM trades
+            WHERE trades.account_id = accounts.id
+        ) trades (count, profit) ON true
+        WHERE accounts.user_id = $user_id
+        ORDER BY accounts.created_at, accounts.id
+        """
+    )
+
+    return [
+        {
+            "uid": str(uid),
+            "broker_uid": str(broker_uid),
+            "type_account": type_account,
+            "currency": currency,
+            "initial_balance": to_float(initial),
+            "current_balance": to_float(current),
+            "trades": int(count),
+            "profit": float(profit),
+        }
+        for uid, broker_uid, type_account, currency, initial, current, count, profit in rows
+    ]
+
+
+def build_totals(currency: str, count: int, initial_balance, current_balance) -> dict:
+    return {
+        "currency": currency,
+        "accounts": int(count),
+        "initial_balance": float(initial_balance),
+        "current_balance": float(current_balance),
+    }
+
+
+def convert_totals(brokers: list, accounts: list, base: str) -> dict:
+    columns = ("initial_balance", "current_balance", "profit")
+    balances = np.array(
+        [
+            (
+                account["initial_balance"],
+                coalesce(account["current_balance"], account["initial_balance"]),
+                account["profit"],
+            )
+            for account in accounts
+        ],
+        dtype=np.float64,
+    ).reshape(-1, len(columns))
+    # One row per column, so every balance is converted in a single pass
+    amounts = fx.convert(balances.T, [account["currency"] for account in accounts], base)
+
+    for account, values in zip(accounts, amounts.T):
+        account["converted"] = dict(zip(columns, values.tolist()))
+
+    positions = {broker["uid"]: position for position, broker in enumerate(brokers)}
+    owners = np.array([positions[account["broker_uid"]] for account in accounts], dtype=np.intp)
+    counts = np.bincount(owners, minlength=len(brokers))
+    sums = [np.bincount(owners, weights=row, minlength=len(brokers)) for row in amounts]
+
+    for position, broker in enumerate(brokers):
+        broker["total"] = {
+            "currency": base,
+            "accounts": int(counts[position]),
+            **{column: float(row[position]) for column, row in zip(columns, sums)},
+        }
+
+    return {
+        "base": base,
+        "total": {
+            "currency": base,
+            "accounts": len(accounts),
+            **{column: float(row.sum()) for column, row in zip(columns, amounts)},
+        },
+    }
+
+
+def coalesce(value: Optional[float], default: float) -> float:
+    return default if value is None else value
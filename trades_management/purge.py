@@ -0,0 +1,65 @@
+import json
+from typing import List, Set
+
+import boto3
+
+import rollups
+import settings
+from entities import db
+
+# Tombstones tell delta sync clients which rows are gone
+BURY_DELETED = """
+    INSERT INTO tombstones (user_id, entity, uid, deleted_at)
+    SELECT user_id, '{entity}', uid, now() AT TIME ZONE 'utc' FROM deleted
+    RETURNING user_id
+"""
+
+
+def broker_account_ids(broker_id: int) -> List[int]:
+    return list(db.select("SELECT id FROM accounts WHERE broker_id = $broker_id"))
+
+
+def delete_accounts(account_ids: List[int]) -> Set[int]:
+    # Set-based deletes keep memory constant, unlike Pony's cascade that loads every trade
+    db.flush()
+    rollups.remove_accounts(account_ids)
+    db.execute("DELETE FROM trades WHERE account_id = ANY($account_ids)")
+    cursor = db.execute(
+        f"""
+        WITH deleted AS (DELETE FROM accounts WHERE id = ANY($account_ids) RETURNING user_id, uid)
+        {BURY_DELETED.format(entity="account")}
+        """
+    )
+
+    return {user_id for (user_id,) in cursor.fetchall()}
+
+
+def delete_broker(broker_id: int) -> Set[int]:
+    user_ids = delete_accounts(broker_account_ids(broker_id))
+    cursor = db.execute(
+        f"""
+        WITH deleted AS (DELETE FROM brokers WHERE id = $broker_id RETURNING user_id, uid)
+        {BURY_DELETED.format(entity="broker")}
+        """
+    )
+
+    return user_ids | {user_id for (user_id,) in cursor.fetchall()}
+
+
+def delete_trades_chunk(account_ids: List[int], size: int) -> int:
+    cursor = db.execute(
+        """
+        DELETE FROM trades
+        WHERE id IN (SELECT id FROM trades WHERE account_id = ANY($account_ids) LIMIT $size)
+        """
+    )
+
+    return cursor.rowcount
+
+
+def schedule(payload: dict):
+    boto3.client("lambda").invoke(
+        FunctionName=settings.PURGE_FUNCTION_NAME,
+        InvocationType="Event",
+        Payload=json.dumps(payload).encode(),
+    )
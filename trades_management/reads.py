@@ -0,0 +1,204 @@
+from typing import List, Optional, Tuple
+
+import pagination
+from entities import db
+from filters import to_uuid
+
+# Keyset pages follow the (user_id, created_at, id) indexes, unpaginated lists keep insertion order
+PAGE_FILTER = "AND ($after_at IS NULL OR (created_at, id) > ($after_at, $after_id))"
+
+
+class Row:
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+
+class StrategyRow(Row):
+    __slots__ = ("id", "created_at", "uid", "name")
+
+    def to_dict(self) -> dict:
+        return {"uid": self.uid, "name": self.name}
+
+
+class BrokerRow(Row):
+    __slots__ = ("id", "created_at", "uid", "name")
+
+
+class AccountRow(Row):
+    __slots__ = (
+        "id",
+        "created_at",
+        "uid",
+        "type_account",
+        "currency",
+        "initial_balance",
+        "current_balance",
+        "broker_id",
+        "broker_uid",
+        "broker_name",
+    )
+
+    def to_dict(self) -> dict:
+        return {
+            "uid": self.uid,
+            "type_account": self.type_account,
+            "currency": self.currency,
+            "initial_balance": self.initial_balance,
+            "current_balance": self.current_balance,
+        }
+
+
+class RiskAccountRow(Row):
+    __slots__ = AccountRow.__slots__ + ("risk",)
+
+
+ACCOUNT_COLUMNS = """
+    accounts.id,
+    accounts.created_at,
+    accounts.uid::text,
+    accounts.type_account,
+    accounts.currency,
+    accounts.initial_balance::float8,
+    accounts.current_balance::float8,
+    brokers.id,
+    brokers.uid::text,
+    brokers.name
+"""
+
+
+def page_params(page: Optional[pagination.Page]) -> Tuple[Optional[int], tuple]:
+    if page is None:
+        return None, (None, None)
+
+    return page.limit + 1, page.after or (None, None)
+
+
+def order_by(page: Optional[pagination.Page], table: str) -> str:
+    if page is None:
+        return f"ORDER BY {table}.id"
+
+    return f"ORDER BY {table}.created_at, {table}.id LIMIT $limit"
+
+
+def list_strategies(user_id: int, page: Optional[pagination.Page] = None) -> List[StrategyRow]:
+    limit, (after_at, after_id) = page_params(page)
+    rows = db.select(
+        f"""
+        SELECT id, created_at, uid::text, name
+        FROM strategies
+        WHERE user_id = $user_id
+            {PAGE_FILTER}
+        {order_by(page, "strategies")}
+        """,
+        globals={},
+        locals=locals(),
+    )
+
+    return [StrategyRow(*row) for row in rows]
+
+
+def list_brokers(user_id: int, page: Optional[pagination.Page] = None) -> List[BrokerRow]:
+    limit, (after_at, after_id) = page_params(page)
+    rows = db.select(
+        f"""
+        SELECT id, created_at, uid::text, name
+        FROM brokers
+        WHERE user_id = $user_id
+            {PAGE_FILTER}
+        {order_by(page, "brokers")}
+        """,
+        globals={},
+        locals=locals(),
+    )
+
+    return [BrokerRow(*row) for row in rows]
+
+
+def broker_accounts(broker_ids: List[int]) -> List[AccountRow]:
+    if not broker_ids:
+        return []
+
+    rows = db.select(
+        f"""
+        SELECT {ACCOUNT_COLUMNS}
+        FROM accounts
+        JOIN brokers ON brokers.id = accounts.broker_id
+        WHERE accounts.broker_id = ANY($broker_ids)
+        ORDER BY accounts.id
+        """
+    )
+
+    return [AccountRow(*row) for row in rows]
+
+
+def list_accounts(
+    user_id: int,
+    page: Optional[pagination.Page] = None,
+    broker_uid: Optional[str] = None,
+    type_account: Optional[str] = None,
+) -> List[AccountRow]:
+    limit, (after_at, after_id) = page_params(page)
+
+    if broker_uid is not None:
+        broker_uid = to_uuid(broker_uid)
+
+        if broker_uid is None:
+            return []
+
+    rows = db.select(
+        f"""
+        SELECT {ACCOUNT_COLUMNS}
+        FROM accounts
+        JOIN brokers ON brokers.id = accounts.broker_id
+        WHERE accounts.user_id = $user_id
+            AND ($broker_uid IS NULL OR brokers.uid = CAST($broker_uid AS uuid))
+            AND ($type_account IS NULL OR accounts.type_account = $type_account)
+            AND ($after_at IS NULL OR (accounts.created_at, accounts.id) > ($after_at, $after_id))
+        {order_by(page, "accounts")}
+        """,
+        globals={},
+        locals=locals(),
+    )
+
+    return [AccountRow(*row) for row in rows]
+
+
+def get_account(user_id: int, account_uid: str) -> Optional[AccountRow]:
+    account_uid = to_uuid(account_uid)
+
+    if account_uid is None:
+        return None
+
+    rows = db.select(
+        f"""
+        SELECT {ACCOUNT_COLUMNS}
+        FROM accounts
+        JOIN brokers ON brokers.id = accounts.broker_id
+        WHERE accounts.uid = CAST($account_uid AS uuid) AND accounts.user_id = $user_id
+        """
+    )
+
+    return AccountRow(*rows[0]) if rows else None
+
+
+def get_account_with_risk(user_id: int, account_uid: str) -> Optional[RiskAccountRow]:
+    # The user lookup is cached without the row, so risk is joined here instead of loading User
+    account_uid = to_uuid(account_uid)
+
+    if account_uid is None:
+        return None
+
+    rows = db.select(
+        f"""
+        SELECT {ACCOUNT_COLUMNS}, users.risk
+        FROM accounts
+        JOIN brokers ON brokers.id = accounts.broker_id
+        JOIN users ON users.id = accounts.user_id
+        WHERE accounts.uid = CAST($account_uid AS uuid) AND accounts.user_id = $user_id
+        """
+    )
+
+    return RiskAccountRow(*rows[0]) if rows else None
@@ -0,0 +1,260 @@
+import json
+import logging
+import socket
+import time
+from functools import wraps
+from typing import Optional
+from urllib.parse import urlencode, urlparse
+
+from serpens import api
+
+import encoding
+import etags
+import settings
+from cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+def new_version() -> int:
+    # Versions restart above every value handed out before, even when the counter was evicted
+    return time.time_ns()
+
+
+class LocalBackend:
+    # Only coherent inside one process, writes in other functions never reach it
+    def __init__(self, maxsize: int = 1024):
+        self.entries = LRUCache(maxsize=maxsize)
+        self.versions = LRUCache(maxsize=maxsize)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.entries.get(key, count=False)
+
+    def set(self, key: str, value: bytes, ttl: int):
+        self.entries.set(key, value, ttl=ttl)
+
+    def version(self, key: str) -> int:
+        version = self.versions.get(key, count=False)
+
+        if version is None:
+            version = new_version()
+            self.versions.set(key, version)
+
+        return version
+
+    def bump(self, key: str):
+        self.versions.set(key, self.version(key) + 1)
+
+    def clear(self):
+        self.entries.clear()
+        self.versions.clear()
+
+
+class RedisError(Exception):
+    pass
+
+
+class RedisBackend:
+    def __init__(self, url: str, timeout: float = 0.1):
+        parsed = urlparse(url)
+        self.address = (parsed.hostname or "localhost", parsed.port or 6379)
+        self.database = parsed.path.strip("/") or "0"
+        self.password = parsed.password
+        self.timeout = timeout
+        self.connection = None
+        self.reader = None
+
+    def connect(self):
+        self.connection = socket.create_connection(self.address, timeout=self.timeout)
+        self.reader = self.connection.makefile("rb")
+        commands = [("AUTH", self.password)] if self.password else []
+
+        if self.database != "0":
+            commands.append(("SELECT", self.database))
+
+        if commands:
+            self.send(*commands)
+
+    def close(self):
+        if self.connection:
+            self.reader.close()
+            self.connection.close()
+
+        self.connection = None
+        self.reader = None
+
+    def execute(self, *commands) -> list:
+        # Commands are pipelined, one round trip for all of them
+        if self.connection is None:
+            self.connect()
+
+        try:
+            return self.send(*commands)
+        except (OSError, RedisError):
+            self.close()
+            raise
+
+    def send(self, *commands) -> list:
+        payload = bytearray()
+
+        for command in commands:
+            payload += b"*%d\r\n" % len(command)
+
+            for argument in command:
+                if not isinstance(argument, bytes):
+                    argument = str(argument).encode()
+
+                payload += b"$%d\r\n%s\r\n" % (len(argument), argument)
+
+        self.connection.sendall(payload)
+
+        return [self.read_reply() for _ in commands]
+
+    def read_reply(self):
+        line = self.reader.readline()
+
+        if not line.endswith(b"\r\n"):
+            raise RedisError("Connection closed")
+
+        kind, value = line[:1], line[1:-2]
+
+        if kind == b"+":
+            return value.decode()
+
+        if kind == b"-":
+            raise RedisError(value.decode())
+
+        if kind == b":":
+            return int(value)
+
+        if kind == b"$":
+            length = int(value)
+            return None if length < 0 else self.reader.read(length + 2)[:-2]
+
+        if kind == b"*":
+            length = int(value)
+            return None if length < 0 else [self.read_reply() for _ in range(length)]
+
+        raise RedisError(f"Unknown reply {line!r}")
+
+    def get(self, key: str) -> Optional[bytes]:
+        (value,) = self.execute(("GET", key))
+        return value
+
+    def set(self, key: str, value: bytes, ttl: int):
+        self.execute(("SET", key, value, "EX", ttl))
+
+    def version(self, key: str) -> int:
+        _, version = self.execute(("SET", key, new_version(), "NX"), ("GET", key))
+        return int(version)
+
+    def bump(self, key: str):
+        self.execute(("SET", key, new_version(), "NX"), ("INCR", key))
+
+
+class ResponseCache:
+    def __init__(self, backend, ttl: int = 300):
+        self.backend = backend
+        self.ttl = ttl
+        self.clear_stats()
+
+    def clear_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.bytes_saved = 0
+
+    @property
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "bytes_saved": self.bytes_saved,
+        }
+
+    @staticmethod
+    def version_key(user_id: int) -> str:
+        return f"responses:{user_id}:version"
+
+    @staticmethod
+    def key(user_id: int, version: int, endpoint: str, request: api.Request) -> str:
+        params = sorted((request.path or {}).items()) + sorted((request.query or {}).items())
+
+        return f"responses:{user_id}:{version}:{endpoint}:{urlencode(params)}"
+
+    def bump(self, user_id: int):
+        if self.backend is None:
+            return
+
+        try:
+            self.backend.bump(self.version_key(user_id))
+        except (OSError, RedisError) as error:
+            self.errors += 1
+            logger.error(f"Unable to invalidate cached responses of user {user_id}: {error}")
+
+    def lookup(self, user_id: int, endpoint: str, request: api.Request):
+        # The version is read before any data, so a write committed later can't be cached under it
+        try:
+            version = self.backend.version(self.version_key(user_id))
+            key = self.key(user_id, version, endpoint, request)
+            return key, self.backend.get(key)
+        except (OSError, RedisError) as error:
+            self.errors += 1
+            logger.warning(f"Response cache unavailable: {error}")
+            return None, None
+
+    def store(self, key: str, response: tuple):
+        try:
+            self.backend.set(key, encoding.dumps(response).encode(), self.ttl)
+        except (OSError, RedisError) as error:
+            self.errors += 1
+            logger.warning(f"Response cache unavailable: {error}")
+
+    def cached(self, endpoint: str):
+        def decorator(func):
+            @wraps(func)
+            def wrapper(request: api.Request):
+                if self.backend is None:
+                    return func(request)
+
+                key, payload = self.lookup(request.user_id, endpoint, request)
+
+                if payload is not None:
+                    self.hits += 1
+                    self.bytes_saved += len(payload)
+                    status, body, headers = json.loads(payload)
+                    if_none_match = etags.get_header(request, "if-none-match")
+
+                    if "ETag" in headers and etags.matches(if_none_match, headers["ETag"]):
+                        return 304, None, headers
+
+                    return status, body, headers
+
+                self.misses += 1
+                response = func(request)
+
+                if isinstance(response, dict):
+                    response = 200, response, {}
+
+                if key and response[0] == 200:
+                    self.store(key, response)
+
+                return response
+
+            return wrapper
+
+        return decorator
+
+
+def build_backend():
+    # Every handler is a Lambda of its own, so versions must live where all of them see the writes
+    if settings.RESPONSE_CACHE_URL:
+        return RedisBackend(settings.RESPONSE_CACHE_URL, settings.RESPONSE_CACHE_TIMEOUT)
+
+    return None
+
+
+cache = ResponseCache(build_backend(), settings.RESPONSE_CACHE_TTL)
@@ -0,0 +1,172 @@
+from datetime import date, datetime
+from typing import List, Optional
+
+import fx
+from entities import db
+
+# Advisory lock namespace, the second key is the user id
+ROLLUP_LOCK = 4013
+ROLLUP_COLUMNS = """
+    user_id,
+    account_id,
+    strategy_id,
+    created_at::date,
+    count(*),
+    count(*) FILTER (WHERE result),
+    count(*) FILTER (WHERE NOT result),
+    coalesce(sum(profit), 0),
+    coalesce(sum(profit) FILTER (WHERE profit > 0), 0),
+    coalesce(-sum(profit) FILTER (WHERE profit < 0), 0)
+"""
+
+
+def apply_trades(trade_ids: List[int], sign: int = 1):
+    # Call with sign=-1 before trades are deleted or changed, and with sign=1 after they are saved
+    if not trade_ids:
+        return
+
+    db.flush()
+    lock_owners("trades", trade_ids)
+    db.execute(
+        f"""
+        INSERT INTO daily_trade_stats (
+            user_id, account_id, strategy_id, day,
+            trades, wins, losses, profit, gross_profit, gross_loss
+        )
+        SELECT
+            user_id, account_id, strategy_id, day,
+            $sign * trades, $sign * wins, $sign * losses,
+            $sign * profit, $sign * gross_profit, $sign * gross_loss
+        FROM (
+            SELECT {ROLLUP_COLUMNS}
+            FROM trades
+            WHERE id = ANY($trade_ids)
+            GROUP BY user_id, account_id, strategy_id, created_at::date
+        ) deltas (
+            user_id, account_id, strategy_id, day,
+            trades, wins, losses, profit, gross_profit, gross_loss
+        )
+        ORDER BY user_id, account_id, strategy_id, day
+        ON CONFLICT (user_id, account_id, strategy_id, day) DO UPDATE SET
+            trades = daily_trade_stats.trades + excluded.trades,
+            wins = daily_trade_stats.wins + excluded.wins,
+            losses = daily_trade_stats.losses + excluded.losses,
+            profit = daily_trade_stats.profit + excluded.profit,
+            gross_profit = daily_trade_stats.gross_profit + excluded.gross_profit,
+            gross_loss = daily_trade_stats.gross_loss + excluded.gross_loss
+        """
+    )
+
+    if sign < 0:
+        db.execute(
+            """
+            DELETE FROM daily_trade_stats
+            WHERE trades <= 0
+                AND user_id IN (SELECT user_id FROM trades WHERE id = ANY($trade_ids))
+            """
+        )
+
+
+def remove_accounts(account_ids: List[int]):
+    lock_owners("accounts", account_ids)
+    db.execute("DELETE FROM daily_trade_stats WHERE account_id = ANY($account_ids)")
+
+
+def lock_owners(table: str, ids: List[int]):
+    # Writers share their users' locks, so they only wait for a rebuild of those users
+    db.execute(
+        f"""
+        SELECT pg_advisory_xact_lock_shared({ROLLUP_LOCK}, user_id)
+        FROM (SELECT DISTINCT user_id FROM {table} WHERE id = ANY($ids) ORDER BY user_id) owners
+        """
+    )
+
+
+def rebuild(start: date, end: date, user_id: Optional[int] = None):
+    db.flush()
+
+    # Keeps trade writes from upserting deltas into the range while it is rebuilt
+    if user_id is None:
+        db.execute("LOCK TABLE daily_trade_stats IN SHARE ROW EXCLUSIVE MODE")
+    else:
+        db.execute(f"SELECT pg_advisory_xact_lock({ROLLUP_LOCK}, $user_id)")
+
+    db.execute(
+        """
+        DELETE FROM daily_trade_stats
+        WHERE day >= $start AND day <= $end AND ($user_id IS NULL OR user_id = $user_id)
+        """
+    )
+    db.execute(
+        f"""
+        INSERT INTO daily_trade_stats (
+            user_id, account_id, strategy_id, day,
+            trades, wins, losses, profit, gross_profit, gross_loss
+        )
+        SELECT {ROLLUP_COLUMNS}
+        FROM trades
+        WHERE created_at >= $start
+            AND created_at < $end + 1
+            AND ($user_id IS NULL OR user_id = $user_id)
+            AND account_id IS NOT NULL
+            AND strategy_id IS NOT NULL
+        GROUP BY user_id, account_id, strategy_id, created_at::date
+        """
+    )
+
+
+def daily_stats(
+    user_id: int,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    account_id: Optional[int] = None,
+    strategy_id: Optional[int] = None,
+    base: Optional[str] = None,
+) -> List[dict]:
+    rows = db.select(
+        """
+        SELECT
+            day,
+            accounts.currency,
+            sum(trades),
+            sum(wins),
+            sum(losses),
+            sum(profit),
+            sum(gross_profit),
+            sum(gross_loss)
+        FROM daily_trade_stats
+        JOIN accounts ON accounts.id = daily_trade_stats.account_id
+        WHERE daily_trade_stats.user_id = $user_id
+            AND ($start IS NULL OR day >= CAST($start AS date))
+            AND ($end IS NULL OR day < $end)
+            AND ($account_id IS NULL OR account_id = $account_id)
+            AND ($strategy_id IS NULL OR strategy_id = $strategy_id)
+        GROUP BY day, accounts.currency
+        ORDER BY day
+        """
+    )
+    factors = fx.get_factors({row[1] for row in rows}, base) if base else {}
+    days = {}
+
+    for day, currency, trades, wins, losses, profit, gross_profit, gross_loss in rows:
+        factor = factors.get(currency, 1.0)
+        totals = days.setdefault(
+            day,
+            {
+                "day": day.isoformat(),
+                "trades": 0,
+                "wins": 0,
+                "losses": 0,
+                "profit": 0.0,
+                "gross_profit": 0.0,
+                "gross_loss": 0.0,
+            },
+        )
+        totals["trades"] += int(trades)
+        totals["wins"] += int(wins)
+        totals["losses"] += int(losses)
+        totals["profit"] += float(profit) * factor
+        totals["gross_profit"] += float(gross_profit) * factor
+        totals["gross_loss"] += float(gross_loss) * factor
+
+    return list(days.values())
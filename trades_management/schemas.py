@@ -1,8 +1,12 @@
+import math
 from dataclasses import dataclass, field
 from datetime import datetime
+from uuid import UUID
 
 from serpens.schema import Schema
 
+import settings
+
 
 @dataclass
 class BrokerSchema(Schema):
@@ -32,3 +36,68 @@ class StrategySchema(Schema):
     name: str
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
+
+
+@dataclass
+class TradeSchema(Schema):
+    strategy_uid: str
+    value: float = None
+    profit: float = None
+    result: bool = None
+    type_trade: str = "T"
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+
+    def __post_init__(self):
+        super().__post_init__()
+
+        try:
+            UUID(str(self.strategy_uid))
+        except ValueError:
+            raise ValueError("'strategy_uid' must be a valid UUID")
+
+        for name in ("value", "profit"):
+            amount = getattr(self, name)
+
+            if amount is None:
+                continue
+
+            # Postgres numeric keeps NaN, which would spread to every balance after it
+            if not math.isfinite(amount):
+                raise ValueError(f"'{name}' must be a finite number")
+
+            # trades amounts are numeric(10, 2) columns, rounded before they are stored
+            if abs(round(amount, 2)) >= 10**8:
+                raise ValueError(f"'{name}' is out of range")
+
+        if len(self.type_trade) != 1:
+            raise ValueError("'type_trade' must be a single character")
+
+
+@dataclass
+class SimulationSchema(Schema):
+    account_uid: str
+    paths: int = settings.SIMULATION_DEFAULT_PATHS
+    trades: int = settings.SIMULATION_DEFAULT_TRADES
+    seed: int = None
+    ruin: float = settings.SIMULATION_RUIN_PERCENT
+
+    def __post_init__(self):
+        super().__post_init__()
+
+        if not 1 <= self.paths <= settings.SIMULATION_MAX_PATHS:
+            raise ValueError(f"'paths' must be between 1 and {settings.SIMULATION_MAX_PATHS}")
+
+        if not 1 <= self.trades <= settings.SIMULATION_MAX_TRADES:
+            raise ValueError(f"'trades' must be between 1 and {settings.SIMULATION_MAX_TRADES}")
+
+        if self.paths * self.trades > settings.SIMULATION_MAX_DRAWS:
+            raise ValueError(
+                f"'paths' times 'trades' must be at most {settings.SIMULATION_MAX_DRAWS}"
+            )
+
+        if self.seed is not None and not 0 <= self.seed < 2**63:
+            raise ValueError("'seed' must be a non-negative 64-bit integer")
+
+        if not 0 < self.ruin <= 100:
+            raise ValueError("'ruin' must be greater than 0 and at most 100")
@@ -1,3 +1,5 @@
+import tempfile
+
 from serpens import envvars
 
 APPNAME = "trades-management"
@@ -8,3 +10,62 @@ DATABASE_URL = envvars.get("DATABASE_URL")
 # Authorizer
 JWKS_DOMAIN = envvars.get("JWKS_DOMAIN", "http://foo.com")
 API_AUDIENCE = envvars.get("API_AUDIENCE", "http://foo.com")
+JWKS_CACHE_TTL = int(envvars.get("JWKS_CACHE_TTL", 3600))
+JWKS_REFRESH_INTERVAL = int(envvars.get("JWKS_REFRESH_INTERVAL", 60))
+JWKS_CACHE_FILE = envvars.get("JWKS_CACHE_FILE")
+AUTH_DECISION_CACHE_SIZE = int(envvars.get("AUTH_DECISION_CACHE_SIZE", 1024))
+
+# User identity cache
+USER_CACHE_SIZE = int(envvars.get("USER_CACHE_SIZE", 4096))
+USER_CACHE_TTL = int(envvars.get("USER_CACHE_TTL", 300))
+USER_CACHE_MISS_TTL = int(envvars.get("USER_CACHE_MISS_TTL", 10))
+
+# Pagination
+LEGACY_UNPAGINATED_LISTS = envvars.get("LEGACY_UNPAGINATED_LISTS", "true").lower() == "true"
+DEFAULT_PAGE_SIZE = int(envvars.get("DEFAULT_PAGE_SIZE", 50))
+MAX_PAGE_SIZE = int(envvars.get("MAX_PAGE_SIZE", 500))
+
+# Trades bulk ingest
+BULK_MAX_ROWS = int(envvars.get("BULK_MAX_ROWS", 100000))
+BULK_MAX_ERRORS = int(envvars.get("BULK_MAX_ERRORS", 1000))
+
+# Equity curve
+EQUITY_DEFAULT_POINTS = int(envvars.get("EQUITY_DEFAULT_POINTS", 500))
+EQUITY_MAX_POINTS = int(envvars.get("EQUITY_MAX_POINTS", 5000))
+EQUITY_CURSOR_ITERSIZE = int(envvars.get("EQUITY_CURSOR_ITERSIZE", 2000))
+
+# Daily trade stats
+ROLLUP_REPAIR_DAYS = int(envvars.get("ROLLUP_REPAIR_DAYS", 7))
+
+# Monte Carlo simulation
+SIMULATION_DEFAULT_PATHS = int(envvars.get("SIMULATION_DEFAULT_PATHS", 10000))
+SIMULATION_MAX_PATHS = int(envvars.get("SIMULATION_MAX_PATHS", 100000))
+SIMULATION_DEFAULT_TRADES = int(envvars.get("SIMULATION_DEFAULT_TRADES", 500))
+SIMULATION_MAX_TRADES = int(envvars.get("SIMULATION_MAX_TRADES", 5000))
+SIMULATION_MAX_DRAWS = int(envvars.get("SIMULATION_MAX_DRAWS", 20000000))
+SIMULATION_CHUNK_DRAWS = int(envvars.get("SIMULATION_CHUNK_DRAWS", 1000000))
+SIMULATION_RUIN_PERCENT = float(envvars.get("SIMULATION_RUIN_PERCENT", 50))
+
+# Currency conversion
+FX_RATES_TTL = int(envvars.get("FX_RATES_TTL", 3600))
+
+# Broker and account deletes
+PURGE_FUNCTION_NAME = envvars.get("PURGE_FUNCTION_NAME", f"{APPNAME}-purge-accounts")
+PURGE_CHUNK_SIZE = int(envvars.get("PURGE_CHUNK_SIZE", 10000))
+PURGE_TIME_MARGIN = int(envvars.get("PURGE_TIME_MARGIN", 10000))
+
+# Delta sync
+SYNC_OVERLAP = int(envvars.get("SYNC_OVERLAP", 60))
+
+# Read endpoints response cache, disabled unless a Redis URL is set
+RESPONSE_CACHE_URL = envvars.get("RESPONSE_CACHE_URL")
+RESPONSE_CACHE_TTL = int(envvars.get("RESPONSE_CACHE_TTL", 300))
+RESPONSE_CACHE_TIMEOUT = float(envvars.get("RESPONSE_CACHE_TIMEOUT", 0.1))
+
+# Trades export, larger files go to the bucket, or a local directory when none is set
+EXPORT_BATCH_SIZE = int(envvars.get("EXPORT_BATCH_SIZE", 5000))
+EXPORT_MAX_INLINE_BYTES = int(envvars.get("EXPORT_MAX_INLINE_BYTES", 4 * 1024 * 1024))
+EXPORT_BUCKET = envvars.get("EXPORT_BUCKET")
+EXPORT_DIRECTORY = envvars.get("EXPORT_DIRECTORY", f"{tempfile.gettempdir()}/trades-exports")
+EXPORT_URL_TTL = int(envvars.get("EXPORT_URL_TTL", 3600))
+EXPORT_FUNCTION_NAME = envvars.get("EXPORT_FUNCTION_NAME", f"{APPNAME}-write-export")
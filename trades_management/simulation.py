@@ -0,0 +1,183 @@
+import argparse
+import json
+import os
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pony.orm import db_session
+
+import analytics
+import settings
+from entities import Account, Strategy
+
+PERCENTILES = (5, 25, 50, 75, 95)
+HISTOGRAM_BINS = 20
+BAND_POINTS = 50
+
+
+def load_outcomes(strategy_id: int) -> np.ndarray:
+    # Each outcome is the return on the amount put into the trade
+    trades = analytics.load_trades(strategy_id=strategy_id)
+    staked = trades.value > 0
+
+    return trades.profit[staked] / trades.value[staked]
+
+
+def starting_balance(account: Account) -> float:
+    if account.current_balance is None:
+        return account.initial_balance
+
+    return account.current_balance
+
+
+def chunk_sizes(paths: int, trades: int) -> List[int]:
+    size = max(1, settings.SIMULATION_CHUNK_DRAWS // trades)
+    full, rest = divmod(paths, size)
+
+    return [size] * full + ([rest] if rest else [])
+
+
+def band_steps(trades: int) -> np.ndarray:
+    return np.unique(np.linspace(0, trades - 1, min(BAND_POINTS, trades)).round().astype(int))
+
+
+def simulate_paths(
+    outcomes: np.ndarray,
+    balance: float,
+    fraction: float,
+    floor: float,
+    paths: int,
+    trades: int,
+    seed: np.random.SeedSequence,
+    steps: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    generator = np.random.default_rng(seed)
+    draws = outcomes[generator.integers(0, len(outcomes), size=(paths, trades))]
+    equity = balance * np.cumprod(np.maximum(1.0 + fraction * draws, 0.0), axis=1)
+    ruined = np.logical_or.accumulate(equity <= floor, axis=1)
+
+    # A ruined path stops trading at the balance that crossed the floor
+    crossed = equity[np.arange(paths), ruined.argmax(axis=1)]
+    equity = np.where(ruined, crossed[:, None], equity)
+
+    return equity[:, -1], ruined[:, -1], equity[:, steps]
+
+
+def simulate(
+    outcomes: np.ndarray,
+    balance: float,
+    risk: float,
+    paths: int = settings.SIMULATION_DEFAULT_PATHS,
+    trades: int = settings.SIMULATION_DEFAULT_TRADES,
+    seed: Optional[int] = None,
+    ruin: float = settings.SIMULATION_RUIN_PERCENT,
+    processes: int = 1,
+) -> dict:
+    if seed is None:
+        seed = secrets.randbits(53)
+
+    # Chunks and their seeds only depend on the inputs, so results do not change with processes
+    sizes = chunk_sizes(paths, trades)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    steps = band_steps(trades)
+    floor = balance * (1 - ruin / 100)
+    arguments = [
+        (outcomes, balance, risk / 100, floor, size, trades, child, steps)
+        for size, child in zip(sizes, seeds)
+    ]
+
+    if processes > 1 and len(arguments) > 1:
+        with ProcessPoolExecutor(min(processes, len(arguments))) as executor:
+            results = list(executor.map(simulate_paths, *zip(*arguments)))
+    else:
+        results = [simulate_paths(*chunk) for chunk in arguments]
+
+    finals, ruined, bands = (np.concatenate(columns) for columns in zip(*results))
+
+    return summarize(finals, ruined, bands, steps, paths, trades, seed, balance, risk, ruin)
+
+
+def summarize(
+    finals: np.ndarray,
+    ruined: np.ndarray,
+    bands: np.ndarray,
+    steps: np.ndarray,
+    paths: int,
+    trades: int,
+    seed: int,
+    balance: float,
+    risk: float,
+    ruin: float,
+) -> dict:
+    counts, edges = np.histogram(finals, bins=HISTOGRAM_BINS)
+    band_percentiles = np.percentile(bands, PERCENTILES, axis=0)
+
+    return {
+        "seed": seed,
+        "paths": paths,
+        "trades": trades,
+        "initial_balance": balance,
+        "risk": risk,
+        "ruin": ruin,
+        "ruin_probability": float(ruined.mean()),
+        "final_balance": {
+            "mean": float(finals.mean()),
+            "min": float(finals.min()),
+            "max": float(finals.max()),
+            "percentiles": build_percentiles(np.percentile(finals, PERCENTILES)),
+        },
+        "histogram": {"edges": edges.tolist(), "counts": counts.tolist()},
+        "bands": [
+            {"trade": int(step) + 1, **build_percentiles(band_percentiles[:, position])}
+            for position, step in enumerate(steps)
+        ],
+    }
+
+
+def build_percentiles(values: np.ndarray) -> dict:
+    return {f"p{percentile}": float(value) for percentile, value in zip(PERCENTILES, values)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate the risk of ruin of a strategy")
+    parser.add_argument("strategy", help="strategy uuid")
+    parser.add_argument("account", help="account uuid whose balance the paths start from")
+    parser.add_argument("--paths", type=int, default=settings.SIMULATION_DEFAULT_PATHS)
+    parser.add_argument("--trades", type=int, default=settings.SIMULATION_DEFAULT_TRADES)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--ruin", type=float, default=settings.SIMULATION_RUIN_PERCENT)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    arguments = parser.parse_args()
+
+    with db_session:
+        strategy = Strategy.get(uid=arguments.strategy)
+
+        if not strategy:
+            parser.error("Strategy not found")
+
+        account = Account.get(uid=arguments.account, user=strategy.user)
+
+        if not account:
+            parser.error("Account not found")
+
+        outcomes = load_outcomes(strategy.id)
+        balance = starting_balance(account)
+        risk = strategy.user.risk
+
+    result = simulate(
+        outcomes,
+        balance,
+        risk,
+        arguments.paths,
+        arguments.trades,
+        arguments.seed,
+        arguments.ruin,
+        arguments.processes,
+    )
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+from datetime import datetime
+from typing import Optional
+
+import fx
+from entities import db
+
+COUNTS = ("trades", "wins", "losses", "counted", "counted_wins", "counted_losses")
+AMOUNTS = ("total_profit", "gross_profit", "gross_loss", "win_profit", "loss_profit")
+
+
+def strategy_stats(
+    strategy_id: int,
+    account_id: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    base: Optional[str] = None,
+) -> dict:
+    # Aggregating per account first keeps the trades scan on the covering strategy index
+    rows = db.select(
+        """
+        SELECT
+            accounts.currency,
+            sum(trades),
+            sum(wins),
+            sum(losses),
+            sum(counted),
+            sum(counted_wins),
+            sum(counted_losses),
+            sum(total_profit),
+            sum(gross_profit),
+            sum(gross_loss),
+            sum(win_profit),
+            sum(loss_profit),
+            max(largest_win),
+            min(largest_loss)
+        FROM (
+            SELECT
+                account_id,
+                count(*) AS trades,
+                count(*) FILTER (WHERE result) AS wins,
+                count(*) FILTER (WHERE NOT result) AS losses,
+                count(profit) AS counted,
+                count(profit) FILTER (WHERE result) AS counted_wins,
+                count(profit) FILTER (WHERE NOT result) AS counted_losses,
+                coalesce(sum(profit), 0) AS total_profit,
+                coalesce(sum(profit) FILTER (WHERE profit > 0), 0) AS gross_profit,
+                coalesce(-sum(profit) FILTER (WHERE profit < 0), 0) AS gross_loss,
+                coalesce(sum(profit) FILTER (WHERE result), 0) AS win_profit,
+                coalesce(sum(profit) FILTER (WHERE NOT result), 0) AS loss_profit,
+                max(profit) FILTER (WHERE result) AS largest_win,
+                min(profit) FILTER (WHERE NOT result) AS largest_loss
+            FROM trades
+            WHERE strategy_id = $strategy_id
+                AND ($account_id IS NULL OR account_id = $account_id)
+                AND ($start IS NULL OR created_at >= $start)
+                AND ($end IS NULL OR created_at < $end)
+            GROUP BY account_id
+        ) per_account
+        JOIN accounts ON accounts.id = per_account.account_id
+        GROUP BY accounts.currency
+        """
+    )
+    factors = fx.get_factors([row[0] for row in rows], base) if base else {}
+    totals = dict.fromkeys(COUNTS + AMOUNTS, 0.0)
+    largest_win = largest_loss = None
+
+    for currency, *values in rows:
+        factor = factors.get(currency, 1.0)
+        group = dict(zip(COUNTS + AMOUNTS, values))
+
+        for name in COUNTS:
+            totals[name] += int(group[name])
+
+        for name in AMOUNTS:
+            totals[name] += float(group[name]) * factor
+
+        win, loss = (to_float(value) for value in values[-2:])
+        largest_win = pick(max, largest_win, win and win * factor)
+        largest_loss = pick(min, largest_loss, loss and loss * factor)
+
+    return build_stats(totals, largest_win, largest_loss)
+
+
+def build_stats(totals: dict, largest_win: Optional[float], largest_loss: Optional[float]):
+    wins = int(totals["wins"])
+    losses = int(totals["losses"])
+    decided = wins + losses
+    win_rate = wins / decided if decided else None
+    average_win = ratio(totals["win_profit"], totals["counted_wins"]) or 0.0
+    average_loss = ratio(totals["loss_profit"], totals["counted_losses"]) or 0.0
+    gross_loss = totals["gross_loss"]
+    expectancy = None
+
+    if win_rate is not None:
+        expectancy = win_rate * average_win + (1 - win_rate) * average_loss
+
+    return {
+        "trades": int(totals["trades"]),
+        "wins": wins,
+        "losses": losses,
+        "win_rate": win_rate,
+        "total_profit": totals["total_profit"],
+        "average_profit": ratio(totals["total_profit"], totals["counted"]),
+        "profit_factor": totals["gross_profit"] / gross_loss if gross_loss else None,
+        "expectancy": expectancy,
+        "largest_win": largest_win,
+        "largest_loss": largest_loss,
+    }
+
+
+def ratio(amount: float, count: float) -> Optional[float]:
+    return amount / count if count else None
+
+
+def pick(function, current: Optional[float], value: Optional[float]) -> Optional[float]:
+    candidates = [item for item in (current, value) if item is not None]
+    return function(candidates) if candidates else None
+
+
+def to_float(value) -> Optional[float]:
+    return None if value is None else float(value)
@@ -0,0 +1,90 @@
+import base64
+import binascii
+from datetime import datetime, timedelta
+from typing import Optional
+
+import settings
+from entities import db
+
+ACCOUNT_FIELDS = (
+    "uid",
+    "broker_uid",
+    "type_account",
+    "currency",
+    "initial_balance",
+    "current_balance",
+)
+
+
+def encode_cursor(since: datetime) -> str:
+    return base64.urlsafe_b64encode(since.isoformat().encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> datetime:
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        return datetime.fromisoformat(base64.urlsafe_b64decode(cursor + padding).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid 'since' cursor")
+
+
+def next_cursor() -> str:
+    # Writes that started before this point may still commit with an older updated_at
+    return encode_cursor(datetime.utcnow() - timedelta(seconds=settings.SYNC_OVERLAP))
+
+
+def changes(user_id: int, since: Optional[datetime] = None) -> dict:
+    cursor = next_cursor()
+    brokers = db.select(
+        """
+        SELECT uid::text, name
+        FROM brokers
+        WHERE user_id = $user_id AND ($since IS NULL OR updated_at > $since)
+        ORDER BY updated_at, id
+        """
+    )
+    accounts = db.select(
+        """
+        SELECT
+            accounts.uid::text,
+            brokers.uid::text,
+            accounts.type_account,
+            accounts.currency,
+            accounts.initial_balance::float8,
+            accounts.current_balance::float8
+        FROM accounts
+        JOIN brokers ON brokers.id = accounts.broker_id
+        WHERE accounts.user_id = $user_id
+            AND ($since IS NULL OR accounts.updated_at > $since)
+        ORDER BY accounts.updated_at, accounts.id
+        """
+    )
+    strategies = db.select(
+        """
+        SELECT uid::text, name
+        FROM strategies
+        WHERE user_id = $user_id AND ($since IS NULL OR updated_at > $since)
+        ORDER BY updated_at, id
+        """
+    )
+    # A first sync has nothing to forget
+    deleted = (
+        db.select(
+            """
+            SELECT entity, uid::text
+            FROM tombstones
+            WHERE user_id = $user_id AND deleted_at > $since
+            ORDER BY deleted_at, id
+            """
+        )
+        if since
+        else []
+    )
+
+    return {
+        "brokers": [{"uid": uid, "name": name} for uid, name in brokers],
+        "accounts": [dict(zip(ACCOUNT_FIELDS, account)) for account in accounts],
+        "strategies": [{"uid": uid, "name": name} for uid, name in strategies],
+        "deleted": [{"type": entity, "uid": uid} for entity, uid in deleted],
+        "cursor": cursor,
+    }
@@ -0,0 +1,89 @@
+from typing import Optional, Tuple
+
+from entities import db
+from schemas import AccountSchema
+
+
+def update_broker(user_id: int, broker_uid: str, name: str) -> bool:
+    cursor = db.execute(
+        """
+        UPDATE brokers
+        SET name = $name, updated_at = now() AT TIME ZONE 'utc'
+        WHERE uid = CAST($broker_uid AS uuid) AND user_id = $user_id
+        """
+    )
+
+    return cursor.rowcount > 0
+
+
+def update_strategy(user_id: int, strategy_uid: str, name: str) -> bool:
+    cursor = db.execute(
+        """
+        UPDATE strategies
+        SET name = $name, updated_at = now() AT TIME ZONE 'utc'
+        WHERE uid = CAST($strategy_uid AS uuid) AND user_id = $user_id
+        """
+    )
+
+    return cursor.rowcount > 0
+
+
+def update_account(
+    user_id: int, account_uid: str, broker_uid: str, data: AccountSchema
+) -> Optional[Tuple[int, float]]:
+    # Joining the account to itself exposes the row as it was before the update
+    cursor = db.execute(
+        """
+        UPDATE accounts
+        SET type_account = $(data.type_account),
+            currency = $(data.currency),
+            initial_balance = $(data.initial_balance),
+            broker_id = brokers.id,
+            updated_at = now() AT TIME ZONE 'utc'
+        FROM brokers, accounts previous
+        WHERE accounts.uid = CAST($account_uid AS uuid)
+            AND accounts.user_id = $user_id
+            AND brokers.uid = CAST($broker_uid AS uuid)
+            AND brokers.user_id = $user_id
+            AND previous.id = accounts.id
+        RETURNING accounts.id, previous.initial_balance
+        """
+    )
+    row = cursor.fetchone()
+
+    return row and (row[0], float(row[1]))
+
+
+def broker_exists(user_id: int, broker_uid: str) -> bool:
+    return bool(
+        db.select(
+            """
+            SELECT 1 FROM brokers WHERE uid = CAST($broker_uid AS uuid) AND user_id = $user_id
+            """
+        )
+    )
+
+
+def strategy_exists(user_id: int, strategy_uid: str) -> bool:
+    return bool(
+        db.select(
+            """
+            SELECT 1 FROM strategies WHERE uid = CAST($strategy_uid AS uuid) AND user_id = $user_id
+            """
+        )
+    )
+
+
+def account_exists(user_id: int, account_uid: str, broker_uid: str) -> bool:
+    return bool(
+        db.select(
+            """
+            SELECT 1
+            FROM accounts, brokers
+            WHERE accounts.uid = CAST($account_uid AS uuid)
+                AND accounts.user_id = $user_id
+                AND brokers.uid = CAST($broker_uid AS uuid)
+                AND brokers.user_id = $user_id
+            """
+        )
+    )